@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional, List, Literal
 
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import RedirectResponse, Response
+from fastapi.responses import FileResponse, RedirectResponse, Response
 
 from app.dependencies import DbSession, CurrentUser
 from app.config import settings
@@ -130,11 +130,10 @@ async def download_archived_coa(
         presigned_url = storage.get_presigned_url(release.coa_file_path)
         return RedirectResponse(url=presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
-    content = storage.download(release.coa_file_path)
-    return Response(
-        content=content,
+    return FileResponse(
+        storage.get_local_path(release.coa_file_path),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename=\"{filename}\""},
+        filename=filename,
     )
 
 
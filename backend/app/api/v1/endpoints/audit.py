@@ -4,11 +4,12 @@ import csv
 import io
 import hashlib
 import uuid
-from datetime import datetime, date, timedelta
+from collections import Counter
+from datetime import datetime, date
 from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File, status
-from fastapi.responses import StreamingResponse, RedirectResponse, Response
+from fastapi.responses import FileResponse, StreamingResponse, RedirectResponse
 from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 
@@ -30,9 +31,13 @@ from app.schemas.audit import (
     FieldChange,
 )
 from app.services.storage_service import get_storage_service
+from app.utils.dates import date_range_bounds
 
 router = APIRouter()
 
+# Rows fetched and written per batch by the global CSV export
+CSV_EXPORT_BATCH_SIZE = 500
+
 
 def format_action_display(action: AuditAction) -> str:
     """Format action for display."""
@@ -186,12 +191,13 @@ async def list_audit_logs(
     if user_id:
         query = query.filter(AuditLog.user_id == user_id)
 
-    if date_from:
-        query = query.filter(AuditLog.timestamp >= datetime.combine(date_from, datetime.min.time()))
+    # Half-open range so the entire date_to day is included
+    start, end = date_range_bounds(date_from, date_to)
+    if start:
+        query = query.filter(AuditLog.timestamp >= start)
 
-    if date_to:
-        # Include the entire day
-        query = query.filter(AuditLog.timestamp < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    if end:
+        query = query.filter(AuditLog.timestamp < end)
 
     # Get total count
     total = query.count()
@@ -207,12 +213,18 @@ async def list_audit_logs(
 
     total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
 
+    # Annotation counts for the whole page in one grouped query
+    annotation_counts = dict(
+        db.query(AuditAnnotation.audit_log_id, func.count(AuditAnnotation.id))
+        .filter(AuditAnnotation.audit_log_id.in_([log.id for log in logs]))
+        .group_by(AuditAnnotation.audit_log_id)
+        .all()
+    ) if logs else {}
+
     # Build responses with annotation counts
     items = []
     for log in logs:
-        annotation_count = db.query(func.count(AuditAnnotation.id)).filter(
-            AuditAnnotation.audit_log_id == log.id
-        ).scalar()
+        annotation_count = annotation_counts.get(log.id, 0)
 
         items.append(AuditLogResponse(
             id=log.id,
@@ -622,21 +634,19 @@ async def download_attachment(
         presigned_url = storage.get_presigned_url(annotation.attachment_key)
         return RedirectResponse(url=presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
-    # For local storage, download and return directly
+    # For local storage, stream the file from disk
     try:
-        file_content = storage.download(annotation.attachment_key)
+        file_path = storage.get_local_path(annotation.attachment_key)
     except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Attachment file not found in storage",
         )
 
-    return Response(
-        content=file_content,
+    return FileResponse(
+        file_path,
         media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{annotation.attachment_filename}"'
-        },
+        filename=annotation.attachment_filename,
     )
 
 
@@ -645,32 +655,40 @@ async def download_attachment(
 # ============================================================================
 
 
-def _get_annotations_for_log(db, audit_log_id: int) -> tuple:
+def _get_annotation_summaries(db, audit_log_ids: List[int]) -> dict:
     """
-    Get annotation count and concatenated text for an audit log entry.
+    Get annotation count and concatenated text for many audit log entries.
+
+    Loads every annotation for the given logs in a single query.
 
     Returns:
-        Tuple of (count, concatenated_text) where concatenated_text is
-        "user1: comment1 | user2: comment2" format, or empty string if none.
+        Dict mapping audit_log_id to (count, concatenated_text), where
+        concatenated_text is "user1: comment1 | user2: comment2" format.
+        Logs without annotations are absent from the dict.
     """
+    if not audit_log_ids:
+        return {}
+
     annotations = (
         db.query(AuditAnnotation)
         .options(joinedload(AuditAnnotation.user))
-        .filter(AuditAnnotation.audit_log_id == audit_log_id)
+        .filter(AuditAnnotation.audit_log_id.in_(audit_log_ids))
         .order_by(AuditAnnotation.created_at.asc())
         .all()
     )
 
-    if not annotations:
-        return (0, "")
-
-    annotation_texts = []
+    counts: Counter = Counter()
+    texts: dict = {}
     for ann in annotations:
+        counts[ann.audit_log_id] += 1
         if ann.comment:
             username = ann.user.username if ann.user else "Unknown"
-            annotation_texts.append(f"{username}: {ann.comment}")
+            texts.setdefault(ann.audit_log_id, []).append(f"{username}: {ann.comment}")
 
-    return (len(annotations), " | ".join(annotation_texts))
+    return {
+        log_id: (count, " | ".join(texts.get(log_id, [])))
+        for log_id, count in counts.items()
+    }
 
 
 @router.get("/export/csv")
@@ -715,44 +733,57 @@ async def export_audit_csv(
             "Annotations",
         ])
 
+        annotation_summaries = _get_annotation_summaries(
+            db, [log.id for log, _ in log_tuples]
+        )
+
         # Data rows - flatten each log's changes into individual rows
+        rows = []
         for log, context_prefix in log_tuples:
             old_values = log.get_old_values_dict()
             new_values = log.get_new_values_dict()
             # Pass context_prefix=None so Field column doesn't include prefix
             # (Context column already shows the context separately)
             field_changes = build_field_changes(old_values, new_values, context_prefix=None)
-            annotation_count, annotations_text = _get_annotations_for_log(db, log.id)
+            annotation_count, annotations_text = annotation_summaries.get(log.id, (0, ""))
+
+            timestamp = log.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            username = log.user.username if log.user else "System"
+            action_display = format_action_display(log.action)
+            reason = log.reason or ""
 
             # If no field changes (e.g., bulk operation), still output one row
             if not field_changes:
-                writer.writerow([
-                    log.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                    log.user.username if log.user else "System",
-                    format_action_display(log.action),
+                rows.append([
+                    timestamp,
+                    username,
+                    action_display,
                     context_prefix or "",
                     "",  # No specific field
                     "",
                     "",
-                    log.reason or "",
+                    reason,
                     annotation_count,
                     annotations_text,
                 ])
             else:
                 # One row per field change
-                for change in field_changes:
-                    writer.writerow([
-                        log.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                        log.user.username if log.user else "System",
-                        format_action_display(log.action),
+                rows.extend(
+                    [
+                        timestamp,
+                        username,
+                        action_display,
                         context_prefix or "",
                         change.field,
                         change.display_old or "",
                         change.display_new or "",
-                        log.reason or "",
+                        reason,
                         annotation_count,
                         annotations_text,
-                    ])
+                    ]
+                    for change in field_changes
+                )
+        writer.writerows(rows)
 
         filename = f"audit_export_{table_name}_{record_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
@@ -767,12 +798,17 @@ async def export_audit_csv(
             query = query.filter(AuditLog.action == action)
         if user_id:
             query = query.filter(AuditLog.user_id == user_id)
-        if date_from:
-            query = query.filter(AuditLog.timestamp >= datetime.combine(date_from, datetime.min.time()))
-        if date_to:
-            query = query.filter(AuditLog.timestamp < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
-
-        logs = query.order_by(AuditLog.timestamp.desc()).all()
+        start, end = date_range_bounds(date_from, date_to)
+        if start:
+            query = query.filter(AuditLog.timestamp >= start)
+        if end:
+            query = query.filter(AuditLog.timestamp < end)
+
+        # Stream logs in batches so ORM rows for the whole export are never
+        # held at once (AuditLog.user is many-to-one, safe with yield_per)
+        logs = query.order_by(AuditLog.timestamp.desc()).yield_per(
+            CSV_EXPORT_BATCH_SIZE
+        )
 
         # Summary header
         writer.writerow([
@@ -788,6 +824,7 @@ async def export_audit_csv(
         ])
 
         # Data rows
+        rows = []
         for log in logs:
             changes = log.get_changes()
             changes_str = "; ".join(
@@ -796,7 +833,7 @@ async def export_audit_csv(
                 if isinstance(v, dict) and "from" in v
             ) if changes else ""
 
-            writer.writerow([
+            rows.append([
                 log.id,
                 log.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
                 log.table_name,
@@ -807,11 +844,13 @@ async def export_audit_csv(
                 log.reason or "",
                 log.ip_address or "",
             ])
+            if len(rows) >= CSV_EXPORT_BATCH_SIZE:
+                writer.writerows(rows)
+                rows.clear()
+        writer.writerows(rows)
 
         filename = f"audit_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    output.seek(0)
-
     return StreamingResponse(
         iter([output.getvalue()]),
         media_type="text/csv",
@@ -943,10 +982,11 @@ async def export_audit_pdf(
             query = query.filter(AuditLog.action == action)
         if user_id:
             query = query.filter(AuditLog.user_id == user_id)
-        if date_from:
-            query = query.filter(AuditLog.timestamp >= datetime.combine(date_from, datetime.min.time()))
-        if date_to:
-            query = query.filter(AuditLog.timestamp < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+        start, end = date_range_bounds(date_from, date_to)
+        if start:
+            query = query.filter(AuditLog.timestamp >= start)
+        if end:
+            query = query.filter(AuditLog.timestamp < end)
 
         logs = query.order_by(AuditLog.timestamp.desc()).all()
 
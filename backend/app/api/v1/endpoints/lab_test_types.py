@@ -3,10 +3,11 @@
 from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import func, insert
 
 from app.dependencies import DbSession, CurrentUser, AdminUser
 from app.models import LabTestType
+from app.models.lab_test_type import normalize_lab_test_type_field
 from app.schemas.lab_test_type import (
     LabTestTypeCreate,
     LabTestTypeUpdate,
@@ -17,6 +18,7 @@ from app.schemas.lab_test_type import (
     LabTestTypeBulkImportResult,
 )
 from app.schemas.product import ArchiveRequest
+from app.utils.cache import clear_caches_for, lab_test_type_categories_cache
 
 router = APIRouter()
 
@@ -79,12 +81,22 @@ async def list_categories(
     current_user: CurrentUser,
 ) -> list[LabTestTypeCategoryCount]:
     """Get list of categories with test type counts."""
-    categories = (
-        db.query(LabTestType.test_category, func.count(LabTestType.id))
-        .filter(LabTestType.is_active == True)
-        .group_by(LabTestType.test_category)
-        .order_by(LabTestType.test_category)
-        .all()
+
+    def _fetch_categories() -> list[tuple[str, int]]:
+        return [
+            (category, count)
+            for category, count in db.query(
+                LabTestType.test_category, func.count(LabTestType.id)
+            )
+            .filter(LabTestType.is_active == True)
+            .group_by(LabTestType.test_category)
+            .order_by(LabTestType.test_category)
+            .all()
+        ]
+
+    # Keyed by engine so separate databases never share cached counts
+    categories = lab_test_type_categories_cache.get_or_set(
+        id(db.get_bind()), _fetch_categories
     )
     return [
         LabTestTypeCategoryCount(category=c[0], count=c[1]) for c in categories
@@ -297,54 +309,48 @@ async def bulk_import_lab_test_types(
 ) -> LabTestTypeBulkImportResult:
     """Bulk import lab test types (admin only)."""
     total_rows = len(rows)
-    imported = 0
     skipped = 0
     errors = []
+    mappings = []
 
     # Get existing test names for duplicate detection
     existing_names = {
         t.test_name.lower() for t in db.query(LabTestType.test_name).all()
     }
 
+    # Validate every row up front so one bad row never aborts the batch
     for idx, row in enumerate(rows, start=1):
+        # Core inserts skip the LabTestType validators, so apply them here
         try:
-            # Validate required fields
-            if not row.test_name or not row.test_category:
-                errors.append(f"Row {idx}: Missing required fields")
-                skipped += 1
-                continue
-
-            # Check duplicates
-            if row.test_name.lower() in existing_names:
-                errors.append(f"Row {idx}: Test '{row.test_name}' already exists")
-                skipped += 1
-                continue
-
-            # Create lab test type
-            test_type = LabTestType(
-                test_name=row.test_name,
-                test_category=row.test_category,
-                default_unit=row.default_unit,
-                description=row.description,
-                test_method=row.test_method,
-                abbreviations=row.abbreviations,
-                default_specification=row.default_specification,
-                is_active=True,
-            )
-            db.add(test_type)
-            existing_names.add(row.test_name.lower())
-            imported += 1
+            values = {
+                key: normalize_lab_test_type_field(key, value)
+                for key, value in row.model_dump().items()
+            }
+        except ValueError as e:
+            errors.append(f"Row {idx}: {e}")
+            skipped += 1
+            continue
 
-        except Exception as e:
-            errors.append(f"Row {idx}: {str(e)}")
+        # Check duplicates against the catalog and earlier rows
+        test_name = values["test_name"]
+        if test_name.lower() in existing_names:
+            errors.append(f"Row {idx}: Test '{test_name}' already exists")
             skipped += 1
+            continue
+
+        mappings.append({**values, "is_active": True})
+        existing_names.add(test_name.lower())
 
-    if imported > 0:
+    # One executemany INSERT instead of hydrating and flushing an ORM object per row
+    if mappings:
+        db.execute(insert(LabTestType), mappings)
         db.commit()
+        # Core INSERT bypasses the LabTestType mapper events
+        clear_caches_for(LabTestType)
 
     return LabTestTypeBulkImportResult(
         total_rows=total_rows,
-        imported=imported,
+        imported=len(mappings),
         skipped=skipped,
         errors=errors,
     )
@@ -6,10 +6,20 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import Response
 from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only
 
 from app.dependencies import DbSession, CurrentUser, QCManagerOrAdmin
-from app.models import Lot, LotProduct, Product, Sublot, ProductTestSpecification, TestResult
+from app.models import (
+    COARelease,
+    Customer,
+    LabTestType,
+    Lot,
+    LotProduct,
+    Product,
+    ProductTestSpecification,
+    Sublot,
+    TestResult,
+)
 from app.models.enums import LotType, LotStatus, AuditAction
 from app.services.audit_service import AuditService
 from app.schemas.lot import (
@@ -30,8 +40,16 @@ from app.schemas.lot import (
     LotStatusUpdate,
 )
 from app.services.daane_coc_service import daane_coc_service
+from app.utils.cache import (
+    archived_lot_list_cache,
+    clear_on_write,
+    lot_list_cache,
+    lot_status_counts_cache,
+)
+from app.utils.dates import date_range_bounds
 
 router = APIRouter()
+audit_service = AuditService()
 
 
 def generate_reference_number(db) -> str:
@@ -58,6 +76,18 @@ def generate_reference_number(db) -> str:
     return f"{prefix}-{seq:03d}"
 
 
+# Tables whose rows feed the lot list payload (products, spec counts, results)
+_LOT_LIST_SOURCES = (Lot, LotProduct, Product, ProductTestSpecification, LabTestType, TestResult)
+
+# Cached pages are dropped on any write to a source table; the TTL bounds
+# staleness from writes in other processes
+clear_on_write(lot_list_cache, *_LOT_LIST_SOURCES)
+
+# Completed lots rarely change; pages are dropped on any write to a source
+# table and otherwise expire after the TTL
+clear_on_write(archived_lot_list_cache, Lot, LotProduct, Product, COARelease, Customer)
+
+
 @router.get("", response_model=LotListResponse)
 async def list_lots(
     db: DbSession,
@@ -66,17 +96,62 @@ async def list_lots(
     page_size: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
     status_filter: Optional[LotStatus] = Query(None, alias="status"),
+    statuses: Optional[List[LotStatus]] = Query(None, alias="statuses"),
     exclude_statuses: Optional[List[LotStatus]] = Query(None, alias="exclude_statuses"),
     lot_type: Optional[LotType] = None,
 ) -> LotListResponse:
     """List all lots with pagination, filtering, and product info."""
-    # Eager load products, test specs (with lab test types), and test results to avoid N+1 queries
+    cache_key = (
+        id(db.get_bind()),
+        page,
+        page_size,
+        search,
+        status_filter,
+        tuple(sorted(statuses or [])),
+        tuple(sorted(exclude_statuses or [])),
+        lot_type,
+    )
+    return lot_list_cache.get_or_set(
+        cache_key,
+        lambda: _build_lot_list(
+            db, page, page_size, search, status_filter, statuses, exclude_statuses, lot_type
+        ),
+    )
+
+
+def _build_lot_list(
+    db,
+    page: int,
+    page_size: int,
+    search: Optional[str],
+    status_filter: Optional[LotStatus],
+    statuses: Optional[List[LotStatus]],
+    exclude_statuses: Optional[List[LotStatus]],
+    lot_type: Optional[LotType],
+) -> LotListResponse:
+    """Query and assemble one page of the lot list."""
+    # Eager load products, test specs (with lab test types), and test results to avoid N+1 queries.
+    # Products and results only feed the summary/counts, so skip their wide columns.
     query = db.query(Lot).options(
         joinedload(Lot.lot_products)
         .joinedload(LotProduct.product)
-        .joinedload(Product.test_specifications)
-        .joinedload(ProductTestSpecification.lab_test_type),
-        joinedload(Lot.test_results),
+        .options(
+            load_only(
+                Product.id,
+                Product.brand,
+                Product.product_name,
+                Product.flavor,
+                Product.size,
+            ),
+            joinedload(Product.test_specifications)
+            .joinedload(ProductTestSpecification.lab_test_type),
+        ),
+        joinedload(Lot.test_results).load_only(
+            TestResult.id,
+            TestResult.lot_id,
+            TestResult.test_type,
+            TestResult.result_value,
+        ),
     )
 
     # Apply filters
@@ -90,6 +165,10 @@ async def list_lots(
     if status_filter:
         query = query.filter(Lot.status == status_filter)
 
+    # Positive IN list can use idx_lot_status_created; prefer it over exclude_statuses
+    if statuses:
+        query = query.filter(Lot.status.in_(statuses))
+
     if exclude_statuses:
         query = query.filter(Lot.status.notin_(exclude_statuses))
 
@@ -106,6 +185,8 @@ async def list_lots(
         )
     if status_filter:
         count_query = count_query.filter(Lot.status == status_filter)
+    if statuses:
+        count_query = count_query.filter(Lot.status.in_(statuses))
     if exclude_statuses:
         count_query = count_query.filter(Lot.status.notin_(exclude_statuses))
     if lot_type:
@@ -189,12 +270,17 @@ async def get_status_counts(
     current_user: CurrentUser,
 ) -> dict:
     """Get count of lots by status."""
-    counts = (
-        db.query(Lot.status, func.count(Lot.id))
-        .group_by(Lot.status)
-        .all()
-    )
-    return {status.value: count for status, count in counts}
+
+    def _fetch_counts() -> dict:
+        counts = (
+            db.query(Lot.status, func.count(Lot.id))
+            .group_by(Lot.status)
+            .all()
+        )
+        return {status.value: count for status, count in counts}
+
+    # Keyed by engine so separate databases never share cached counts
+    return dict(lot_status_counts_cache.get_or_set(id(db.get_bind()), _fetch_counts))
 
 
 @router.get("/archived")
@@ -214,17 +300,66 @@ async def list_archived_lots(
     Returns lots with status RELEASED or REJECTED, including product info
     and customer data where applicable.
     """
-    from app.models.coa_release import COARelease
-    from app.models.customer import Customer
+    # Repeat views of the same filters and date range are served from cache
+    cache_key = (
+        "archived",
+        id(db.get_bind()),
+        page,
+        page_size,
+        search,
+        status_filter,
+        date_from,
+        date_to,
+    )
+    return archived_lot_list_cache.get_or_set(
+        cache_key,
+        lambda: _build_archived_lot_list(
+            db, page, page_size, search, status_filter, date_from, date_to
+        ),
+    )
+
 
+def _build_archived_lot_list(
+    db,
+    page: int,
+    page_size: int,
+    search: Optional[str],
+    status_filter: Optional[str],
+    date_from: Optional[date],
+    date_to: Optional[date],
+) -> dict:
+    """Query and build one page of the archived lot list."""
     # Base query for completed lots (RELEASED or REJECTED)
     completed_statuses = [LotStatus.RELEASED, LotStatus.REJECTED]
 
+    # Only hydrate the columns rendered in the archive table
     query = (
         db.query(Lot)
         .options(
-            joinedload(Lot.lot_products).joinedload(LotProduct.product),
-            joinedload(Lot.coa_releases).joinedload(COARelease.customer),
+            load_only(
+                Lot.id,
+                Lot.reference_number,
+                Lot.lot_number,
+                Lot.status,
+                Lot.rejection_reason,
+                Lot.created_at,
+                Lot.updated_at,
+            ),
+            joinedload(Lot.lot_products)
+            .joinedload(LotProduct.product)
+            .load_only(
+                Product.id,
+                Product.product_name,
+                Product.brand,
+                Product.flavor,
+                Product.size,
+            ),
+            joinedload(Lot.coa_releases).load_only(
+                COARelease.id, COARelease.customer_id
+            ),
+            joinedload(Lot.coa_releases)
+            .joinedload(COARelease.customer)
+            .load_only(Customer.id, Customer.company_name),
         )
         .filter(Lot.status.in_(completed_statuses))
     )
@@ -244,11 +379,13 @@ async def list_archived_lots(
         elif status_filter.lower() == "rejected":
             query = query.filter(Lot.status == LotStatus.REJECTED)
 
-    # Apply date filters on updated_at (completion date)
-    if date_from:
-        query = query.filter(Lot.updated_at >= date_from)
-    if date_to:
-        query = query.filter(Lot.updated_at <= date_to)
+    # Apply date filters on updated_at (completion date) as a half-open
+    # range so the whole date_to day is included
+    date_from_dt, date_to_exclusive = date_range_bounds(date_from, date_to)
+    if date_from_dt:
+        query = query.filter(Lot.updated_at >= date_from_dt)
+    if date_to_exclusive:
+        query = query.filter(Lot.updated_at < date_to_exclusive)
 
     # Get total count
     count_query = db.query(func.count(Lot.id)).filter(Lot.status.in_(completed_statuses))
@@ -263,20 +400,23 @@ async def list_archived_lots(
             count_query = count_query.filter(Lot.status == LotStatus.RELEASED)
         elif status_filter.lower() == "rejected":
             count_query = count_query.filter(Lot.status == LotStatus.REJECTED)
-    if date_from:
-        count_query = count_query.filter(Lot.updated_at >= date_from)
-    if date_to:
-        count_query = count_query.filter(Lot.updated_at <= date_to)
+    if date_from_dt:
+        count_query = count_query.filter(Lot.updated_at >= date_from_dt)
+    if date_to_exclusive:
+        count_query = count_query.filter(Lot.updated_at < date_to_exclusive)
     total = count_query.scalar()
 
     # Apply pagination
     offset = (page - 1) * page_size
-    lots = (
-        query.order_by(Lot.updated_at.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
+    # Skip the eager-loaded page query when the count already says it is empty
+    lots = []
+    if offset < total:
+        lots = (
+            query.order_by(Lot.updated_at.desc())
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
     total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
 
@@ -325,7 +465,14 @@ async def get_lot(
     current_user: CurrentUser,
 ) -> LotWithProductsResponse:
     """Get a lot by ID with associated products."""
-    lot = db.query(Lot).filter(Lot.id == lot_id).first()
+    # Products are read twice (model_validate via Lot.products, then the
+    # explicit list below), so load them with the lot in one round trip
+    lot = (
+        db.query(Lot)
+        .options(joinedload(Lot.lot_products).joinedload(LotProduct.product))
+        .filter(Lot.id == lot_id)
+        .first()
+    )
     if not lot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -637,7 +784,6 @@ async def update_lot(
 
     # Log to audit trail if there are actual changes
     if old_values != new_values:
-        audit_service = AuditService()
         audit_service.log_action(
             db=db,
             table_name="lots",
@@ -682,7 +828,6 @@ async def submit_for_review(
     db.flush()
 
     # Log status change
-    audit_service = AuditService()
     reason = "Submitted for QC release"
     if override_user_id:
         reason = "Submitted for review without required PDF attachment (admin/QC override)"
@@ -747,7 +892,6 @@ async def resubmit_lot(
     db.flush()
 
     # Log the resubmission
-    audit_service = AuditService()
     audit_service.log_action(
         db=db,
         table_name="lots",
@@ -830,7 +974,6 @@ async def update_lot_status(
         reason = f"Status changed to {status_update.status.value}"
 
     # Log the status change
-    audit_service = AuditService()
     audit_service.log_action(
         db=db,
         table_name="lots",
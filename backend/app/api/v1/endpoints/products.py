@@ -3,9 +3,14 @@
 from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import func, insert
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.dependencies import DbSession, CurrentUser, AdminUser
 from app.models import Product, ProductTestSpecification, LabTestType, ProductSize
+from app.models.product import normalize_product_field
+from app.services.product_service import ProductService
+from app.utils.cache import clear_caches_for, clear_on_write, product_list_cache
 from app.schemas.product import (
     ProductCreate,
     ProductUpdate,
@@ -25,10 +30,15 @@ from app.schemas.product import (
 )
 
 router = APIRouter()
+product_service = ProductService()
 
 
-def build_product_response(product: Product) -> ProductResponse:
-    """Build ProductResponse with sizes from a Product model."""
+def build_product_response(
+    product: Product, spec_counts: Optional[tuple] = None
+) -> ProductResponse:
+    """Build ProductResponse with sizes (and optional spec counts) from a Product model."""
+    # Counts stay None unless the caller looked them up
+    required_count, optional_count = spec_counts or (None, None)
     return ProductResponse(
         id=product.id,
         brand=product.brand,
@@ -46,9 +56,19 @@ def build_product_response(product: Product) -> ProductResponse:
         archive_reason=product.archive_reason,
         created_at=product.created_at,
         updated_at=product.updated_at,
+        required_test_count=required_count,
+        optional_test_count=optional_count,
     )
 
 
+# Tables whose rows feed the product list payload (products, sizes, spec counts)
+_PRODUCT_LIST_SOURCES = (Product, ProductSize, ProductTestSpecification)
+
+# Cached pages are dropped on any write to a source table; the TTL bounds
+# staleness from writes in other processes
+clear_on_write(product_list_cache, *_PRODUCT_LIST_SOURCES)
+
+
 @router.get("", response_model=ProductListResponse)
 async def list_products(
     db: DbSession,
@@ -60,7 +80,30 @@ async def list_products(
     include_archived: bool = Query(False, description="Include archived products"),
 ) -> ProductListResponse:
     """List all products with pagination and filtering."""
-    query = db.query(Product)
+    cache_key = (
+        id(db.get_bind()),
+        page,
+        page_size,
+        search,
+        brand,
+        include_archived,
+    )
+    return product_list_cache.get_or_set(
+        cache_key,
+        lambda: _build_product_list(db, page, page_size, search, brand, include_archived),
+    )
+
+
+def _build_product_list(
+    db,
+    page: int,
+    page_size: int,
+    search: Optional[str],
+    brand: Optional[str],
+    include_archived: bool,
+) -> ProductListResponse:
+    """Query and build one page of the product list."""
+    query = db.query(Product).options(selectinload(Product.sizes))
 
     # Filter out archived products by default
     if not include_archived:
@@ -95,8 +138,11 @@ async def list_products(
 
     total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
 
+    # Spec counts come from one grouped query instead of loading each product's specs
+    spec_counts = product_service.get_spec_counts(db, [p.id for p in products])
+
     return ProductListResponse(
-        items=[build_product_response(p) for p in products],
+        items=[build_product_response(p, spec_counts.get(p.id, (0, 0))) for p in products],
         total=total,
         page=page,
         page_size=page_size,
@@ -126,7 +172,17 @@ async def get_product(
     current_user: CurrentUser,
 ) -> ProductWithSpecsResponse:
     """Get a product by ID with test specifications."""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = (
+        db.query(Product)
+        .options(
+            selectinload(Product.sizes),
+            selectinload(Product.test_specifications).joinedload(
+                ProductTestSpecification.lab_test_type
+            ),
+        )
+        .filter(Product.id == product_id)
+        .first()
+    )
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -310,7 +366,11 @@ async def list_archived_products(
     search: Optional[str] = None,
 ) -> ProductListResponse:
     """List archived products (admin only)."""
-    query = db.query(Product).filter(Product.is_active == False)
+    query = (
+        db.query(Product)
+        .options(selectinload(Product.sizes))
+        .filter(Product.is_active == False)
+    )
 
     # Apply search filter - split search into keywords and match ALL keywords (AND logic)
     if search:
@@ -490,19 +550,20 @@ async def list_product_test_specs(
     current_user: CurrentUser,
 ) -> list[TestSpecificationResponse]:
     """List all test specifications for a product."""
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
-
     specs = (
         db.query(ProductTestSpecification)
+        .options(joinedload(ProductTestSpecification.lab_test_type))
         .filter(ProductTestSpecification.product_id == product_id)
         .all()
     )
 
+    # Specs imply the product exists; only an empty result needs the check
+    if not specs and not db.query(Product.id).filter(Product.id == product_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found",
+        )
+
     return [
         TestSpecificationResponse(
             id=spec.id,
@@ -657,55 +718,59 @@ async def bulk_import_products(
 ) -> ProductBulkImportResult:
     """Bulk import products (admin only)."""
     total_rows = len(rows)
-    imported = 0
     skipped = 0
     errors = []
+    mappings = []
 
-    # Get existing display names for duplicate detection
-    existing_display_names = {
-        p.display_name.lower() for p in db.query(Product.display_name).all()
+    # Get existing display names for duplicate detection, limited to the
+    # names in this upload rather than the whole catalog
+    incoming_names = {
+        row.display_name.strip().lower() for row in rows if row.display_name
     }
+    existing_display_names = (
+        {
+            name.lower()
+            for (name,) in db.query(Product.display_name).filter(
+                func.lower(Product.display_name).in_(incoming_names)
+            )
+        }
+        if incoming_names
+        else set()
+    )
 
+    # Validate every row up front so one bad row never aborts the batch
     for idx, row in enumerate(rows, start=1):
+        # Core inserts skip the Product validators, so apply them here
         try:
-            # Validate required fields
-            if not row.brand or not row.product_name or not row.display_name:
-                errors.append(f"Row {idx}: Missing required fields")
-                skipped += 1
-                continue
-
-            # Check duplicates
-            if row.display_name.lower() in existing_display_names:
-                errors.append(
-                    f"Row {idx}: Product '{row.display_name}' already exists"
-                )
-                skipped += 1
-                continue
-
-            # Create product
-            product = Product(
-                brand=row.brand,
-                product_name=row.product_name,
-                flavor=row.flavor,
-                size=row.size,
-                display_name=row.display_name,
-                serving_size=row.serving_size,
-                expiry_duration_months=row.expiry_duration_months,
-            )
-            db.add(product)
-            existing_display_names.add(row.display_name.lower())
-            imported += 1
+            values = {
+                key: normalize_product_field(key, value)
+                for key, value in row.model_dump().items()
+            }
+        except ValueError as e:
+            errors.append(f"Row {idx}: {e}")
+            skipped += 1
+            continue
 
-        except Exception as e:
-            errors.append(f"Row {idx}: {str(e)}")
+        # Check duplicates against the catalog and earlier rows
+        display_name = values["display_name"]
+        if display_name.lower() in existing_display_names:
+            errors.append(f"Row {idx}: Product '{display_name}' already exists")
             skipped += 1
+            continue
+
+        mappings.append(values)
+        existing_display_names.add(display_name.lower())
 
-    if imported > 0:
+    # One executemany INSERT instead of hydrating and flushing an ORM object per row
+    if mappings:
+        db.execute(insert(Product), mappings)
         db.commit()
+        # Core INSERT bypasses the Product mapper events
+        clear_caches_for(Product)
 
     return ProductBulkImportResult(
         total_rows=total_rows,
-        imported=imported,
+        imported=len(mappings),
         skipped=skipped,
         errors=errors,
     )
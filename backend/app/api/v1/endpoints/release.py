@@ -3,7 +3,7 @@
 from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response
 from sqlalchemy.orm import joinedload
 
 from app.dependencies import DbSession, CurrentUser, QCManagerOrAdmin
@@ -75,12 +75,12 @@ def _get_pdf_from_storage(
         presigned_url = storage.get_presigned_url(storage_key)
         return RedirectResponse(url=presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
-    content = storage.download(storage_key)
-    disposition = "inline" if inline else "attachment"
-    return Response(
-        content=content,
+    # Stream from disk rather than reading the whole PDF into memory
+    return FileResponse(
+        storage.get_local_path(storage_key),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"{disposition}; filename=\"{response_filename}\""},
+        filename=response_filename,
+        content_disposition_type="inline" if inline else "attachment",
     )
 
 
@@ -24,6 +24,8 @@ from app.schemas.test_result import (
 )
 
 router = APIRouter()
+audit_service = AuditService()
+lot_service = LotService()
 
 
 @router.get("", response_model=TestResultListResponse)
@@ -147,7 +149,6 @@ async def create_test_result(
     db.flush()  # Get the ID before commit
 
     # Log to audit trail
-    audit_service = AuditService()
     new_values = {
         "test_type": result.test_type,
         "result_value": result.result_value,
@@ -171,7 +172,6 @@ async def create_test_result(
     db.refresh(result)
 
     # Auto-recalculate lot status
-    lot_service = LotService()
     lot_service.recalculate_lot_status(db, result_in.lot_id, user_id=current_user.id)
 
     return TestResultResponse.model_validate(result)
@@ -210,9 +210,9 @@ async def bulk_create_test_results(
         created_results.append(result)
 
     db.flush()  # Get IDs before commit
+    created_ids = [result.id for result in created_results]
 
     # Log to audit trail for each created result
-    audit_service = AuditService()
     for result in created_results:
         new_values = {
             "test_type": result.test_type,
@@ -234,11 +234,11 @@ async def bulk_create_test_results(
         )
 
     db.commit()
-    for result in created_results:
-        db.refresh(result)
+    # Reload all created rows in one SELECT instead of a refresh per row
+    if created_ids:
+        db.query(TestResult).filter(TestResult.id.in_(created_ids)).all()
 
     # Auto-recalculate lot status
-    lot_service = LotService()
     lot_service.recalculate_lot_status(db, bulk_in.lot_id, user_id=current_user.id)
 
     return [TestResultResponse.model_validate(r) for r in created_results]
@@ -320,7 +320,6 @@ async def update_test_result(
             }
             audit_reason = f"Retest result entry ({retest_ref}): {result.test_type}"
 
-        audit_service = AuditService()
         audit_service.log_action(
             db=db,
             table_name="test_results",
@@ -341,7 +340,6 @@ async def update_test_result(
 
     # Auto-recalculate lot status based on test results completion
     if result.lot_id:
-        lot_service = LotService()
         lot_service.recalculate_lot_status(db, result.lot_id, user_id=current_user.id)
 
     return TestResultResponse.model_validate(result)
@@ -387,7 +385,6 @@ async def update_test_result_status(
     db.flush()
 
     # Log the approval/rejection
-    audit_service = AuditService()
     audit_service.log_action(
         db=db,
         table_name="test_results",
@@ -429,7 +426,6 @@ async def bulk_approve_test_results(
             detail="One or more test results not found",
         )
 
-    audit_service = AuditService()
     action_type = AuditAction.APPROVE if bulk_approval.status == TestResultStatus.APPROVED else AuditAction.UPDATE
 
     for result in results:
@@ -468,8 +464,8 @@ async def bulk_approve_test_results(
         )
 
     db.commit()
-    for result in results:
-        db.refresh(result)
+    # Reload all approved rows in one SELECT instead of a refresh per row
+    db.query(TestResult).filter(TestResult.id.in_(bulk_approval.result_ids)).all()
 
     return [TestResultResponse.model_validate(r) for r in results]
 
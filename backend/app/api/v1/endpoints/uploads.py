@@ -123,19 +123,15 @@ async def get_upload(
         presigned_url = storage.get_presigned_url(storage_key)
         return RedirectResponse(url=presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
-    # For local storage, serve the file directly
-    content = storage.download(storage_key)
-
     # Get just the filename for the response
     actual_filename = storage_key.split("/")[-1]
 
-    # For local storage, we need to return the file
-    # Create a temp response with the content
-    from fastapi.responses import Response
-    return Response(
-        content=content,
+    # For local storage, stream the file from disk
+    return FileResponse(
+        storage.get_local_path(storage_key),
         media_type="application/pdf",
-        headers={"Content-Disposition": f'inline; filename="{actual_filename}"'},
+        filename=actual_filename,
+        content_disposition_type="inline",
     )
 
 
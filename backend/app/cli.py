@@ -4,17 +4,17 @@ import click
 import asyncio
 from pathlib import Path
 from datetime import datetime, date
+from itertools import groupby
+from operator import itemgetter
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import func
 from sqlalchemy.orm import sessionmaker
-import pandas as pd
 
 # Load environment variables
 load_dotenv()
 
-from .config import settings
-from .database import Base, SessionLocal
-from .models import Product, Lot, LotType, LotStatus, UserRole
+from .database import Base, SessionLocal, engine
+from .models import Product, Lot, LotProduct, LotType, LotStatus, UserRole
 from .services import (
     ProductService,
     LotService,
@@ -23,6 +23,7 @@ from .services import (
     PDFWatcherService,
     COAGeneratorService,
 )
+from .utils.dates import bucket_daily_counts, date_range_bounds
 from .utils.logger import logger
 
 
@@ -44,7 +45,6 @@ def init():
     """Initialize the database."""
     click.echo("Initializing database...")
     try:
-        engine = create_engine(settings.DATABASE_URL)
         Base.metadata.create_all(engine)
         click.echo("✅ Database initialized successfully!")
     except Exception as e:
@@ -57,7 +57,6 @@ def reset():
     """Reset the database (drop and recreate all tables)."""
     click.echo("Resetting database...")
     try:
-        engine = create_engine(settings.DATABASE_URL)
         Base.metadata.drop_all(engine)
         Base.metadata.create_all(engine)
         click.echo("✅ Database reset successfully!")
@@ -322,21 +321,37 @@ def coa_status(pending):
     """Show lots ready for COA generation."""
     db = SessionLocal()
     try:
-        query = db.query(Lot).filter(Lot.generate_coa == True)
+        # One flat query for lots and their product names instead of
+        # lazy-loading lot_products and product per lot
+        query = (
+            db.query(
+                Lot.id,
+                Lot.lot_number,
+                Lot.reference_number,
+                Lot.status,
+                Product.display_name,
+            )
+            .outerjoin(LotProduct, LotProduct.lot_id == Lot.id)
+            .outerjoin(Product, Product.id == LotProduct.product_id)
+            .filter(Lot.generate_coa == True)
+        )
 
         if pending:
             query = query.filter(Lot.status == LotStatus.APPROVED)
 
-        lots = query.all()
+        rows = query.order_by(Lot.id).all()
+        lots = []
+        for _, lot_rows in groupby(rows, key=itemgetter(0)):
+            lot_rows = list(lot_rows)
+            _, lot_number, reference_number, lot_status, _ = lot_rows[0]
+            products = ", ".join(row[4] for row in lot_rows if row[4])
+            lots.append((lot_number, reference_number, lot_status, products))
 
         if lots:
             click.echo(f"\nFound {len(lots)} lots:\n")
-            for lot in lots:
-                products = ", ".join(
-                    [lp.product.display_name for lp in lot.lot_products]
-                )
-                click.echo(f"Lot: {lot.lot_number} | Ref: {lot.reference_number}")
-                click.echo(f"   Status: {lot.status.value}")
+            for lot_number, reference_number, lot_status, products in lots:
+                click.echo(f"Lot: {lot_number} | Ref: {reference_number}")
+                click.echo(f"   Status: {lot_status.value}")
                 click.echo(f"   Product(s): {products}")
                 click.echo()
         else:
@@ -393,25 +408,39 @@ def report(from_date, to_date, output):
     """Generate activity report."""
     db = SessionLocal()
     try:
-        # Gather report data
-        lots = (
-            db.query(Lot)
-            .filter(Lot.created_at >= from_date, Lot.created_at <= to_date)
+        # Half-open bounds so lots created on the --to day are counted
+        start, end = date_range_bounds(from_date.date(), to_date.date())
+
+        # Status breakdown counted in SQL rather than loading every lot
+        status_counts = (
+            db.query(Lot.status, func.count(Lot.id))
+            .filter(Lot.created_at >= start, Lot.created_at < end)
+            .group_by(Lot.status)
             .all()
         )
 
         click.echo(f"\n📊 Activity Report: {from_date.date()} to {to_date.date()}\n")
-        click.echo(f"Total Lots Created: {len(lots)}")
-
-        # Status breakdown
-        status_counts = {}
-        for lot in lots:
-            status = lot.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
+        click.echo(f"Total Lots Created: {sum(count for _, count in status_counts)}")
 
         click.echo("\nStatus Breakdown:")
-        for status, count in status_counts.items():
-            click.echo(f"   {status}: {count}")
+        for status, count in status_counts:
+            click.echo(f"   {status.value}: {count}")
+
+        # Lots created per day grouped in SQL; long ranges print weekly or
+        # monthly buckets instead of one line per day
+        created_day = func.date(Lot.created_at)
+        daily_counts = (
+            db.query(created_day, func.count(Lot.id))
+            .filter(Lot.created_at >= start, Lot.created_at < end)
+            .group_by(created_day)
+            .all()
+        )
+
+        click.echo("\nLots Created:")
+        for period_start, count in bucket_daily_counts(
+            daily_counts, (to_date - from_date).days
+        ):
+            click.echo(f"   {period_start.isoformat()}: {count}")
 
         # TODO: Add more report details
 
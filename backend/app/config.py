@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite:///./labtrack.db", env="DATABASE_URL"
     )
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")  # seconds
 
     # Security
     secret_key: str = Field(
@@ -10,8 +10,29 @@ from app.utils.logger import logger
 # Path to alembic.ini relative to this file (backend/app/database.py -> backend/alembic.ini)
 _ALEMBIC_INI = str(Path(__file__).parent.parent / "alembic.ini")
 
-# Create engine
-engine = create_engine(settings.database_url, echo=settings.debug)
+
+def _engine_options(database_url: str) -> dict:
+    """Connection pool options for the shared engine.
+
+    SQLite keeps SQLAlchemy's default pool; server databases get a sized
+    QueuePool with pre-ping so stale connections are replaced transparently.
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+
+# Create engine (one pooled engine per process; sessions borrow connections)
+engine = create_engine(
+    settings.database_url,
+    echo=settings.debug,
+    **_engine_options(settings.database_url),
+)
 
 # Create session factory
 SessionLocal = sessionmaker(
@@ -26,16 +26,7 @@ class COACategoryOrder(BaseModel):
     @classmethod
     def get_default_order(cls) -> list[str]:
         """Get the default category order (alphabetical)."""
-        return sorted([
-            LabTestType.CATEGORY_MICROBIOLOGICAL,
-            LabTestType.CATEGORY_HEAVY_METALS,
-            LabTestType.CATEGORY_PESTICIDES,
-            LabTestType.CATEGORY_NUTRITIONAL,
-            LabTestType.CATEGORY_PHYSICAL,
-            LabTestType.CATEGORY_CHEMICAL,
-            LabTestType.CATEGORY_ALLERGENS,
-            LabTestType.CATEGORY_ORGANOLEPTIC,
-        ])
+        return sorted(LabTestType.CATEGORIES)
 
     def __repr__(self):
         """String representation of COACategoryOrder."""
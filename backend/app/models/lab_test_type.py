@@ -1,5 +1,6 @@
 """Lab Test Type model for managing test catalog."""
 
+import json
 from datetime import datetime
 from sqlalchemy import (
     Column,
@@ -15,7 +16,40 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship, validates
 from app.models.base import BaseModel
-from typing import Optional
+from app.utils.cache import clear_on_write, lab_test_type_categories_cache
+from typing import Any, List, Optional
+
+
+# Required columns and the label used in their "cannot be empty" errors
+_REQUIRED_FIELDS = {"test_name": "Test name", "test_category": "Test category"}
+
+
+def normalize_lab_test_type_field(key: str, value: Any) -> Any:
+    """
+    Clean and validate one LabTestType column value.
+
+    Backs the LabTestType validators and Core bulk inserts, which bypass them.
+
+    Args:
+        key: Column name
+        value: Raw value
+
+    Returns:
+        Stripped value; a blank default specification becomes None
+
+    Raises:
+        ValueError: If the test name or category is blank
+    """
+    if key in _REQUIRED_FIELDS:
+        if not value or not value.strip():
+            raise ValueError(f"{_REQUIRED_FIELDS[key]} cannot be empty")
+        # Just strip whitespace, don't change case
+        return value.strip()
+    if key == "default_unit":
+        return value.strip() if value else value
+    if key == "default_specification":
+        return (value.strip() or None) if value is not None else None
+    return value
 
 
 class LabTestType(BaseModel):
@@ -65,6 +99,13 @@ class LabTestType(BaseModel):
         Index("idx_test_name", "test_name"),
         Index("idx_test_category", "test_category"),
         Index("idx_test_active", "is_active"),
+        # Catalog listing: filter by category/active, ordered by name
+        Index(
+            "idx_test_category_active_name",
+            "test_category",
+            "is_active",
+            "test_name",
+        ),
         CheckConstraint(
             "test_name != ''",
             name="check_test_name_not_empty"
@@ -84,45 +125,54 @@ class LabTestType(BaseModel):
     CATEGORY_CHEMICAL = "Chemical"
     CATEGORY_ALLERGENS = "Allergens"
     CATEGORY_ORGANOLEPTIC = "Organoleptic"
+
+    # All known categories, built once for validation and default ordering
+    CATEGORIES = (
+        CATEGORY_MICROBIOLOGICAL,
+        CATEGORY_HEAVY_METALS,
+        CATEGORY_PESTICIDES,
+        CATEGORY_NUTRITIONAL,
+        CATEGORY_PHYSICAL,
+        CATEGORY_CHEMICAL,
+        CATEGORY_ALLERGENS,
+        CATEGORY_ORGANOLEPTIC,
+    )
     
-    @validates("test_name")
-    def validate_test_name(self, key, value):
-        """Validate test name is not empty and properly formatted."""
-        if not value or not value.strip():
-            raise ValueError("Test name cannot be empty")
-        # Just strip whitespace, don't change case
-        return value.strip()
-    
-    @validates("test_category")
-    def validate_test_category(self, key, value):
-        """Validate test category is not empty."""
-        if not value or not value.strip():
-            raise ValueError("Test category cannot be empty")
-        # Just strip whitespace, don't change case
-        return value.strip()
-    
-    @validates("default_unit")
-    def validate_default_unit(self, key, value):
-        """Clean and validate unit."""
-        if value:
-            return value.strip()
-        return value
-    
-    @validates("default_specification")
-    def validate_default_specification(self, key, value):
-        """Clean and validate default specification."""
-        if value is not None:
-            value = value.strip()
-            if not value:
-                return None
-            return value
-        return None
+    @validates(*_REQUIRED_FIELDS, "default_unit", "default_specification")
+    def validate_fields(self, key, value):
+        """Clean and validate column values."""
+        return normalize_lab_test_type_field(key, value)
     
     @property
     def display_name(self) -> str:
         """Get display name with category."""
         return f"{self.test_name} ({self.test_category})"
     
+    @property
+    def abbreviation_list(self) -> List[str]:
+        """
+        Abbreviations decoded from the stored JSON array.
+
+        The parsed list is cached on the instance and reused until the
+        raw column value changes. Malformed values yield an empty list.
+        """
+        raw = self.abbreviations
+        cached = self.__dict__.get("_abbreviation_cache")
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+
+        parsed: List[str] = []
+        if raw:
+            try:
+                value = json.loads(raw)
+            except (TypeError, ValueError):
+                value = None
+            if isinstance(value, list):
+                parsed = [str(a) for a in value]
+
+        self.__dict__["_abbreviation_cache"] = (raw, parsed)
+        return parsed
+
     @property
     def is_microbiological(self) -> bool:
         """Check if this is a microbiological test."""
@@ -180,4 +230,7 @@ def prevent_delete_if_in_use(mapper, connection, target):
         raise ValueError(
             f"Cannot delete test type '{target.test_name}' - "
             f"it is used by {len(target.product_specifications)} products"
-        )
\ No newline at end of file
+        )
+
+# Invalidate cached category counts whenever a lab test type row is written
+clear_on_write(lab_test_type_categories_cache, LabTestType)
@@ -20,6 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship, validates
 from app.models.base import BaseModel
 from app.models.enums import LotType, LotStatus, TestResultStatus
+from app.utils.cache import clear_on_write, lot_status_counts_cache
 
 
 class Lot(BaseModel):
@@ -77,6 +78,8 @@ class Lot(BaseModel):
         Index("idx_lot_reference", "reference_number"),
         Index("idx_lot_status", "status"),
         Index("idx_lot_type_status", "lot_type", "status"),
+        Index("idx_lot_status_created", "status", "created_at"),
+        Index("idx_lot_status_updated", "status", "updated_at"),
         CheckConstraint("exp_date >= mfg_date", name="check_dates_valid"),
     )
 
@@ -251,3 +254,7 @@ class LotProduct(BaseModel):
     def __repr__(self):
         """String representation of LotProduct."""
         return f"<LotProduct(lot_id={self.lot_id}, product_id={self.product_id}, percentage={self.percentage})>"
+
+
+# Invalidate cached status counts whenever a lot row is written
+clear_on_write(lot_status_counts_cache, Lot)
@@ -1,5 +1,6 @@
 """Parsing queue model for handling PDF processing."""
 
+import json
 from datetime import datetime
 from sqlalchemy import Column, String, Text, DateTime, Enum, Index, Numeric, Integer
 from sqlalchemy.orm import validates
@@ -159,8 +160,6 @@ class ParsingQueue(BaseModel):
 
     def get_extracted_data_dict(self):
         """Get extracted data as dictionary."""
-        import json
-
         if not self.extracted_data:
             return {}
         try:
@@ -170,8 +169,6 @@ class ParsingQueue(BaseModel):
 
     def set_extracted_data(self, data_dict):
         """Set extracted data from dictionary."""
-        import json
-
         if data_dict:
             self.extracted_data = json.dumps(data_dict, default=str)
         else:
@@ -179,8 +176,6 @@ class ParsingQueue(BaseModel):
 
     def get_confidence_scores_dict(self):
         """Get confidence scores as dictionary."""
-        import json
-
         if not self.confidence_scores:
             return {}
         try:
@@ -190,8 +185,6 @@ class ParsingQueue(BaseModel):
 
     def set_confidence_scores(self, scores_dict):
         """Set confidence scores from dictionary."""
-        import json
-
         if scores_dict:
             self.confidence_scores = json.dumps(scores_dict)
         else:
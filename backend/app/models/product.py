@@ -1,11 +1,44 @@
 """Product model for standardized product catalog."""
 
 from datetime import datetime
+from typing import Any
 from sqlalchemy import Column, String, Text, Index, Integer, Boolean, DateTime, ForeignKey
 from sqlalchemy.orm import relationship, validates
 from app.models.base import BaseModel
 
 
+# Product columns that must be non-blank / are cleaned to None when blank
+_REQUIRED_FIELDS = ("brand", "product_name", "display_name")
+_OPTIONAL_STRING_FIELDS = ("flavor", "size", "serving_size", "version")
+
+
+def normalize_product_field(key: str, value: Any) -> Any:
+    """
+    Clean and validate one Product column value.
+
+    Backs the Product validators and Core bulk inserts, which bypass them.
+
+    Args:
+        key: Column name
+        value: Raw value
+
+    Returns:
+        Stripped value, or None for blank optional strings
+
+    Raises:
+        ValueError: If a required field is blank or expiry is not positive
+    """
+    if key in _REQUIRED_FIELDS:
+        if not value or not value.strip():
+            raise ValueError(f"{key} cannot be empty")
+        return value.strip()
+    if key in _OPTIONAL_STRING_FIELDS:
+        return value.strip() if value else None
+    if key == "expiry_duration_months" and value is not None and value <= 0:
+        raise ValueError("Expiry duration must be positive")
+    return value
+
+
 class Product(BaseModel):
     """
     Product model representing standardized product catalog.
@@ -60,31 +93,22 @@ class Product(BaseModel):
         Index("idx_product_brand", "brand"),
         Index("idx_product_name", "product_name"),
         Index("idx_product_brand_name", "brand", "product_name"),
+        # Trigram indexes for the ILIKE product search (PostgreSQL only, needs pg_trgm)
+        *(
+            Index(
+                f"idx_product_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ("brand", "product_name", "display_name", "flavor")
+        ),
     )
 
-    @validates("brand", "product_name", "display_name")
-    def validate_required_fields(self, key, value):
-        """Validate required string fields are not empty."""
-        if not value or not value.strip():
-            raise ValueError(f"{key} cannot be empty")
-        return value.strip()
-
-    @validates("flavor", "size")
-    def validate_optional_fields(self, key, value):
-        """Clean optional string fields."""
-        return value.strip() if value else None
-
-    @validates("serving_size", "version")
-    def validate_optional_string_fields(self, key, value):
-        """Clean optional string fields if provided."""
-        return value.strip() if value else None
-
-    @validates("expiry_duration_months")
-    def validate_expiry_duration(self, key, value):
-        """Validate expiry duration is positive."""
-        if value is not None and value <= 0:
-            raise ValueError("Expiry duration must be positive")
-        return value
+    @validates(*_REQUIRED_FIELDS, *_OPTIONAL_STRING_FIELDS, "expiry_duration_months")
+    def validate_fields(self, key, value):
+        """Clean and validate column values."""
+        return normalize_product_field(key, value)
 
     def __repr__(self):
         """String representation of Product."""
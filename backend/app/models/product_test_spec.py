@@ -1,9 +1,14 @@
 """Product test specification model linking products to required/optional tests."""
 
+import re
+
 from sqlalchemy import Column, String, Text, Boolean, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship, validates
 from app.models.base import BaseModel
 
+# Leading numeric part of a spec or result value (e.g. "10000" in "10000 CFU/g")
+_LEADING_NUMBER_RE = re.compile(r'^-?[\d.]+')
+
 
 class ProductTestSpecification(BaseModel):
     """
@@ -93,11 +98,10 @@ class ProductTestSpecification(BaseModel):
         Returns:
             float or None if not a valid number
         """
-        import re
         # Remove commas (thousands separators) and trim
         cleaned = s.replace(',', '').strip()
         # Extract the numeric part (handles cases like "10000 CFU/g")
-        match = re.match(r'^-?[\d.]+', cleaned)
+        match = _LEADING_NUMBER_RE.match(cleaned)
         if not match:
             return None
         try:
@@ -1,5 +1,6 @@
 """Test result model with approval workflow."""
 
+import re
 from datetime import datetime
 from decimal import Decimal
 from sqlalchemy import (
@@ -96,6 +97,12 @@ class TestResult(BaseModel):
         "physical": ["Appearance", "Odor", "Taste", "Particle Size", "Bulk Density"],
     }
 
+    # One case-insensitive alternation per category, checked in order
+    _TEST_CATEGORY_PATTERNS = [
+        (category, re.compile("|".join(map(re.escape, tests)), re.IGNORECASE))
+        for category, tests in TEST_CATEGORIES.items()
+    ]
+
     @validates("test_type")
     def validate_test_type(self, key, value):
         """Validate test type is not empty."""
@@ -155,8 +162,8 @@ class TestResult(BaseModel):
 
     def get_test_category(self):
         """Get the category of this test type."""
-        for category, tests in self.TEST_CATEGORIES.items():
-            if any(test.lower() in self.test_type.lower() for test in tests):
+        for category, pattern in self._TEST_CATEGORY_PATTERNS:
+            if pattern.search(self.test_type):
                 return category
         return "other"
 
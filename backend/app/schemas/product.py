@@ -126,6 +126,8 @@ class ProductResponse(BaseModel):
     archive_reason: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    required_test_count: Optional[int] = None  # Set by the list endpoint only
+    optional_test_count: Optional[int] = None  # Set by the list endpoint only
 
     model_config = {"from_attributes": True}
 
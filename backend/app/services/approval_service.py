@@ -2,10 +2,12 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func as db_func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, case, func as db_func
 from app.models.test_result import TestResult
 from app.models.lot import Lot, LotProduct
+from app.models.product import Product
+from app.models.product_test_spec import ProductTestSpecification
 from app.models.user import User
 from app.models.coa_release import COARelease
 from app.models.enums import TestResultStatus, LotStatus, LotType, UserRole, AuditAction, COAReleaseStatus
@@ -234,8 +236,11 @@ class ApprovalService(BaseService[TestResult]):
                 if result.lot_id:
                     lot_ids.add(result.lot_id)
             
+            completeness_by_lot = self.check_test_completeness_bulk(db, list(lot_ids))
             for lot_id in lot_ids:
-                self._update_lot_status_from_completeness(db, lot_id)
+                self._update_lot_status_from_completeness(
+                    db, lot_id, completeness_by_lot[lot_id]
+                )
 
             logger.info(f"Bulk approved {len(approved_results)} test results")
             return approved_results
@@ -323,10 +328,24 @@ class ApprovalService(BaseService[TestResult]):
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
-        query = db.query(AuditLog).filter(
-            AuditLog.table_name == "test_results",
-            AuditLog.action.in_([AuditAction.APPROVE, AuditAction.REJECT]),
-            AuditLog.timestamp >= cutoff_date,
+        # Select only the columns the history needs; the JSON value payloads
+        # on AuditLog are never read here
+        query = (
+            db.query(
+                AuditLog.id,
+                AuditLog.action,
+                AuditLog.timestamp,
+                AuditLog.user_id,
+                AuditLog.reason,
+                AuditLog.record_id,
+                User.username,
+            )
+            .outerjoin(User, AuditLog.user_id == User.id)
+            .filter(
+                AuditLog.table_name == "test_results",
+                AuditLog.action.in_([AuditAction.APPROVE, AuditAction.REJECT]),
+                AuditLog.timestamp >= cutoff_date,
+            )
         )
 
         if user_id:
@@ -336,19 +355,35 @@ class ApprovalService(BaseService[TestResult]):
             query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
         )
 
+        # Fetch related test results (if they still exist) in one query
+        record_ids = {audit.record_id for audit in results}
+        test_results_by_id = (
+            {
+                row.id: row
+                for row in db.query(
+                    TestResult.id,
+                    TestResult.test_type,
+                    TestResult.status,
+                    Lot.lot_number,
+                )
+                .join(Lot, TestResult.lot_id == Lot.id)
+                .filter(TestResult.id.in_(record_ids))
+                .all()
+            }
+            if record_ids
+            else {}
+        )
+
         history = []
         for audit in results:
-            # Get related test result if it still exists
-            test_result = (
-                db.query(TestResult).filter(TestResult.id == audit.record_id).first()
-            )
+            test_result = test_results_by_id.get(audit.record_id)
 
             history_item = {
                 "audit_id": audit.id,
                 "action": audit.action.value,
                 "timestamp": audit.timestamp,
                 "user_id": audit.user_id,
-                "user": audit.user.username if audit.user else None,
+                "user": audit.username,
                 "reason": audit.reason,
                 "test_result_id": audit.record_id,
             }
@@ -356,7 +391,7 @@ class ApprovalService(BaseService[TestResult]):
             if test_result:
                 history_item.update(
                     {
-                        "lot_number": test_result.lot.lot_number,
+                        "lot_number": test_result.lot_number,
                         "test_type": test_result.test_type,
                         "current_status": test_result.status.value,
                     }
@@ -366,6 +401,38 @@ class ApprovalService(BaseService[TestResult]):
 
         return history
 
+    def count_actions(
+        self,
+        db: Session,
+        action: AuditAction = AuditAction.APPROVE,
+        since: Optional[datetime] = None,
+        user_id: Optional[int] = None,
+    ) -> int:
+        """
+        Count test result approval actions without loading audit rows.
+
+        Args:
+            db: Database session
+            action: Audit action to count (approve or reject)
+            since: Only count actions at or after this timestamp
+            user_id: Optional filter by acting user
+
+        Returns:
+            Number of matching audit entries
+        """
+        query = db.query(db_func.count(AuditLog.id)).filter(
+            AuditLog.table_name == "test_results",
+            AuditLog.action == action,
+        )
+
+        if since:
+            query = query.filter(AuditLog.timestamp >= since)
+
+        if user_id:
+            query = query.filter(AuditLog.user_id == user_id)
+
+        return query.scalar() or 0
+
     def _check_lot_approval_status(
         self, db: Session, lot_id: int, user_id: int
     ) -> None:
@@ -559,38 +626,61 @@ class ApprovalService(BaseService[TestResult]):
         Returns:
             Dictionary with approval metrics
         """
-        query = db.query(TestResult)
-
+        date_filters = []
         if start_date:
-            query = query.filter(TestResult.created_at >= start_date)
+            date_filters.append(TestResult.created_at >= start_date)
 
         if end_date:
-            query = query.filter(TestResult.created_at <= end_date)
-
-        total_results = query.count()
-        approved_results = query.filter(
-            TestResult.status == TestResultStatus.APPROVED
-        ).count()
-
-        # Calculate average approval time
-        approved_with_time = query.filter(
-            TestResult.status == TestResultStatus.APPROVED,
-            TestResult.approved_at.isnot(None),
-        ).all()
-
-        if approved_with_time:
-            total_hours = sum(
-                (tr.approved_at - tr.created_at).total_seconds() / 3600
-                for tr in approved_with_time
+            date_filters.append(TestResult.created_at <= end_date)
+
+        # One conditional-aggregate SELECT instead of a COUNT per status
+        total_results, approved_results, pending_results = (
+            db.query(
+                db_func.count(TestResult.id),
+                db_func.coalesce(
+                    db_func.sum(
+                        case((TestResult.status == TestResultStatus.APPROVED, 1), else_=0)
+                    ),
+                    0,
+                ),
+                db_func.coalesce(
+                    db_func.sum(
+                        case((TestResult.status == TestResultStatus.DRAFT, 1), else_=0)
+                    ),
+                    0,
+                ),
+            )
+            .filter(*date_filters)
+            .one()
+        )
+
+        # Average approval time aggregated in SQL; interval arithmetic differs
+        # per dialect, so SQLite falls back to julianday differences
+        if db.get_bind().dialect.name == "postgresql":
+            approval_hours = (
+                db_func.extract("epoch", TestResult.approved_at - TestResult.created_at)
+                / 3600
             )
-            avg_approval_hours = total_hours / len(approved_with_time)
         else:
-            avg_approval_hours = 0
+            approval_hours = (
+                db_func.julianday(TestResult.approved_at)
+                - db_func.julianday(TestResult.created_at)
+            ) * 24
+
+        avg_approval_hours = (
+            db.query(db_func.avg(approval_hours))
+            .filter(
+                *date_filters,
+                TestResult.status == TestResultStatus.APPROVED,
+                TestResult.approved_at.isnot(None),
+            )
+            .scalar()
+        ) or 0
 
         # Get approver statistics
         approver_stats = (
             db.query(
-                User.username, db.func.count(TestResult.id).label("approval_count")
+                User.username, db_func.count(TestResult.id).label("approval_count")
             )
             .join(TestResult, TestResult.approved_by_id == User.id)
             .filter(TestResult.status == TestResultStatus.APPROVED)
@@ -601,26 +691,30 @@ class ApprovalService(BaseService[TestResult]):
         return {
             "total_test_results": total_results,
             "approved_results": approved_results,
-            "pending_approval": query.filter(
-                TestResult.status == TestResultStatus.DRAFT
-            ).count(),
+            "pending_approval": pending_results,
             "approval_rate": (
                 (approved_results / total_results * 100) if total_results > 0 else 0
             ),
-            "average_approval_time_hours": round(avg_approval_hours, 2),
+            "average_approval_time_hours": round(float(avg_approval_hours), 2),
             "approvers": [
                 {"username": username, "approval_count": count}
                 for username, count in approver_stats
             ],
         }
 
-    def _update_lot_status_from_completeness(self, db: Session, lot_id: int):
+    def _update_lot_status_from_completeness(
+        self,
+        db: Session,
+        lot_id: int,
+        completeness: Optional[Dict[str, Any]] = None,
+    ):
         """
         Update lot status based on test completeness after test results are approved.
         
         Args:
             db: Database session
             lot_id: ID of the lot to check
+            completeness: Precomputed completeness result (from a bulk check)
         """
         lot = db.query(Lot).filter(Lot.id == lot_id).first()
         if not lot:
@@ -631,7 +725,8 @@ class ApprovalService(BaseService[TestResult]):
             return
             
         # Check test completeness
-        completeness = self.check_test_completeness(db, lot_id)
+        if completeness is None:
+            completeness = self.check_test_completeness(db, lot_id)
         
         # If we have some results but missing required tests, set to PARTIAL_RESULTS
         if lot.test_results and not completeness["is_complete"]:
@@ -669,9 +764,48 @@ class ApprovalService(BaseService[TestResult]):
                 "status_recommendation": LotStatus
             }
         """
-        from app.services.product_service import ProductService
-        
-        lot = db.query(Lot).filter(Lot.id == lot_id).first()
+        return self.check_test_completeness_bulk(db, [lot_id])[lot_id]
+
+    def check_test_completeness_bulk(
+        self,
+        db: Session,
+        lot_ids: List[int],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Check test completeness for many lots with a fixed number of queries.
+
+        Lots, their products, specifications and test results are loaded
+        together instead of issuing per-lot lookups.
+
+        Args:
+            db: Database session
+            lot_ids: IDs of lots to check
+
+        Returns:
+            Dict mapping each lot ID to the same structure returned by
+            check_test_completeness
+        """
+        lots = (
+            db.query(Lot)
+            .options(
+                selectinload(Lot.lot_products)
+                .joinedload(LotProduct.product)
+                .selectinload(Product.test_specifications)
+                .joinedload(ProductTestSpecification.lab_test_type),
+                selectinload(Lot.test_results),
+            )
+            .filter(Lot.id.in_(lot_ids))
+            .all()
+        ) if lot_ids else []
+        lots_by_id = {lot.id: lot for lot in lots}
+
+        return {
+            lot_id: self._completeness_for_lot(lots_by_id.get(lot_id))
+            for lot_id in lot_ids
+        }
+
+    def _completeness_for_lot(self, lot: Optional[Lot]) -> Dict[str, Any]:
+        """Compute test completeness for an already-loaded lot."""
         if not lot or not lot.lot_products:
             return {
                 "is_complete": False,
@@ -684,18 +818,13 @@ class ApprovalService(BaseService[TestResult]):
         primary_product = lot.lot_products[0].product
         
         # Get completed test types from test results
-        completed_tests = [
-            tr.test_type for tr in lot.test_results
-        ]
+        completed_lower = {tr.test_type.lower() for tr in lot.test_results}
         
         # Get missing required tests
-        product_service = ProductService()
-        missing_specs = product_service.get_missing_required_tests(
-            db, primary_product.id, completed_tests
-        )
-        
         missing_required = [
-            spec.lab_test_type.test_name for spec in missing_specs
+            spec.lab_test_type.test_name
+            for spec in primary_product.required_tests
+            if spec.lab_test_type.test_name.lower() not in completed_lower
         ]
         
         # Get optional tests that were performed
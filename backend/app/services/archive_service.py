@@ -91,6 +91,10 @@ class ArchiveService(BaseService[COARelease]):
         # Get total count before pagination
         total = query.count()
 
+        # Nothing on this page: skip the joined, sorted page query entirely
+        if total == 0 or skip >= total:
+            return [], total
+
         # Build sort column mapping
         sort_columns = {
             "released_at": COARelease.released_at,
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func
 from app.models.audit import AuditLog
 from app.models.user import User
@@ -94,6 +94,7 @@ class AuditService(BaseService[AuditLog]):
         """
         audit_logs = (
             db.query(AuditLog)
+            .options(joinedload(AuditLog.user))
             .filter(AuditLog.table_name == table_name, AuditLog.record_id == record_id)
             .order_by(AuditLog.timestamp.desc())
             .offset(skip)
@@ -251,17 +252,15 @@ class AuditService(BaseService[AuditLog]):
         Returns:
             Compliance report dictionary
         """
-        query = db.query(AuditLog).filter(
-            AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date
-        )
-
+        # Shared filters so every figure in the report covers the same logs
+        filters = [AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date]
         if table_names:
-            query = query.filter(AuditLog.table_name.in_(table_names))
+            filters.append(AuditLog.table_name.in_(table_names))
 
-        # Get total counts by action
+        # Get total counts by action; totals are derived from these groups
         action_counts = (
             db.query(AuditLog.action, func.count(AuditLog.id).label("count"))
-            .filter(AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date)
+            .filter(*filters)
             .group_by(AuditLog.action)
             .all()
         )
@@ -269,7 +268,7 @@ class AuditService(BaseService[AuditLog]):
         # Get activity by table
         table_activity = (
             db.query(AuditLog.table_name, func.count(AuditLog.id).label("count"))
-            .filter(AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date)
+            .filter(*filters)
             .group_by(AuditLog.table_name)
             .all()
         )
@@ -278,7 +277,7 @@ class AuditService(BaseService[AuditLog]):
         user_activity = (
             db.query(User.username, func.count(AuditLog.id).label("action_count"))
             .join(AuditLog, AuditLog.user_id == User.id)
-            .filter(AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date)
+            .filter(*filters)
             .group_by(User.username)
             .order_by(func.count(AuditLog.id).desc())
             .limit(10)
@@ -286,9 +285,11 @@ class AuditService(BaseService[AuditLog]):
         )
 
         # Get critical actions (deletes and rejects)
-        critical_actions = query.filter(
-            AuditLog.action.in_([AuditAction.DELETE, AuditAction.REJECT])
-        ).count()
+        critical_actions = sum(
+            count
+            for action, count in action_counts
+            if action in (AuditAction.DELETE, AuditAction.REJECT)
+        )
 
         report = {
             "report_period": {
@@ -297,12 +298,10 @@ class AuditService(BaseService[AuditLog]):
                 "days": (end_date - start_date).days,
             },
             "summary": {
-                "total_actions": query.count(),
+                "total_actions": sum(count for _, count in action_counts),
                 "critical_actions": critical_actions,
                 "unique_users": db.query(func.count(func.distinct(AuditLog.user_id)))
-                .filter(
-                    AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date
-                )
+                .filter(*filters)
                 .scalar(),
             },
             "actions_breakdown": {
@@ -338,8 +337,13 @@ class AuditService(BaseService[AuditLog]):
         Returns:
             List of field change summaries
         """
-        query = db.query(AuditLog).filter(
-            AuditLog.table_name == table_name, AuditLog.action == AuditAction.UPDATE
+        query = (
+            db.query(AuditLog)
+            .options(joinedload(AuditLog.user))
+            .filter(
+                AuditLog.table_name == table_name,
+                AuditLog.action == AuditAction.UPDATE,
+            )
         )
 
         if start_date:
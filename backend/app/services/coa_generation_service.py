@@ -1,7 +1,10 @@
 """COA PDF generation service using ReportLab (pure Python, no system dependencies)."""
 
+import hashlib
+import json
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -27,6 +30,110 @@ from app.models.enums import TestResultStatus
 from app.models.lab_test_type import LabTestType
 from app.services.lab_info_service import lab_info_service
 from app.services.storage_service import get_storage_service
+from app.utils.cache import coa_html_preview_cache
+
+
+@lru_cache(maxsize=1)
+def _coa_styles():
+    """
+    Build the COA paragraph styles once per process.
+
+    The stylesheet is deterministic and never mutated while rendering, so
+    every PDF can share the same style objects.
+
+    Returns:
+        Tuple of (stylesheet, wrap_style, wrap_style_small, label_value_style)
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='COATitle',
+        parent=styles['Title'],
+        fontSize=18,
+        textColor=colors.HexColor('#0f172a'),
+        alignment=TA_CENTER,
+        spaceAfter=10
+    ))
+    styles.add(ParagraphStyle(
+        name='COAHeader',
+        parent=styles['Heading2'],
+        fontSize=11,
+        textColor=colors.HexColor('#0f172a'),
+        alignment=TA_LEFT,
+        spaceBefore=12,
+        spaceAfter=6
+    ))
+    styles.add(ParagraphStyle(
+        name='COANormal',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=TA_LEFT,
+        leading=11
+    ))
+    styles.add(ParagraphStyle(
+        name='COAFooter',
+        parent=styles['Normal'],
+        fontSize=8,
+        alignment=TA_CENTER,
+        textColor=colors.grey
+    ))
+    styles.add(ParagraphStyle(
+        name='COADocTitle',
+        parent=styles['Normal'],
+        fontSize=14,
+        fontName='Helvetica-Bold',
+        textColor=colors.HexColor('#0f172a'),
+        alignment=TA_RIGHT,
+        spaceAfter=4
+    ))
+    styles.add(ParagraphStyle(
+        name='COADocMeta',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#64748b'),
+        alignment=TA_RIGHT,
+        leading=11
+    ))
+    styles.add(ParagraphStyle(
+        name='COACompanyName',
+        parent=styles['Normal'],
+        fontSize=9,
+        fontName='Helvetica-Bold',
+        textColor=colors.HexColor('#64748b'),
+        leading=11
+    ))
+    styles.add(ParagraphStyle(
+        name='COACompanyInfo',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#64748b'),
+        leading=11
+    ))
+
+    wrap_style = ParagraphStyle(
+        name='COAWrap',
+        parent=styles['Normal'],
+        fontName='Helvetica',
+        fontSize=9,
+        leading=11,
+        alignment=TA_LEFT,
+        wordWrap='CJK',
+        splitLongWords=1,
+    )
+    wrap_style_small = ParagraphStyle(
+        name='COAWrapSmall',
+        parent=wrap_style,
+        fontSize=8,
+        leading=10,
+    )
+    label_value_style = ParagraphStyle(
+        name='COALabelValue',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=12,
+        textColor=colors.HexColor('#0f172a'),
+    )
+
+    return styles, wrap_style, wrap_style_small, label_value_style
 
 
 class COAGenerationService:
@@ -87,12 +194,10 @@ class COAGenerationService:
             # Generate PDF with ReportLab to temp file
             self._generate_pdf_reportlab(context, tmp_path)
 
-            # Read the generated PDF and upload to storage
-            with open(tmp_path, "rb") as f:
-                pdf_content = f.read()
-
+            # Hand the open file to storage so R2 can stream the upload
             storage = get_storage_service()
-            storage.upload(pdf_content, storage_key, content_type="application/pdf")
+            with open(tmp_path, "rb") as f:
+                storage.upload(f, storage_key, content_type="application/pdf")
 
         finally:
             # Clean up temp file
@@ -410,8 +515,16 @@ class COAGenerationService:
             raise ValueError(f"COARelease with id {coa_release_id} not found")
 
         context = self._build_context(db, coa_release.lot, coa_release.product, coa_release)
+
+        # Identical context renders identical HTML, so every viewer of an
+        # unchanged COA shares one rendering
+        context_hash = hashlib.sha256(
+            json.dumps(context, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
         template = self.env.get_template("coa_template.html")
-        return template.render(**context)
+        return coa_html_preview_cache.get_or_set(
+            context_hash, lambda: template.render(**context)
+        )
 
     def generate_preview(self, db: Session, lot_id: int, product_id: int) -> str:
         """
@@ -439,11 +552,18 @@ class COAGenerationService:
         # Build context without COARelease (preview mode)
         context = self._build_context(db, lot, product)
 
-        # Generate preview PDF filename and storage key
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"COA_preview_{lot.lot_number}_{timestamp}.pdf"
+        # Key the preview by its rendered inputs so an unchanged preview is
+        # served from storage instead of being re-rendered on every request
+        context_hash = hashlib.sha256(
+            json.dumps(context, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        filename = f"COA_preview_{lot.lot_number}_{context_hash}.pdf"
         storage_key = f"coas/{filename}"
 
+        if get_storage_service().exists(storage_key):
+            logger.debug(f"Reusing cached COA preview PDF: {storage_key}")
+            return storage_key
+
         # Generate PDF to temporary file, then upload to storage
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
             tmp_path = tmp_file.name
@@ -452,12 +572,10 @@ class COAGenerationService:
             # Generate PDF with ReportLab to temp file
             self._generate_pdf_reportlab(context, tmp_path)
 
-            # Read the generated PDF and upload to storage
-            with open(tmp_path, "rb") as f:
-                pdf_content = f.read()
-
+            # Hand the open file to storage so R2 can stream the upload
             storage = get_storage_service()
-            storage.upload(pdf_content, storage_key, content_type="application/pdf")
+            with open(tmp_path, "rb") as f:
+                storage.upload(f, storage_key, content_type="application/pdf")
 
         finally:
             # Clean up temp file
@@ -486,95 +604,8 @@ class COAGenerationService:
             bottomMargin=0.5*inch
         )
 
-        # Setup styles
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name='COATitle',
-            parent=styles['Title'],
-            fontSize=18,
-            textColor=colors.HexColor('#0f172a'),
-            alignment=TA_CENTER,
-            spaceAfter=10
-        ))
-        styles.add(ParagraphStyle(
-            name='COAHeader',
-            parent=styles['Heading2'],
-            fontSize=11,
-            textColor=colors.HexColor('#0f172a'),
-            alignment=TA_LEFT,
-            spaceBefore=12,
-            spaceAfter=6
-        ))
-        styles.add(ParagraphStyle(
-            name='COANormal',
-            parent=styles['Normal'],
-            fontSize=9,
-            alignment=TA_LEFT,
-            leading=11
-        ))
-        styles.add(ParagraphStyle(
-            name='COAFooter',
-            parent=styles['Normal'],
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        ))
-        styles.add(ParagraphStyle(
-            name='COADocTitle',
-            parent=styles['Normal'],
-            fontSize=14,
-            fontName='Helvetica-Bold',
-            textColor=colors.HexColor('#0f172a'),
-            alignment=TA_RIGHT,
-            spaceAfter=4
-        ))
-        styles.add(ParagraphStyle(
-            name='COADocMeta',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#64748b'),
-            alignment=TA_RIGHT,
-            leading=11
-        ))
-        styles.add(ParagraphStyle(
-            name='COACompanyName',
-            parent=styles['Normal'],
-            fontSize=9,
-            fontName='Helvetica-Bold',
-            textColor=colors.HexColor('#64748b'),
-            leading=11
-        ))
-        styles.add(ParagraphStyle(
-            name='COACompanyInfo',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#64748b'),
-            leading=11
-        ))
-
-        wrap_style = ParagraphStyle(
-            name='COAWrap',
-            parent=styles['Normal'],
-            fontName='Helvetica',
-            fontSize=9,
-            leading=11,
-            alignment=TA_LEFT,
-            wordWrap='CJK',
-            splitLongWords=1,
-        )
-        wrap_style_small = ParagraphStyle(
-            name='COAWrapSmall',
-            parent=wrap_style,
-            fontSize=8,
-            leading=10,
-        )
-        label_value_style = ParagraphStyle(
-            name='COALabelValue',
-            parent=styles['Normal'],
-            fontSize=9,
-            leading=12,
-            textColor=colors.HexColor('#0f172a'),
-        )
+        # Setup styles (built once and shared across PDFs)
+        styles, wrap_style, wrap_style_small, label_value_style = _coa_styles()
 
         def wrap_cell(value: Any, style: ParagraphStyle) -> Paragraph:
             text = "" if value is None else str(value)
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from io import BytesIO
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
@@ -21,18 +22,22 @@ from reportlab.platypus import (
     Image, PageBreak, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from loguru import logger
 
-from ..models import Lot, LotStatus
+from ..models import Lot, LotProduct, LotStatus, TestResult
 from ..models.coa import COAHistory
 from ..services.base import BaseService
 from ..config import settings
+from ..utils.cache import clear_caches_for
 
 
 class COAGeneratorService:
     """Service for generating COA documents from approved lots."""
 
+    # Upper bound on concurrent document renders in generate_batch_coas
+    BATCH_MAX_WORKERS = 8
+
     def __init__(self):
         self.template_dir = Path("templates")
         self.output_dir = Path(settings.COA_OUTPUT_FOLDER)
@@ -51,45 +56,16 @@ class COAGeneratorService:
         if not lot:
             raise ValueError(f"Lot {lot_id} not found")
 
-        if lot.status not in [LotStatus.APPROVED, LotStatus.RELEASED]:
-            raise ValueError(f"Lot {lot.lot_number} is not approved for COA generation (status: {lot.status.value})")
-
-        if not lot.generate_coa:
-            raise ValueError(f"Lot {lot.lot_number} is not marked for COA generation")
-
-        # Check if all test results are approved
-        from ..models.enums import TestResultStatus
-        unapproved = [r for r in lot.test_results if r.status != TestResultStatus.APPROVED]
-        if unapproved:
-            raise ValueError(f"Lot has {len(unapproved)} unapproved test results")
+        self._validate_lot_for_coa(lot)
 
         try:
-            # Generate filename
-            filename_base = self._generate_filename(lot)
-
-            # Generate documents
-            generated_files = []
-
-            if output_format in ["docx", "both"]:
-                docx_path = self._generate_docx(lot, template, filename_base)
-                generated_files.append(docx_path)
-
-            if output_format in ["pdf", "both"]:
-                pdf_path = self._generate_pdf(lot, template, filename_base)
-                generated_files.append(pdf_path)
+            generated_files = self._render_coa_files(lot, template, output_format)
 
             # Update lot status (only if not already released)
             if lot.status != LotStatus.RELEASED:
                 lot.status = LotStatus.RELEASED
 
-            # Create COA history entry
-            for file_path in generated_files:
-                coa_history = COAHistory(
-                    lot_id=lot_id,
-                    filename=file_path.name,
-                    generated_by=str(user_id) if user_id else "system",
-                )
-                db.add(coa_history)
+            self._record_coa_history(db, lot, generated_files, user_id)
 
             db.commit()
 
@@ -108,6 +84,52 @@ class COAGeneratorService:
             db.rollback()
             raise
 
+    def _validate_lot_for_coa(self, lot: Lot) -> None:
+        """Raise ValueError if the lot cannot have a COA generated."""
+        if lot.status not in [LotStatus.APPROVED, LotStatus.RELEASED]:
+            raise ValueError(f"Lot {lot.lot_number} is not approved for COA generation (status: {lot.status.value})")
+
+        if not lot.generate_coa:
+            raise ValueError(f"Lot {lot.lot_number} is not marked for COA generation")
+
+        # Check if all test results are approved
+        from ..models.enums import TestResultStatus
+        unapproved = [r for r in lot.test_results if r.status != TestResultStatus.APPROVED]
+        if unapproved:
+            raise ValueError(f"Lot has {len(unapproved)} unapproved test results")
+
+    def _render_coa_files(
+        self, lot: Lot, template: str, output_format: str
+    ) -> List[Path]:
+        """
+        Render COA documents for a lot.
+
+        Only reads attributes of the lot; it never touches the session, so it
+        is safe to run from worker threads once relationships are loaded.
+        """
+        filename_base = self._generate_filename(lot)
+        generated_files = []
+
+        if output_format in ["docx", "both"]:
+            generated_files.append(self._generate_docx(lot, template, filename_base))
+
+        if output_format in ["pdf", "both"]:
+            generated_files.append(self._generate_pdf(lot, template, filename_base))
+
+        return generated_files
+
+    def _record_coa_history(
+        self, db: Session, lot: Lot, files: List[Path], user_id: Optional[int]
+    ) -> None:
+        """Add a COA history entry for each generated file."""
+        for file_path in files:
+            coa_history = COAHistory(
+                lot_id=lot.id,
+                filename=file_path.name,
+                generated_by=str(user_id) if user_id else "system",
+            )
+            db.add(coa_history)
+
     def _generate_filename(self, lot: Lot) -> str:
         """Generate standardized filename for COA."""
         date_str = datetime.now().strftime("%Y%m%d")
@@ -322,20 +344,25 @@ class COAGeneratorService:
         # Signature line
         table = doc.add_table(rows=1, cols=2)
 
-        # QC Approval
-        cell1 = table.rows[0].cells[0]
-        cell1.text = "QC Approved By: _________________\n\n"
+        # Each cell.text assignment rebuilds the cell XML, so set it once
         approver_name = "QC Manager"
         if lot.test_results and lot.test_results[0].approved_by_user:
             approver_name = lot.test_results[0].approved_by_user.username
-        cell1.text += f"Name: {approver_name}\n"
-        cell1.text += f"Date: {datetime.now().strftime('%B %d, %Y')}"
+        date_str = datetime.now().strftime('%B %d, %Y')
+
+        # QC Approval
+        table.rows[0].cells[0].text = (
+            "QC Approved By: _________________\n\n"
+            f"Name: {approver_name}\n"
+            f"Date: {date_str}"
+        )
 
         # Authorized Signature
-        cell2 = table.rows[0].cells[1]
-        cell2.text = "Authorized Signature: _________________\n\n"
-        cell2.text += "Name: _________________\n"
-        cell2.text += f"Date: {datetime.now().strftime('%B %d, %Y')}"
+        table.rows[0].cells[1].text = (
+            "Authorized Signature: _________________\n\n"
+            "Name: _________________\n"
+            f"Date: {date_str}"
+        )
 
         # Disclaimer
         doc.add_paragraph()
@@ -699,31 +726,104 @@ class COAGeneratorService:
         """Generate COAs for multiple lots."""
         results = {"success": [], "failed": [], "files": []}
 
+        # Load every requested lot in one IN query instead of one lookup per lot
+        lots_by_id = {
+            lot.id: lot
+            for lot in db.query(Lot)
+            .options(
+                selectinload(Lot.lot_products).joinedload(LotProduct.product),
+                selectinload(Lot.test_results).joinedload(
+                    TestResult.approved_by_user
+                ),
+            )
+            .filter(Lot.id.in_(lot_ids))
+            .all()
+        }
+
+        # Validate up front; only renderable lots go to the worker pool
+        renderable = []
         for lot_id in lot_ids:
+            lot = lots_by_id.get(lot_id)
             try:
-                result = self.generate_coa(db, lot_id, template, output_format, user_id)
-                results["success"].append(lot_id)
-                results["files"].extend(result["files"])
+                if not lot:
+                    raise ValueError(f"Lot {lot_id} not found")
+                self._validate_lot_for_coa(lot)
+                renderable.append(lot)
             except Exception as e:
                 logger.error(f"Failed to generate COA for lot {lot_id}: {e}")
                 results["failed"].append({"lot_id": lot_id, "error": str(e)})
 
+        # Rendering is independent per lot, so run it in parallel. Workers only
+        # read the eagerly loaded lots; all session work stays on this thread.
+        rendered: Dict[int, List[Path]] = {}
+        if renderable:
+            max_workers = min(self.BATCH_MAX_WORKERS, len(renderable))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._render_coa_files, lot, template, output_format
+                    ): lot
+                    for lot in renderable
+                }
+                for future in as_completed(futures):
+                    lot = futures[future]
+                    try:
+                        rendered[lot.id] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to generate COA for lot {lot.id}: {e}")
+                        results["failed"].append({"lot_id": lot.id, "error": str(e)})
+
+        # Record results in request order
+        for lot in renderable:
+            files = rendered.get(lot.id)
+            if files is None:
+                continue
+            self._record_coa_history(db, lot, files, user_id)
+            logger.info(f"Generated COA for lot {lot.lot_number}")
+            results["success"].append(lot.id)
+            results["files"].extend(files)
+
+        # Release every generated lot with one UPDATE and a single commit
+        if results["success"]:
+            try:
+                db.query(Lot).filter(
+                    Lot.id.in_(results["success"]),
+                    Lot.status != LotStatus.RELEASED,
+                ).update({Lot.status: LotStatus.RELEASED}, synchronize_session="fetch")
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            # Bulk UPDATE bypasses the Lot mapper events
+            clear_caches_for(Lot)
+
         # Create ZIP file if multiple files
         if len(results["files"]) > 1:
-            zip_path = self._create_zip(results["files"])
-            results["zip_file"] = zip_path
+            zip_bytes = self._build_zip_bytes(results["files"])
+            results["zip_file"] = self._create_zip(zip_bytes)
+            # Callers can serve the archive without re-reading it from disk
+            results["zip_bytes"] = zip_bytes
 
         return results
 
-    def _create_zip(self, files: List[Path]) -> Path:
-        """Create ZIP file containing multiple COAs."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_path = self.output_dir / f"COAs_batch_{timestamp}.zip"
-
-        with zipfile.ZipFile(zip_path, "w") as zf:
+    def _build_zip_bytes(self, files: List[Path]) -> bytes:
+        """Zip generated COAs into memory in a single pass."""
+        buffer = BytesIO()
+        # PDF/DOCX payloads are already compressed; level 1 keeps this cheap
+        with zipfile.ZipFile(
+            buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
             for file_path in files:
                 if file_path.exists():
-                    zf.write(file_path, file_path.name)
+                    zf.write(file_path, arcname=file_path.name)
+
+        return buffer.getvalue()
+
+    def _create_zip(self, zip_bytes: bytes) -> Path:
+        """Write a prebuilt COA ZIP archive to the output folder."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        zip_path = self.output_dir / f"COAs_batch_{timestamp}.zip"
+        zip_path.write_bytes(zip_bytes)
 
         return zip_path
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date, datetime
 from zoneinfo import ZoneInfo
 from difflib import SequenceMatcher
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -19,6 +21,7 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 
@@ -37,6 +40,82 @@ from app.models import (
 from app.utils.logger import logger
 
 
+@lru_cache(maxsize=1)
+def _daane_coc_styles():
+    """
+    Build the Daane COC PDF paragraph styles once per process.
+
+    Returns:
+        Tuple of (title, section, header, header_right, value, label, email,
+        small) styles
+    """
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "DaaneTitle",
+        parent=styles["Heading1"],
+        alignment=TA_CENTER,
+        fontSize=16,
+        spaceAfter=6,
+    )
+    section_style = ParagraphStyle(
+        "DaaneSection",
+        parent=styles["Heading3"],
+        alignment=TA_LEFT,
+        fontSize=11,
+        spaceBefore=6,
+        spaceAfter=4,
+    )
+    header_style = ParagraphStyle(
+        "DaaneHeader",
+        parent=styles["BodyText"],
+        fontSize=9,
+        leading=11,
+    )
+    header_right_style = ParagraphStyle(
+        "DaaneHeaderRight",
+        parent=styles["BodyText"],
+        fontSize=9,
+        leading=11,
+        alignment=TA_RIGHT,
+    )
+    value_style = ParagraphStyle(
+        "DaaneValue",
+        parent=styles["BodyText"],
+        fontSize=9,
+        leading=11,
+    )
+    label_style = ParagraphStyle(
+        "DaaneLabel",
+        parent=styles["BodyText"],
+        fontSize=9,
+        leading=11,
+        fontName="Helvetica-Bold",
+    )
+    email_style = ParagraphStyle(
+        "DaaneEmail",
+        parent=styles["BodyText"],
+        fontSize=8,
+        leading=10,
+    )
+    small_style = ParagraphStyle(
+        "DaaneSmall",
+        parent=styles["BodyText"],
+        fontSize=8,
+        leading=10,
+    )
+
+    return (
+        title_style,
+        section_style,
+        header_style,
+        header_right_style,
+        value_style,
+        label_style,
+        email_style,
+        small_style,
+    )
+
+
 @dataclass(frozen=True)
 class DaaneMethodEntry:
     full: str
@@ -64,6 +143,10 @@ class DaaneCOCService:
     MATCH_UNMAPPED = "unmapped"
 
     _method_list_cache: Optional[List[DaaneMethodEntry]] = None
+    _template_bytes_cache: Optional[bytes] = None
+    _template_cell_cache: Optional[Dict[tuple[str, str], Optional[str]]] = None
+    _rendered_coc_cache: Optional[OrderedDict[tuple, bytes]] = None
+    RENDERED_COC_CACHE_SIZE = 32
 
     # Hardcoded company info per requirements
     COMPANY_NAME = "Body Nutrition"
@@ -360,7 +443,32 @@ class DaaneCOCService:
         if not self.template_path.exists():
             raise FileNotFoundError(f"Daane COC template not found at {self.template_path}")
 
-        wb = openpyxl.load_workbook(self.template_path)
+        start_row = 22
+        max_rows = 12
+
+        # Warn if tests exceed available rows
+        if len(tests) > max_rows:
+            logger.warning(
+                f"Daane COC: {len(tests)} tests provided, only {max_rows} rendered"
+            )
+
+        # Repeat downloads with identical cell values reuse the saved bytes
+        cache_key = self._rendered_coc_key(
+            "xlsx",
+            po_number,
+            authorizer_name,
+            authorizer_signature,
+            sample_id,
+            lot_number,
+            method_suitability,
+            special_instructions,
+            tests[:max_rows],
+        )
+        cached = self._get_rendered_coc(cache_key)
+        if cached is not None:
+            return cached
+
+        wb = self._load_template_workbook()
         ws = wb["Chain of Custody"]
 
         # Customer information
@@ -382,24 +490,60 @@ class DaaneCOCService:
             ws["D19"] = special_instructions
 
         # Test rows
-        start_row = 22
-        max_rows = 12
         for idx, test in enumerate(tests[:max_rows]):
             row = start_row + idx
             ws[f"A{row}"] = test.daane_method or ""
             ws[f"O{row}"] = test.specification or ""
             ws[f"T{row}"] = test.unit or ""
 
-        # Warn if tests exceed available rows
-        if len(tests) > max_rows:
-            logger.warning(
-                f"Daane COC: {len(tests)} tests provided, only {max_rows} rendered"
-            )
-
         buffer = BytesIO()
         wb.save(buffer)
-        buffer.seek(0)
-        return buffer.read()
+        content = buffer.getvalue()
+
+        self._store_rendered_coc(cache_key, content)
+        return content
+
+    def _rendered_coc_key(
+        self,
+        kind: str,
+        po_number: str,
+        authorizer_name: str,
+        authorizer_signature: str,
+        sample_id: str,
+        lot_number: str,
+        method_suitability: str,
+        special_instructions: str,
+        tests: List[DaaneTestRow],
+    ) -> tuple:
+        """Build the rendered-COC cache key from every value written to the document."""
+        test_cells = tuple(
+            (test.daane_method or "", test.specification or "", test.unit or "")
+            for test in tests
+        )
+        return (
+            kind,
+            po_number,
+            authorizer_name,
+            authorizer_signature,
+            sample_id,
+            lot_number,
+            method_suitability,
+            special_instructions,
+            test_cells,
+        )
+
+    def _get_rendered_coc(self, cache_key: tuple) -> Optional[bytes]:
+        if self._rendered_coc_cache is None:
+            self._rendered_coc_cache = OrderedDict()
+        cached = self._rendered_coc_cache.get(cache_key)
+        if cached is not None:
+            self._rendered_coc_cache.move_to_end(cache_key)
+        return cached
+
+    def _store_rendered_coc(self, cache_key: tuple, content: bytes) -> None:
+        self._rendered_coc_cache[cache_key] = content
+        if len(self._rendered_coc_cache) > self.RENDERED_COC_CACHE_SIZE:
+            self._rendered_coc_cache.popitem(last=False)
 
     def _render_coc_pdf(
         self,
@@ -414,6 +558,21 @@ class DaaneCOCService:
         tests: List[DaaneTestRow],
     ) -> bytes:
         """Render a PDF version of the COC."""
+        cache_key = self._rendered_coc_key(
+            "pdf",
+            po_number,
+            authorizer_name,
+            authorizer_signature,
+            sample_id,
+            lot_number,
+            method_suitability,
+            special_instructions,
+            tests[:12],
+        )
+        cached = self._get_rendered_coc(cache_key)
+        if cached is not None:
+            return cached
+
         buffer = BytesIO()
         doc = SimpleDocTemplate(
             buffer,
@@ -423,65 +582,21 @@ class DaaneCOCService:
             topMargin=0.5 * inch,
             bottomMargin=0.5 * inch,
         )
-        styles = getSampleStyleSheet()
         def _para(text: Optional[str], style: ParagraphStyle) -> Paragraph:
             safe = escape(text or "")
             safe = safe.replace("\n", "<br/>")
             return Paragraph(safe, style)
 
-        title_style = ParagraphStyle(
-            "DaaneTitle",
-            parent=styles["Heading1"],
-            alignment=TA_CENTER,
-            fontSize=16,
-            spaceAfter=6,
-        )
-        section_style = ParagraphStyle(
-            "DaaneSection",
-            parent=styles["Heading3"],
-            alignment=TA_LEFT,
-            fontSize=11,
-            spaceBefore=6,
-            spaceAfter=4,
-        )
-        header_style = ParagraphStyle(
-            "DaaneHeader",
-            parent=styles["BodyText"],
-            fontSize=9,
-            leading=11,
-        )
-        header_right_style = ParagraphStyle(
-            "DaaneHeaderRight",
-            parent=styles["BodyText"],
-            fontSize=9,
-            leading=11,
-            alignment=TA_RIGHT,
-        )
-        value_style = ParagraphStyle(
-            "DaaneValue",
-            parent=styles["BodyText"],
-            fontSize=9,
-            leading=11,
-        )
-        label_style = ParagraphStyle(
-            "DaaneLabel",
-            parent=styles["BodyText"],
-            fontSize=9,
-            leading=11,
-            fontName="Helvetica-Bold",
-        )
-        email_style = ParagraphStyle(
-            "DaaneEmail",
-            parent=styles["BodyText"],
-            fontSize=8,
-            leading=10,
-        )
-        small_style = ParagraphStyle(
-            "DaaneSmall",
-            parent=styles["BodyText"],
-            fontSize=8,
-            leading=10,
-        )
+        (
+            title_style,
+            section_style,
+            header_style,
+            header_right_style,
+            value_style,
+            label_style,
+            email_style,
+            small_style,
+        ) = _daane_coc_styles()
 
         story: List = []
         header_left = Paragraph(
@@ -646,8 +761,10 @@ class DaaneCOCService:
         story.append(test_table)
 
         doc.build(story)
-        buffer.seek(0)
-        return buffer.read()
+        content = buffer.getvalue()
+
+        self._store_rendered_coc(cache_key, content)
+        return content
 
     def _build_tests_for_lot(
         self,
@@ -704,16 +821,25 @@ class DaaneCOCService:
         mappings = self._mapping_dict(db)
         tests: List[DaaneTestRow] = []
 
+        # Resolve every item's lab test type in one query, keyed by lowercase name
+        test_names = {
+            item.test_result.test_type.lower()
+            for item in retest_request.items
+            if item.test_result
+        }
+        lab_tests_by_name: Dict[str, LabTestType] = {}
+        if test_names:
+            for lab_test in db.query(LabTestType).filter(
+                func.lower(LabTestType.test_name).in_(test_names)
+            ):
+                lab_tests_by_name.setdefault(lab_test.test_name.lower(), lab_test)
+
         for item in retest_request.items:
             test_result = item.test_result
             if not test_result:
                 continue
 
-            lab_test = (
-                db.query(LabTestType)
-                .filter(LabTestType.test_name.ilike(test_result.test_type))
-                .first()
-            )
+            lab_test = lab_tests_by_name.get(test_result.test_type.lower())
             daane_method = self._resolve_daane_method(
                 mappings,
                 lab_test.id if lab_test else None,
@@ -831,15 +957,28 @@ class DaaneCOCService:
         year_two = base_date.strftime("%y")
         return f"PO-{year_two}{julian_day}-{sequence:03d}"
 
+    def _load_template_workbook(self, data_only: bool = False) -> openpyxl.Workbook:
+        """Load a fresh workbook from the template bytes, read from disk once."""
+        if self._template_bytes_cache is None:
+            self._template_bytes_cache = self.template_path.read_bytes()
+        return openpyxl.load_workbook(
+            BytesIO(self._template_bytes_cache), data_only=data_only
+        )
+
     def _template_cell_value(self, sheet_name: str, cell: str) -> Optional[str]:
         if not self.template_path.exists():
             return None
-        wb = openpyxl.load_workbook(self.template_path, data_only=True)
-        ws = wb[sheet_name]
-        value = ws[cell].value
-        if isinstance(value, str):
-            return value.strip()
-        return None
+        # Static template labels: parse the workbook once, not per PDF render
+        if self._template_cell_cache is None:
+            self._template_cell_cache = {}
+        key = (sheet_name, cell)
+        if key not in self._template_cell_cache:
+            ws = self._load_template_workbook(data_only=True)[sheet_name]
+            value = ws[cell].value
+            self._template_cell_cache[key] = (
+                value.strip() if isinstance(value, str) else None
+            )
+        return self._template_cell_cache[key]
 
     def _get_method_list(self) -> List[DaaneMethodEntry]:
         if self._method_list_cache is not None:
@@ -850,7 +989,7 @@ class DaaneCOCService:
             self._method_list_cache = []
             return self._method_list_cache
 
-        wb = openpyxl.load_workbook(self.template_path, data_only=True)
+        wb = self._load_template_workbook(data_only=True)
         ws = wb["Method List"]
 
         entries: List[DaaneMethodEntry] = []
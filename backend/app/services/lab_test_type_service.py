@@ -1,8 +1,11 @@
 """Service for managing lab test types."""
 
+import json
+from itertools import groupby
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, lambda_stmt, select
 from app.models import LabTestType
 from app.services.base import BaseService
 from app.utils.logger import logger
@@ -57,20 +60,9 @@ class LabTestTypeService(BaseService[LabTestType]):
             raise ValueError(f"Lab test type '{name}' already exists")
         
         # Validate category
-        valid_categories = [
-            LabTestType.CATEGORY_MICROBIOLOGICAL, 
-            LabTestType.CATEGORY_HEAVY_METALS,
-            LabTestType.CATEGORY_PESTICIDES,
-            LabTestType.CATEGORY_NUTRITIONAL,
-            LabTestType.CATEGORY_PHYSICAL,
-            LabTestType.CATEGORY_CHEMICAL,
-            LabTestType.CATEGORY_ALLERGENS,
-            LabTestType.CATEGORY_ORGANOLEPTIC
-        ]
-        
-        if category not in valid_categories:
+        if category not in LabTestType.CATEGORIES:
             raise ValueError(
-                f"Invalid category. Must be one of: {valid_categories}"
+                f"Invalid category. Must be one of: {list(LabTestType.CATEGORIES)}"
             )
         
         # Create test type
@@ -86,7 +78,6 @@ class LabTestTypeService(BaseService[LabTestType]):
         
         if abbreviations:
             # Store abbreviations as JSON
-            import json
             lab_test.abbreviations = json.dumps(abbreviations)
         
         db.add(lab_test)
@@ -161,23 +152,24 @@ class LabTestTypeService(BaseService[LabTestType]):
         Returns:
             Dict with category names as keys and lists of test types as values
         """
-        query = db.query(LabTestType)
+        # lambda_stmt caches the compiled SQL per code path, so repeat calls
+        # skip ORM statement construction and compilation
+        stmt = lambda_stmt(lambda: select(LabTestType))
         
         if not include_inactive:
-            query = query.filter(LabTestType.is_active == True)
+            stmt += lambda s: s.where(LabTestType.is_active == True)
         
-        all_tests = query.order_by(
+        stmt += lambda s: s.order_by(
             LabTestType.test_category,
             LabTestType.test_name
-        ).all()
-        
-        grouped = {}
-        for test in all_tests:
-            if test.test_category not in grouped:
-                grouped[test.test_category] = []
-            grouped[test.test_category].append(test)
+        )
+        all_tests = db.execute(stmt).scalars().all()
         
-        return grouped
+        # Rows arrive ordered by category, so each group is one contiguous run
+        return {
+            category: list(tests)
+            for category, tests in groupby(all_tests, key=attrgetter("test_category"))
+        }
     
     def search_by_name_or_abbreviation(
         self,
@@ -202,19 +194,18 @@ class LabTestTypeService(BaseService[LabTestType]):
         if test:
             return test
         
-        # Check abbreviations
-        all_tests = db.query(LabTestType).all()
+        # Check abbreviations; let SQL narrow candidates to rows that
+        # contain the term before parsing their JSON lists. Terms that JSON
+        # would escape (non-ASCII, quotes, backslashes) skip the prefilter.
         search_lower = search_term.lower()
-        
-        for test in all_tests:
-            if test.abbreviations:
-                try:
-                    import json
-                    abbrevs = json.loads(test.abbreviations)
-                    if any(search_lower == abbr.lower() for abbr in abbrevs):
-                        return test
-                except:
-                    pass
+        query = db.query(LabTestType).filter(LabTestType.abbreviations.isnot(None))
+        if search_term.isascii() and '"' not in search_term and "\\" not in search_term:
+            query = query.filter(LabTestType.abbreviations.ilike(f"%{search_term}%"))
+        candidates = query.all()
+        
+        for test in candidates:
+            if any(search_lower == abbr.lower() for abbr in test.abbreviation_list):
+                return test
         
         return None
     
@@ -68,6 +68,20 @@ class LocalStorageService(StorageService):
 
         return full_path.read_bytes()
 
+    def get_local_path(self, key: str) -> Path:
+        """
+        Get the filesystem path for a stored file.
+
+        Lets endpoints stream files with FileResponse instead of loading
+        them fully into memory via download().
+        """
+        full_path = self._get_full_path(key)
+
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {key}")
+
+        return full_path
+
     def delete(self, key: str) -> bool:
         """Delete a file from local storage."""
         full_path = self._get_full_path(key)
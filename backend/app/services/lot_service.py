@@ -2,7 +2,7 @@
 
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, selectinload
 from sqlalchemy.exc import IntegrityError
 from app.models.lot import Lot, Sublot, LotProduct
 from app.models.test_result import TestResult
@@ -419,28 +419,36 @@ class LotService(BaseService[Lot]):
         Returns:
             List of missing required test specifications
         """
-        from app.models import ProductTestSpecification
-        from app.services.product_service import ProductService
-        
-        lot = self.get(db, lot_id)
-        if not lot:
-            return []
-        
-        product_service = ProductService()
-        missing_specs = []
-        
-        # Get missing tests for each product in the lot
-        for lot_product in lot.lot_products:
-            product_missing = product_service.get_missing_required_tests(
-                db, 
-                lot_product.product_id, 
-                completed_test_types
+        from app.models import LabTestType, ProductTestSpecification
+
+        # One JOIN across the lot's products instead of a product + specs
+        # lookup per product
+        required_specs = (
+            db.query(ProductTestSpecification)
+            .join(
+                LotProduct,
+                LotProduct.product_id == ProductTestSpecification.product_id,
             )
-            
-            # Add to list if not already there
-            for spec in product_missing:
-                if not any(s.lab_test_type_id == spec.lab_test_type_id for s in missing_specs):
-                    missing_specs.append(spec)
+            .join(ProductTestSpecification.lab_test_type)
+            .options(contains_eager(ProductTestSpecification.lab_test_type))
+            .filter(
+                LotProduct.lot_id == lot_id,
+                ProductTestSpecification.is_required == True,
+            )
+            .order_by(LabTestType.test_category, LabTestType.test_name)
+            .all()
+        )
+
+        completed_lower = {t.lower() for t in completed_test_types}
+        missing_specs = []
+        seen_test_type_ids = set()
+
+        for spec in required_specs:
+            if spec.lab_test_type_id in seen_test_type_ids:
+                continue
+            seen_test_type_ids.add(spec.lab_test_type_id)
+            if spec.lab_test_type.test_name.lower() not in completed_lower:
+                missing_specs.append(spec)
         
         return missing_specs
 
@@ -475,9 +483,21 @@ class LotService(BaseService[Lot]):
         Returns:
             Updated lot
         """
-        from app.models import ProductTestSpecification
+        from app.models import Product, ProductTestSpecification
 
-        lot = self.get(db, lot_id)
+        # Load the lot's products, specs and spec test types up front; the
+        # loop below would otherwise lazy-load each level per product
+        lot = (
+            db.query(Lot)
+            .options(
+                selectinload(Lot.lot_products)
+                .joinedload(LotProduct.product)
+                .selectinload(Product.test_specifications)
+                .joinedload(ProductTestSpecification.lab_test_type)
+            )
+            .filter(Lot.id == lot_id)
+            .first()
+        )
         if not lot:
             raise ValueError(f"Lot with ID {lot_id} not found")
 
@@ -494,14 +514,18 @@ class LotService(BaseService[Lot]):
                 if spec.is_required:
                     required_specs[spec.test_name] = spec
 
-        # Get test results for this lot
-        test_results = db.query(TestResult).filter(TestResult.lot_id == lot_id).all()
+        # Get test results for this lot (only the two columns the status needs)
+        test_results = (
+            db.query(TestResult.test_type, TestResult.result_value)
+            .filter(TestResult.lot_id == lot_id)
+            .all()
+        )
 
         # Build map of test_type -> result_value for completed tests
         completed_results = {}  # test_type -> result_value
-        for result in test_results:
-            if result.result_value is not None and result.result_value.strip() != "":
-                completed_results[result.test_type] = result.result_value
+        for test_type, result_value in test_results:
+            if result_value is not None and result_value.strip() != "":
+                completed_results[test_type] = result_value
 
         # If no required tests, status depends on whether any tests exist
         if not required_specs:
@@ -5,9 +5,10 @@ import re
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
 from abc import ABC, abstractmethod
 
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from loguru import logger
 
@@ -273,12 +274,21 @@ class PDFParserService:
         logger.info(f"Created test results for lot {lot.lot_number}")
 
     def review_parsing_queue(
-        self, db: Session, status: Optional[ParsingStatus] = None
+        self,
+        db: Session,
+        status: Optional[Union[ParsingStatus, Sequence[ParsingStatus]]] = None,
     ) -> List[ParsingQueue]:
-        """Get parsing queue entries for review."""
+        """
+        Get parsing queue entries for review.
+
+        Pass several statuses (e.g. PENDING and FAILED) to fetch them in a
+        single ``status IN (...)`` query.
+        """
         query = db.query(ParsingQueue)
-        if status:
-            query = query.filter_by(status=status)
+        if isinstance(status, ParsingStatus):
+            query = query.filter(ParsingQueue.status == status)
+        elif status:
+            query = query.filter(ParsingQueue.status.in_(list(status)))
         return query.order_by(ParsingQueue.created_at.desc()).all()
 
     def update_parsed_data(
@@ -313,23 +323,24 @@ class PDFParserService:
 
     def get_confidence_statistics(self, db: Session) -> Dict[str, Any]:
         """Get parsing confidence statistics."""
-        queue_entries = (
-            db.query(ParsingQueue)
+        # Aggregate in SQL; only the four figures leave the database
+        high = ParsingQueue.confidence_score >= self.confidence_threshold
+        total_parsed, average_confidence, high_confidence = (
+            db.query(
+                func.count(ParsingQueue.id),
+                func.avg(ParsingQueue.confidence_score),
+                func.coalesce(func.sum(case((high, 1), else_=0)), 0),
+            )
             .filter(ParsingQueue.confidence_score.isnot(None))
-            .all()
+            .one()
         )
 
-        if not queue_entries:
+        if not total_parsed:
             return {"average_confidence": 0, "total_parsed": 0}
 
-        confidences = [e.confidence_score for e in queue_entries]
         return {
-            "average_confidence": sum(confidences) / len(confidences),
-            "total_parsed": len(queue_entries),
-            "high_confidence": len(
-                [c for c in confidences if c >= self.confidence_threshold]
-            ),
-            "low_confidence": len(
-                [c for c in confidences if c < self.confidence_threshold]
-            ),
+            "average_confidence": average_confidence,
+            "total_parsed": total_parsed,
+            "high_confidence": high_confidence,
+            "low_confidence": total_parsed - high_confidence,
         }
@@ -1,10 +1,11 @@
 """Product service for managing product catalog."""
 
-from typing import Optional, List, Dict, Any
-from sqlalchemy import or_
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import or_, func, case
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.product import Product
+from app.models.product_test_spec import ProductTestSpecification
 from app.services.base import BaseService
 from app.utils.logger import logger
 
@@ -181,6 +182,45 @@ class ProductService(BaseService[Product]):
             logger.error(f"Error searching products: {e}")
             raise
 
+    def get_spec_counts(
+        self, db: Session, product_ids: List[int]
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Count required and optional test specifications per product.
+
+        Aggregates in a single grouped query rather than loading each
+        product's test_specifications relationship.
+
+        Args:
+            db: Database session
+            product_ids: IDs of products to count specifications for
+
+        Returns:
+            Dict mapping product ID to (required_count, optional_count);
+            products without specifications are omitted
+        """
+        if not product_ids:
+            return {}
+
+        try:
+            rows = (
+                db.query(
+                    ProductTestSpecification.product_id,
+                    func.sum(case((ProductTestSpecification.is_required == True, 1), else_=0)),
+                    func.sum(case((ProductTestSpecification.is_required == True, 0), else_=1)),
+                )
+                .filter(ProductTestSpecification.product_id.in_(product_ids))
+                .group_by(ProductTestSpecification.product_id)
+                .all()
+            )
+            return {
+                product_id: (int(required or 0), int(optional or 0))
+                for product_id, required, optional in rows
+            }
+        except Exception as e:
+            logger.error(f"Error counting test specifications: {e}")
+            raise
+
     def get_brands(self, db: Session) -> List[str]:
         """
         Get list of unique brands.
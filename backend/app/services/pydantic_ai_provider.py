@@ -2,6 +2,7 @@
 
 import os
 import json
+import re
 from typing import Dict, Any, Tuple, List
 from datetime import datetime, date
 from pydantic import BaseModel, Field
@@ -102,8 +103,6 @@ class PydanticAIProvider(AIProvider):
         @self.agent.tool_plain
         def parse_value_with_unit(value_string: str) -> Dict[str, str]:
             """Parse combined value and unit strings"""
-            import re
-            
             # Pattern for number followed by unit
             pattern = r'^([\d.,<>≤≥\s-]+)\s*([a-zA-Z%°/]+.*)$'
             match = re.match(pattern, value_string.strip())
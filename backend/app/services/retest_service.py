@@ -2,6 +2,7 @@
 
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple
 
@@ -14,6 +15,7 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -28,6 +30,49 @@ from app.services.daane_coc_service import daane_coc_service
 from app.utils.logger import logger
 
 
+@lru_cache(maxsize=1)
+def _retest_styles():
+    """
+    Build the retest form paragraph styles once per process.
+
+    Returns:
+        Stylesheet with the Retest* styles added
+    """
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="RetestTitle",
+            parent=styles["Title"],
+            fontSize=18,
+            textColor=colors.HexColor("#b45309"),  # Amber/warning color
+            alignment=TA_CENTER,
+            spaceAfter=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="RetestHeader",
+            parent=styles["Heading2"],
+            fontSize=11,
+            textColor=colors.HexColor("#b45309"),
+            alignment=TA_LEFT,
+            spaceBefore=12,
+            spaceAfter=6,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="RetestNormal",
+            parent=styles["Normal"],
+            fontSize=9,
+            alignment=TA_LEFT,
+            leading=11,
+        )
+    )
+
+    return styles
+
+
 class RetestService(BaseService[RetestRequest]):
     """
     Service for managing lab retest requests.
@@ -65,9 +110,9 @@ class RetestService(BaseService[RetestRequest]):
 
         # Count existing retest requests for this lot
         existing_count = (
-            db.query(RetestRequest)
+            db.query(func.count(RetestRequest.id))
             .filter(RetestRequest.lot_id == lot_id)
-            .count()
+            .scalar()
         )
 
         retest_number = existing_count + 1
@@ -373,28 +418,24 @@ class RetestService(BaseService[RetestRequest]):
 
                 updated_request = retest_request
 
-                # Check if lot has any OTHER pending retests
-                pending_count = (
-                    db.query(RetestRequest)
-                    .filter(
-                        RetestRequest.lot_id == retest_request.lot_id,
-                        RetestRequest.status == RetestStatus.PENDING,
-                        RetestRequest.id != retest_request.id,
-                    )
-                    .count()
-                )
-
-                # Also check for review_required retests - lot should still show pending
-                review_required_count = (
-                    db.query(RetestRequest)
+                # Other pending retests, or any awaiting review, keep the lot
+                # flagged; both are counted in one query
+                outstanding_count = (
+                    db.query(func.count(RetestRequest.id))
                     .filter(
                         RetestRequest.lot_id == retest_request.lot_id,
-                        RetestRequest.status == RetestStatus.REVIEW_REQUIRED,
+                        or_(
+                            and_(
+                                RetestRequest.status == RetestStatus.PENDING,
+                                RetestRequest.id != retest_request.id,
+                            ),
+                            RetestRequest.status == RetestStatus.REVIEW_REQUIRED,
+                        ),
                     )
-                    .count()
+                    .scalar()
                 )
 
-                if pending_count == 0 and review_required_count == 0:
+                if outstanding_count == 0:
                     retest_request.lot.has_pending_retest = False
                 elif retest_request.status == RetestStatus.REVIEW_REQUIRED:
                     # Keep flag true if review required
@@ -438,13 +479,13 @@ class RetestService(BaseService[RetestRequest]):
 
         # Update lot flag if no other pending retests
         pending_count = (
-            db.query(RetestRequest)
+            db.query(func.count(RetestRequest.id))
             .filter(
                 RetestRequest.lot_id == retest_request.lot_id,
                 RetestRequest.status == RetestStatus.PENDING,
                 RetestRequest.id != retest_request.id,
             )
-            .count()
+            .scalar()
         )
 
         if pending_count == 0:
@@ -530,38 +571,7 @@ class RetestService(BaseService[RetestRequest]):
             bottomMargin=0.5 * inch,
         )
 
-        # Setup styles
-        styles = getSampleStyleSheet()
-        styles.add(
-            ParagraphStyle(
-                name="RetestTitle",
-                parent=styles["Title"],
-                fontSize=18,
-                textColor=colors.HexColor("#b45309"),  # Amber/warning color
-                alignment=TA_CENTER,
-                spaceAfter=10,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="RetestHeader",
-                parent=styles["Heading2"],
-                fontSize=11,
-                textColor=colors.HexColor("#b45309"),
-                alignment=TA_LEFT,
-                spaceBefore=12,
-                spaceAfter=6,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="RetestNormal",
-                parent=styles["Normal"],
-                fontSize=9,
-                alignment=TA_LEFT,
-                leading=11,
-            )
-        )
+        styles = _retest_styles()
 
         # Build story (content)
         story = []
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.lot import Lot
@@ -249,9 +250,16 @@ class SampleService(BaseService[TestResult]):
         updated_results = []
 
         try:
+            # Fetch every target row in one SELECT rather than one per update
+            ids = [update["id"] for update in updates]
+            results_by_id = {
+                result.id: result
+                for result in db.query(TestResult).filter(TestResult.id.in_(ids)).all()
+            } if ids else {}
+
             for update in updates:
                 test_result_id = update.pop("id")
-                test_result = self.get(db, test_result_id)
+                test_result = results_by_id.get(test_result_id)
 
                 if not test_result:
                     logger.warning(f"Test result {test_result_id} not found, skipping")
@@ -320,6 +328,12 @@ class SampleService(BaseService[TestResult]):
 
         results = query.offset(skip).limit(limit).all()
 
+        # Resolve product names once per lot; queued results often share a lot
+        product_names: Dict[int, List[str]] = {}
+        for _, lot in results:
+            if lot.id not in product_names:
+                product_names[lot.id] = [p.get_full_name() for p in lot.products]
+
         lab_queue = []
         for test_result, lot in results:
             lab_queue.append(
@@ -330,7 +344,7 @@ class SampleService(BaseService[TestResult]):
                     "test_type": test_result.test_type,
                     "test_date": test_result.test_date,
                     "status": test_result.status.value,
-                    "products": [p.get_full_name() for p in lot.products],
+                    "products": list(product_names[lot.id]),
                 }
             )
 
@@ -349,12 +363,14 @@ class SampleService(BaseService[TestResult]):
         Returns:
             Dictionary with completion statistics
         """
-        query = db.query(TestResult)
+        query = db.query(TestResult.status, func.count(TestResult.id))
 
         if lot_id:
             query = query.filter(TestResult.lot_id == lot_id)
 
-        total_tests = query.count()
+        # Single GROUP BY round trip instead of one COUNT per status
+        counts = dict(query.group_by(TestResult.status).all())
+        total_tests = sum(counts.values())
 
         if total_tests == 0:
             return {
@@ -365,13 +381,9 @@ class SampleService(BaseService[TestResult]):
                 "completion_percentage": 0.0,
             }
 
-        draft_count = query.filter(TestResult.status == TestResultStatus.DRAFT).count()
-        reviewed_count = query.filter(
-            TestResult.status == TestResultStatus.REVIEWED
-        ).count()
-        approved_count = query.filter(
-            TestResult.status == TestResultStatus.APPROVED
-        ).count()
+        draft_count = counts.get(TestResultStatus.DRAFT, 0)
+        reviewed_count = counts.get(TestResultStatus.REVIEWED, 0)
+        approved_count = counts.get(TestResultStatus.APPROVED, 0)
 
         return {
             "total_tests": total_tests,
@@ -3,6 +3,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import secrets
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User
@@ -377,13 +378,21 @@ class UserService(BaseService[User]):
         Returns:
             Dictionary with user statistics
         """
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.active == True).count()
+        # One GROUP BY role/active replaces a COUNT per metric and per role
+        grouped = (
+            db.query(User.role, User.active, func.count(User.id))
+            .group_by(User.role, User.active)
+            .all()
+        )
 
-        role_counts = {}
-        for role in UserRole:
-            count = db.query(User).filter(User.role == role).count()
-            role_counts[role.value] = count
+        total_users = 0
+        active_users = 0
+        role_counts = {role.value: 0 for role in UserRole}
+        for role, active, count in grouped:
+            total_users += count
+            if active:
+                active_users += count
+            role_counts[role.value] += count
 
         return {
             "total_users": total_users,
@@ -0,0 +1,112 @@
+"""Small in-process TTL cache for read-mostly aggregate queries."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from sqlalchemy import event
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache whose entries expire after a fixed TTL.
+
+    Intended for cheap-to-invalidate aggregates (dashboard counts, lookup
+    lists) served by a single API worker. Writers call ``clear()`` after
+    committing changes that affect the cached data.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        """Initialize cache with the given time-to-live in seconds."""
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing it with factory on a miss.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = factory()
+
+        with self._lock:
+            # Drop expired entries so filter-keyed pages don't accumulate
+            expired = [k for k, (expires, _) in self._entries.items() if expires <= now]
+            for k in expired:
+                del self._entries[k]
+            self._entries[key] = (now + self.ttl_seconds, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Caches registered per mapped class through clear_on_write()
+_caches_by_model: Dict[type, List[TTLCache]] = {}
+
+
+def clear_on_write(cache: TTLCache, *models: type) -> None:
+    """
+    Clear cache whenever a row of any of the given models is flushed.
+
+    Hooks the ORM mapper events, so Core-level bulk statements (``insert()``,
+    ``Query.update()``) bypass it and must call ``clear_caches_for()``.
+
+    Args:
+        cache: Cache to invalidate
+        *models: Mapped classes whose writes affect the cached data
+    """
+
+    def _clear(mapper, connection, target):
+        cache.clear()
+
+    for model in models:
+        _caches_by_model.setdefault(model, []).append(cache)
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, _clear)
+
+
+def clear_caches_for(*models: type) -> None:
+    """
+    Clear every cache registered on the given models with clear_on_write().
+
+    Args:
+        *models: Mapped classes written by a Core-level bulk statement
+    """
+    for model in models:
+        for cache in _caches_by_model.get(model, ()):
+            cache.clear()
+
+
+# Lot counts grouped by status (dashboard / kanban headers)
+lot_status_counts_cache = TTLCache(ttl_seconds=60)
+
+# Active lab test type counts grouped by category (catalog filters)
+lab_test_type_categories_cache = TTLCache(ttl_seconds=60)
+
+# Lot list pages, keyed by filters and cleared on writes to the source tables
+lot_list_cache = TTLCache(ttl_seconds=60)
+
+# Product list pages, keyed by filters and cleared on writes to the source tables
+product_list_cache = TTLCache(ttl_seconds=60)
+
+# Rendered COA HTML previews, keyed by a hash of the template context
+coa_html_preview_cache = TTLCache(ttl_seconds=300)
+
+# Archived (released/rejected) lot pages, keyed by filters and date range and
+# cleared on writes to the source tables
+archived_lot_list_cache = TTLCache(ttl_seconds=300)
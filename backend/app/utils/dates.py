@@ -0,0 +1,63 @@
+"""Date range helpers for query filters."""
+
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+# Series longer than these spans are resampled to weekly / monthly buckets
+WEEKLY_BUCKET_THRESHOLD_DAYS = 90
+MONTHLY_BUCKET_THRESHOLD_DAYS = 730
+
+
+def date_range_bounds(
+    date_from: Optional[date], date_to: Optional[date]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Convert an inclusive date range into half-open datetime bounds.
+
+    Filter with ``column >= start`` and ``column < end`` so the whole
+    ``date_to`` day is included without relying on ``datetime.max``.
+
+    Args:
+        date_from: First day of the range, or None for no lower bound
+        date_to: Last day of the range, or None for no upper bound
+
+    Returns:
+        Tuple of (start, exclusive_end); either may be None
+    """
+    start = datetime.combine(date_from, time.min) if date_from else None
+    end = datetime.combine(date_to + timedelta(days=1), time.min) if date_to else None
+    return start, end
+
+
+def bucket_daily_counts(
+    daily_counts: Iterable[Tuple[Any, int]], span_days: int
+) -> List[Tuple[date, int]]:
+    """
+    Resample daily counts so long ranges return a bounded series.
+
+    Ranges over two years are summed per month and ranges over 90 days per
+    ISO week (Monday start); shorter ranges keep one point per day.
+
+    Args:
+        daily_counts: (day, count) pairs; days may be dates or ISO strings
+        span_days: Length of the requested range in days
+
+    Returns:
+        Sorted list of (bucket_start, count) pairs
+    """
+    buckets: Counter = Counter()
+    for day, count in daily_counts:
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        elif isinstance(day, datetime):
+            day = day.date()
+
+        if span_days > MONTHLY_BUCKET_THRESHOLD_DAYS:
+            day = day.replace(day=1)
+        elif span_days > WEEKLY_BUCKET_THRESHOLD_DAYS:
+            day = day - timedelta(days=day.weekday())
+
+        buckets[day] += count
+
+    return sorted(buckets.items())
@@ -123,11 +123,13 @@ def extract_text_with_tables(pdf_path: Path) -> str:
     
     # Combine text with formatted tables
     if tables:
-        text += "\n\n=== EXTRACTED TABLES ===\n"
+        parts = [text, "\n\n=== EXTRACTED TABLES ===\n"]
         for table_info in tables:
-            text += f"\nPage {table_info['page']} - Table {table_info['table_index']}:\n"
-            text += table_info['formatted']
-            text += "\n"
+            parts.append(
+                f"\nPage {table_info['page']} - Table {table_info['table_index']}:\n"
+                f"{table_info['formatted']}\n"
+            )
+        text = "".join(parts)
     
     return text
 
@@ -7,7 +7,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from datetime import date, timedelta
 from app.database import get_db, init_db
-from app.models import Product, Lot, User, TestResult
+from app.models import Product, Lot, LotProduct, User, TestResult
 from app.models.enums import UserRole, LotType, LotStatus, TestResultStatus
 from app.services.user_service import UserService
 
@@ -52,8 +52,8 @@ def create_demo_data():
         
         print("✅ Created users: admin, qcmanager, labtech")
         
-        # Create products
-        products = []
+        # Create products; rows are added together and flushed once so the
+        # INSERTs are batched instead of round-tripping per object
         product_data = [
             ("Truvani", "Organic Whey Protein", "Chocolate Peanut Butter", "20 serving"),
             ("Truvani", "Organic Whey Protein", "Vanilla", "20 serving"),
@@ -63,22 +63,21 @@ def create_demo_data():
             ("Garden of Life", "Raw Organic Protein", "Chocolate", "22 oz"),
         ]
         
-        for brand, name, flavor, size in product_data:
-            product = Product(
+        products = [
+            Product(
                 brand=brand,
                 product_name=name,
                 flavor=flavor,
                 size=size,
                 display_name=f"{brand} {name} - {flavor} ({size})"
             )
-            db.add(product)
-            products.append(product)
-        
-        db.commit()
+            for brand, name, flavor, size in product_data
+        ]
+        db.add_all(products)
+        db.flush()
         print(f"✅ Created {len(products)} products")
         
         # Create lots
-        lots = []
         lot_data = [
             ("LOT2024001", LotType.STANDARD, date(2024, 10, 1), date(2027, 10, 1), LotStatus.APPROVED, products[0]),
             ("LOT2024002", LotType.STANDARD, date(2024, 10, 15), date(2027, 10, 15), LotStatus.TESTED, products[1]),
@@ -86,8 +85,8 @@ def create_demo_data():
             ("PARENT2024001", LotType.PARENT_LOT, date(2024, 9, 1), date(2027, 9, 1), LotStatus.APPROVED, products[3]),
         ]
         
-        for lot_num, lot_type, mfg, exp, status, product in lot_data:
-            lot = Lot(
+        lots = [
+            Lot(
                 lot_number=lot_num,
                 lot_type=lot_type,
                 reference_number=f"24{mfg.month:02d}{mfg.day:02d}-001",
@@ -96,16 +95,16 @@ def create_demo_data():
                 status=status,
                 generate_coa=True
             )
-            db.add(lot)
-            db.flush()
-            
-            # Associate product with lot
-            from app.models import LotProduct
-            lot_product = LotProduct(lot_id=lot.id, product_id=product.id)
-            db.add(lot_product)
-            lots.append(lot)
-        
-        db.commit()
+            for lot_num, lot_type, mfg, exp, status, _ in lot_data
+        ]
+        db.add_all(lots)
+        db.flush()
+
+        # Associate products with lots now that every lot has an id
+        db.add_all(
+            LotProduct(lot_id=lot.id, product_id=row[-1].id)
+            for lot, row in zip(lots, lot_data)
+        )
         print(f"✅ Created {len(lots)} lots")
         
         # Create test results for approved lots
@@ -119,7 +118,7 @@ def create_demo_data():
             ("Cadmium", "0.02", "ppm", TestResultStatus.DRAFT),
         ]
         
-        test_count = 0
+        test_results = []
         for lot in lots[:2]:  # First two lots
             for test_type, value, unit, status in test_types:
                 test_result = TestResult(
@@ -137,11 +136,12 @@ def create_demo_data():
                     test_result.approved_by_id = qc_manager.id
                     test_result.approved_at = date.today()
                 
-                db.add(test_result)
-                test_count += 1
+                test_results.append(test_result)
         
+        db.add_all(test_results)
+        # Single commit for products, lots and test results
         db.commit()
-        print(f"✅ Created {test_count} test results")
+        print(f"✅ Created {len(test_results)} test results")
         
         print("\n🎉 Demo data created successfully!")
         print("\nYou can now log in with:")
@@ -27,22 +27,39 @@ def upgrade() -> None:
         sa.Column("serving_size", sa.Numeric(precision=5, scale=2), nullable=True),
     )
     
-    # Update existing products with random serving sizes between 25-32g
-    connection = op.get_bind()
-    result = connection.execute(sa.text("SELECT id FROM products"))
-    product_ids = [row[0] for row in result]
-    
-    # Use a deterministic approach for reproducibility
-    import random
-    random.seed(42)  # Fixed seed for consistent results
-    
-    for product_id in product_ids:
-        # Generate random serving size between 25 and 32 grams (to 2 decimal places)
-        serving_size = round(random.uniform(25.0, 32.0), 2)
-        connection.execute(
-            sa.text("UPDATE products SET serving_size = :size WHERE id = :id"),
-            {"size": serving_size, "id": product_id}
+    # Backfill existing products with a serving size between 25 and 32 g,
+    # set-based where the database can generate the value itself;
+    # ((x % 701) + 701) % 701 keeps the offset in 0..700 without abs(), which
+    # overflows on the minimum integer
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # hashtext keeps the value deterministic per product id
+        op.execute(
+            "UPDATE products SET serving_size = "
+            "ROUND(25 + ((hashtext(id::text) % 701 + 701) % 701)::numeric / 100, 2)"
         )
+    elif dialect == "sqlite":
+        # The column is new, so any spread in the range is acceptable here
+        op.execute(
+            "UPDATE products SET serving_size = "
+            "ROUND(25 + ((random() % 701 + 701) % 701) / 100.0, 2)"
+        )
+    else:
+        # No portable in-database RNG: draw from a seeded Python RNG and send
+        # every parameter set in one executemany call
+        import random
+
+        connection = op.get_bind()
+        rng = random.Random(42)  # Fixed seed for consistent results
+        params = [
+            {"id": product_id, "size": round(rng.uniform(25.0, 32.0), 2)}
+            for (product_id,) in connection.exec_driver_sql("SELECT id FROM products")
+        ]
+        if params:
+            connection.execute(
+                sa.text("UPDATE products SET serving_size = :size WHERE id = :id"),
+                params,
+            )
 
 
 def downgrade() -> None:
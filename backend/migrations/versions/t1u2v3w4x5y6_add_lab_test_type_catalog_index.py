@@ -0,0 +1,26 @@
+"""add composite catalog index on lab_test_types
+
+Revision ID: t1u2v3w4x5y6
+Revises: s1t2u3v4w5x6
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "t1u2v3w4x5y6"
+down_revision = "s1t2u3v4w5x6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_test_category_active_name",
+        "lab_test_types",
+        ["test_category", "is_active", "test_name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_test_category_active_name", table_name="lab_test_types")
@@ -0,0 +1,26 @@
+"""add lot status/created_at index
+
+Revision ID: u1v2w3x4y5z6
+Revises: t1u2v3w4x5y6
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "u1v2w3x4y5z6"
+down_revision = "t1u2v3w4x5y6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_lot_status_created",
+        "lots",
+        ["status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_lot_status_created", table_name="lots")
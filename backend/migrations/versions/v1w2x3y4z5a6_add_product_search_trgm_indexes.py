@@ -0,0 +1,44 @@
+"""add trigram indexes for product search
+
+Revision ID: v1w2x3y4z5a6
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "v1w2x3y4z5a6"
+down_revision = "u1v2w3x4y5z6"
+branch_labels = None
+depends_on = None
+
+# Columns matched with ILIKE '%term%' by the product list search
+SEARCH_COLUMNS = ("brand", "product_name", "display_name", "flavor")
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes are PostgreSQL-only; SQLite keeps scanning
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Creating the extension needs a role allowed to CREATE EXTENSION
+    # (superuser, or a trusted-extension grant on PG13+). Where the migration
+    # role lacks that, have a DBA run this statement once beforehand.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"idx_product_{column}_trgm",
+            "products",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"idx_product_{column}_trgm", table_name="products")
@@ -0,0 +1,26 @@
+"""add lot status/updated_at index
+
+Revision ID: w1x2y3z4a5b6
+Revises: v1w2x3y4z5a6
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "w1x2y3z4a5b6"
+down_revision = "v1w2x3y4z5a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_lot_status_updated",
+        "lots",
+        ["status", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_lot_status_updated", table_name="lots")
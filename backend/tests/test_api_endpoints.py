@@ -185,6 +185,9 @@ class TestProductEndpoints:
         data = response.json()
         assert len(data["items"]) >= 1
         assert data["total"] >= 1
+        # The list reports spec counts, zero for a product without specs
+        assert data["items"][0]["required_test_count"] == 0
+        assert data["items"][0]["optional_test_count"] == 0
 
     def test_list_products_pagination(self, client, test_db):
         """Test product listing pagination."""
@@ -255,6 +258,9 @@ class TestProductEndpoints:
         data = response.json()
         assert data["id"] == test_product.id
         assert data["brand"] == test_product.brand
+        # Spec counts are only looked up by the list endpoint
+        assert data["required_test_count"] is None
+        assert data["optional_test_count"] is None
 
     def test_get_product_not_found(self, client):
         """Test getting non-existent product."""
@@ -293,6 +299,57 @@ class TestProductEndpoints:
         assert isinstance(data, list)
         assert test_product.brand in data
 
+    def test_bulk_import_products(self, client, test_db, test_product):
+        """Test bulk import cleans rows and skips duplicates and bad expiry."""
+        rows = [
+            # Matches the existing catalog product, ignoring case
+            {
+                "brand": "Test Brand",
+                "product_name": "Test Product",
+                "display_name": "test brand test product - vanilla",
+            },
+            {
+                "brand": " New Brand ",
+                "product_name": "Whey",
+                "display_name": "New Brand Whey",
+                "flavor": "  Chocolate ",
+                "size": "",
+                "version": " v2 ",
+            },
+            # Repeats an earlier row in the same upload
+            {
+                "brand": "New Brand",
+                "product_name": "Whey",
+                "display_name": "NEW BRAND WHEY",
+            },
+            {
+                "brand": "New Brand",
+                "product_name": "Isolate",
+                "display_name": "New Brand Isolate",
+                "expiry_duration_months": 0,
+            },
+        ]
+        response = client.post("/api/v1/products/bulk-import", json=rows)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_rows"] == 4
+        assert data["imported"] == 1
+        assert data["skipped"] == 3
+        assert data["errors"][0].startswith("Row 1:")
+        assert "already exists" in data["errors"][0]
+        assert data["errors"][1].startswith("Row 3:")
+        assert "already exists" in data["errors"][1]
+        assert data["errors"][2] == "Row 4: Expiry duration must be positive"
+
+        product = test_db.query(Product).filter(
+            Product.display_name == "New Brand Whey"
+        ).one()
+        assert product.brand == "New Brand"
+        assert product.flavor == "Chocolate"
+        assert product.size is None
+        assert product.version == "v2"
+        assert product.expiry_duration_months == 36
+
 
 # =============================================================================
 # LOT ENDPOINT TESTS
@@ -422,6 +479,33 @@ class TestLabTestTypeEndpoints:
         result = response.json()
         assert result["test_name"] == "E. coli"
 
+    def test_bulk_import_lab_test_types(self, client, test_db):
+        """Test bulk import cleans rows and skips blank and duplicate names."""
+        rows = [
+            {
+                "test_name": " Lead ",
+                "test_category": "Heavy Metals ",
+                "default_unit": " ppm ",
+                "default_specification": "   ",
+            },
+            {"test_name": "lead", "test_category": "Heavy Metals"},
+            {"test_name": "  ", "test_category": "Heavy Metals"},
+        ]
+        response = client.post("/api/v1/lab-test-types/bulk-import", json=rows)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["errors"] == [
+            "Row 2: Test 'lead' already exists",
+            "Row 3: Test name cannot be empty",
+        ]
+
+        lead = test_db.query(LabTestType).filter(LabTestType.test_name == "Lead").one()
+        assert lead.test_category == "Heavy Metals"
+        assert lead.default_unit == "ppm"
+        assert lead.default_specification is None
+        assert lead.is_active is True
+
 
 # =============================================================================
 # TEST RESULT ENDPOINT TESTS
@@ -0,0 +1,73 @@
+"""Tests for date range and bucketing helpers."""
+
+from datetime import date, datetime
+
+from app.utils.dates import (
+    MONTHLY_BUCKET_THRESHOLD_DAYS,
+    WEEKLY_BUCKET_THRESHOLD_DAYS,
+    bucket_daily_counts,
+    date_range_bounds,
+)
+
+
+class TestDateRangeBounds:
+    """Test suite for inclusive-to-half-open range conversion."""
+
+    def test_bounds_include_whole_last_day(self):
+        """The exclusive end is midnight after date_to."""
+        start, end = date_range_bounds(date(2024, 1, 1), date(2024, 1, 31))
+        assert start == datetime(2024, 1, 1)
+        assert end == datetime(2024, 2, 1)
+
+    def test_open_bounds(self):
+        """Missing dates leave the bound open."""
+        assert date_range_bounds(None, None) == (None, None)
+
+
+class TestBucketDailyCounts:
+    """Test suite for resampling daily counts into day/week/month buckets."""
+
+    # Wednesday 2024-01-03 and Monday 2024-01-08 fall in consecutive ISO weeks
+    DAILY = [
+        (date(2024, 1, 3), 1),
+        (date(2024, 1, 5), 2),
+        (date(2024, 1, 8), 4),
+        (date(2024, 2, 14), 8),
+    ]
+
+    def test_daily_at_weekly_threshold(self):
+        """Spans up to the weekly threshold keep one point per day."""
+        result = bucket_daily_counts(self.DAILY, WEEKLY_BUCKET_THRESHOLD_DAYS)
+        assert result == self.DAILY
+
+    def test_weekly_buckets_start_on_monday(self):
+        """Spans just over 90 days are summed per Monday-start week."""
+        result = bucket_daily_counts(self.DAILY, WEEKLY_BUCKET_THRESHOLD_DAYS + 1)
+        assert result == [
+            (date(2024, 1, 1), 3),
+            (date(2024, 1, 8), 4),
+            (date(2024, 2, 12), 8),
+        ]
+        assert all(bucket.weekday() == 0 for bucket, _ in result)
+
+    def test_weekly_at_monthly_threshold(self):
+        """A span of exactly two years is still bucketed weekly."""
+        result = bucket_daily_counts(self.DAILY, MONTHLY_BUCKET_THRESHOLD_DAYS)
+        assert result[0] == (date(2024, 1, 1), 3)
+
+    def test_monthly_buckets_start_on_first(self):
+        """Spans over two years are summed per calendar month."""
+        result = bucket_daily_counts(self.DAILY, MONTHLY_BUCKET_THRESHOLD_DAYS + 1)
+        assert result == [(date(2024, 1, 1), 7), (date(2024, 2, 1), 8)]
+
+    def test_iso_string_and_datetime_days(self):
+        """ISO date strings and datetimes are normalized to dates."""
+        result = bucket_daily_counts(
+            [("2024-01-05", 2), (datetime(2024, 1, 3, 15, 30), 1)],
+            WEEKLY_BUCKET_THRESHOLD_DAYS,
+        )
+        assert result == [(date(2024, 1, 3), 1), (date(2024, 1, 5), 2)]
+
+    def test_empty_input(self):
+        """No rows produce an empty series."""
+        assert bucket_daily_counts([], 30) == []
@@ -101,6 +101,21 @@ class TestLabTestTypeDatabase:
         assert saved.abbreviations is not None
         loaded_abbrevs = json.loads(saved.abbreviations)
         assert loaded_abbrevs == abbrevs
+
+    def test_abbreviation_list(self, test_db):
+        """Test abbreviation_list decodes JSON and tracks column changes."""
+        test_type = LabTestType(
+            test_name="Cadmium",
+            test_category="Heavy Metals",
+            abbreviations=json.dumps(["Cd"])
+        )
+        assert test_type.abbreviation_list == ["Cd"]
+
+        test_type.abbreviations = json.dumps(["Cd", "Cadmium (Cd)"])
+        assert test_type.abbreviation_list == ["Cd", "Cadmium (Cd)"]
+
+        test_type.abbreviations = "not json"
+        assert test_type.abbreviation_list == []
     
     def test_cascade_delete_prevention(self, test_db, sample_product, sample_lab_test_types):
         """Test that lab test types can't be deleted if in use."""
@@ -246,6 +261,24 @@ class TestLabTestTypeService:
         metal_tests = service.get_by_category(test_db, "Heavy Metals")
         assert len(metal_tests) == 2
         assert all(t.test_category == "Heavy Metals" for t in metal_tests)
+
+    def test_clear_caches_for_clears_registered_caches(self, test_db):
+        """Test clear_caches_for clears every cache registered on LabTestType."""
+        # Importing the lots endpoints registers the lot list cache
+        from app.api.v1.endpoints import lots  # noqa: F401
+        from app.utils.cache import (
+            clear_caches_for,
+            lab_test_type_categories_cache,
+            lot_list_cache,
+        )
+
+        lab_test_type_categories_cache.get_or_set("key", lambda: "stale")
+        lot_list_cache.get_or_set("key", lambda: "stale")
+
+        clear_caches_for(LabTestType)
+
+        assert lab_test_type_categories_cache.get_or_set("key", lambda: "fresh") == "fresh"
+        assert lot_list_cache.get_or_set("key", lambda: "fresh") == "fresh"
     
     def test_get_all_grouped(self, test_db, sample_lab_test_types):
         """Test getting all tests grouped by category."""
@@ -259,6 +259,12 @@ class TestPDFParserIntegration:
         assert len(pending) == 1
         assert pending[0].pdf_filename == "test1.pdf"
         
+        # Test filtering by several statuses in one query
+        needs_review = parser.review_parsing_queue(
+            test_db, [ParsingStatus.PENDING, ParsingStatus.FAILED]
+        )
+        assert {entry.pdf_filename for entry in needs_review} == {"test1.pdf", "test3.pdf"}
+        
         # Test getting all entries
         all_entries = parser.review_parsing_queue(test_db)
         assert len(all_entries) == 3
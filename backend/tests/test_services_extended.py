@@ -257,6 +257,51 @@ class TestApprovalServiceExtended:
         # Result stays in DRAFT status when rejected
         assert rejected.status == TestResultStatus.DRAFT
 
+    def test_count_actions(self, test_db, sample_lot, sample_user):
+        """Test counting approval actions since a timestamp."""
+        service = ApprovalService()
+        start = datetime.utcnow() - timedelta(minutes=1)
+
+        result = TestResult(
+            lot_id=sample_lot.id,
+            test_type="CountTest",
+            result_value="Pass",
+            status=TestResultStatus.DRAFT
+        )
+        test_db.add(result)
+        test_db.commit()
+
+        assert service.count_actions(test_db, since=start) == 0
+
+        service.approve_test_result(test_db, result.id, sample_user.id)
+
+        assert service.count_actions(test_db, since=start) == 1
+        assert service.count_actions(test_db, AuditAction.REJECT, since=start) == 0
+        assert service.count_actions(
+            test_db, since=datetime.utcnow() + timedelta(minutes=1)
+        ) == 0
+
+    def test_get_approval_metrics(self, test_db, sample_test_results):
+        """Test approval metrics are aggregated per status."""
+        service = ApprovalService()
+
+        metrics = service.get_approval_metrics(test_db)
+
+        assert metrics["total_test_results"] == 3
+        assert metrics["approved_results"] == 2
+        assert metrics["pending_approval"] == 1
+
+    def test_check_test_completeness_bulk(self, test_db, sample_lot):
+        """Test bulk completeness check returns an entry per requested lot."""
+        service = ApprovalService()
+
+        results = service.check_test_completeness_bulk(test_db, [sample_lot.id, 99999])
+
+        assert set(results) == {sample_lot.id, 99999}
+        assert results[sample_lot.id] == service.check_test_completeness(test_db, sample_lot.id)
+        assert results[99999]["is_complete"] is False
+        assert results[99999]["status_recommendation"] == LotStatus.AWAITING_RESULTS
+
     def test_approval_service_exists(self, test_db):
         """Test ApprovalService can be instantiated."""
         service = ApprovalService()
@@ -286,6 +331,15 @@ class TestProductServiceExtended:
         assert len(brands) >= 1
         assert sample_product.brand in brands
 
+    def test_get_spec_counts(self, test_db, sample_product_with_specs):
+        """Test required/optional spec counts are aggregated per product."""
+        service = ProductService()
+
+        counts = service.get_spec_counts(test_db, [sample_product_with_specs.id, 99999])
+
+        assert counts == {sample_product_with_specs.id: (4, 1)}
+        assert service.get_spec_counts(test_db, []) == {}
+
     def test_product_service_exists(self, test_db):
         """Test ProductService can be instantiated."""
         service = ProductService()
@@ -333,3 +387,55 @@ class TestSampleService:
         """Test SampleService can be instantiated."""
         service = SampleService()
         assert service is not None
+
+
+# =============================================================================
+# DAANE COC SERVICE TESTS
+# =============================================================================
+
+class TestDaaneCOCService:
+    """Tests for DaaneCOCService rendering."""
+
+    def test_render_coc_xlsx(self):
+        """Test the COC XLSX renders test rows and reuses cached bytes."""
+        from io import BytesIO
+
+        import openpyxl
+
+        from app.services.daane_coc_service import DaaneCOCService, DaaneTestRow
+
+        service = DaaneCOCService()
+        render_args = dict(
+            po_number="PO-25001-001",
+            authorizer_name="QC Manager",
+            authorizer_signature="QC",
+            sample_id="250101-001",
+            lot_number="LOT001",
+            method_suitability="None",
+            special_instructions="Serving Size = 30g",
+            tests=[
+                DaaneTestRow(
+                    test_name="Lead",
+                    test_method="ICP-MS",
+                    specification="< 0.5 ppm",
+                    unit="ppm",
+                    daane_method="Heavy Metals (ICP-MS)",
+                ),
+                DaaneTestRow(
+                    test_name="Salmonella",
+                    test_method=None,
+                    specification=None,
+                    unit=None,
+                    daane_method=None,
+                ),
+            ],
+        )
+
+        content = service._render_coc(**render_args)
+
+        ws = openpyxl.load_workbook(BytesIO(content))["Chain of Custody"]
+        assert ws["A22"].value == "Heavy Metals (ICP-MS)"
+        assert ws["O22"].value == "< 0.5 ppm"
+        assert ws["T22"].value == "ppm"
+        assert not ws["A23"].value
+        assert service._render_coc(**render_args) is content
@@ -6,6 +6,7 @@ export interface LotFilters {
   page_size?: number
   search?: string
   status?: LotStatus
+  statuses?: LotStatus[]
   exclude_statuses?: LotStatus[]
   lot_type?: LotType
 }
@@ -64,6 +65,9 @@ export const lotsApi = {
     if (filters.page_size) params.append("page_size", filters.page_size.toString())
     if (filters.search) params.append("search", filters.search)
     if (filters.status) params.append("status", filters.status)
+    if (filters.statuses) {
+      filters.statuses.forEach(status => params.append("statuses", status))
+    }
     if (filters.exclude_statuses) {
       filters.exclude_statuses.forEach(status => params.append("exclude_statuses", status))
     }
@@ -46,25 +46,40 @@ export function BulkImportGrid<T extends BulkImportRow>({
   // Suppress unused warning - will be used for deferred validation
   void markRowTouched
 
+  // Edits replace the edited row object, so every other row reuses its
+  // previous validation result instead of re-running the schema
+  const validatedRows = useRef(new WeakMap<T, T>())
+
   // Validate only touched rows - untouched rows don't show errors
   const validatedData = useMemo(() => {
     return data.map((row) => {
+      const cached = validatedRows.current.get(row)
+      if (cached) return cached
+
+      let validated: T
       // Only validate if row has been touched
       if (!row._touched) {
-        return { ...row, _errors: undefined }
-      }
-      const { valid, errors } = validateRow(row)
-      return {
-        ...row,
-        _errors: valid ? undefined : errors,
+        validated = { ...row, _errors: undefined }
+      } else {
+        const { valid, errors } = validateRow(row)
+        validated = {
+          ...row,
+          _errors: valid ? undefined : errors,
+        }
       }
+      validatedRows.current.set(row, validated)
+      return validated
     })
   }, [data, validateRow])
 
   // Count valid rows among touched rows only, untouched rows don't count as valid or error
-  const touchedRows = validatedData.filter((r) => r._touched)
-  const validRowCount = touchedRows.filter((r) => !r._errors?.length).length
-  const errorRowCount = touchedRows.filter((r) => r._errors?.length).length
+  let validRowCount = 0
+  let errorRowCount = 0
+  for (const row of validatedData) {
+    if (!row._touched) continue
+    if (row._errors?.length) errorRowCount++
+    else validRowCount++
+  }
 
   // TanStack Table instance
   const table = useReactTable({
@@ -286,6 +301,18 @@ export function BulkImportGrid<T extends BulkImportRow>({
   )
 }
 
+// Lowercased error text per row, shared by every cell in that row
+const rowErrorText = new WeakMap<string[], string>()
+
+function getRowErrorText(errors: string[]): string {
+  let text = rowErrorText.get(errors)
+  if (text === undefined) {
+    text = errors.join("\n").toLowerCase()
+    rowErrorText.set(errors, text)
+  }
+  return text
+}
+
 /**
  * Factory function to create editable cell renderer
  * Pattern from GridShowcase - makes TanStack Table work like Excel
@@ -344,16 +371,13 @@ export function createEditableCell<_T extends BulkImportRow>(
       )
     }
 
-    const hasError = info.row.original._errors?.some((err: string) => {
-      const errLower = err.toLowerCase()
-      const colLower = String(columnId).toLowerCase().replace(/_/g, '')
-      const colWithUnderscores = String(columnId).toLowerCase()
-      // Check Zod format "fieldName: message" or if error contains field name
-      return errLower.startsWith(colWithUnderscores + ':') ||
-             errLower.startsWith(colLower + ':') ||
-             errLower.includes(colWithUnderscores) ||
-             errLower.includes(colLower)
-    })
+    // Matches Zod "fieldName: message" errors or any error naming the field
+    const errors = info.row.original._errors
+    const colWithUnderscores = String(columnId).toLowerCase()
+    const colLower = colWithUnderscores.replace(/_/g, '')
+    const errorText = errors?.length ? getRowErrorText(errors) : ""
+    const hasError = errorText !== "" &&
+      (errorText.includes(colWithUnderscores) || errorText.includes(colLower))
 
     return (
       <div
@@ -35,6 +35,19 @@ const createEmptyRow = (): LabTestTypeGridRow => ({
   description: "",
 })
 
+const columnHelper = createColumnHelper<LabTestTypeGridRow>()
+
+// Column order for keyboard navigation; module-level so hook deps stay stable
+const EDITABLE_COLUMNS = [
+  "test_name",
+  "test_category",
+  "default_unit",
+  "test_method",
+  "default_specification",
+  "abbreviations",
+  "description",
+]
+
 export function LabTestTypeBulkImport() {
   const [data, setData] = useState<LabTestTypeGridRow[]>([createEmptyRow()])
   const [editingCell, setEditingCell] = useState<EditingCell | null>(null)
@@ -42,16 +55,6 @@ export function LabTestTypeBulkImport() {
 
   const bulkImportMutation = useBulkImportLabTestTypes()
 
-  const editableColumns = [
-    "test_name",
-    "test_category",
-    "default_unit",
-    "test_method",
-    "default_specification",
-    "abbreviations",
-    "description",
-  ]
-
   // Handle cell value updates - also marks row as touched for validation
   const updateCellValue = useCallback(
     (rowId: string, columnId: string, value: any) => {
@@ -70,7 +73,7 @@ export function LabTestTypeBulkImport() {
       columnId: string,
       saveAndExit?: () => void
     ) => {
-      const columnIndex = editableColumns.indexOf(columnId)
+      const columnIndex = EDITABLE_COLUMNS.indexOf(columnId)
 
       if (e.key === "Tab") {
         e.preventDefault()
@@ -80,7 +83,7 @@ export function LabTestTypeBulkImport() {
         }
 
         const totalRows = data.length
-        const totalCols = editableColumns.length
+        const totalCols = EDITABLE_COLUMNS.length
 
         let newRowIndex = rowIndex
         let newColIndex = columnIndex
@@ -120,12 +123,10 @@ export function LabTestTypeBulkImport() {
         setEditValue(String((row as any)[columnId] || ""))
       }
     },
-    [data, editableColumns]
+    [data]
   )
 
   // Column definitions
-  const columnHelper = createColumnHelper<LabTestTypeGridRow>()
-
   const columns = useMemo(
     () => [
       // Checkbox column
@@ -155,7 +156,7 @@ export function LabTestTypeBulkImport() {
         header: "Test Name *",
         cell: createEditableCell(
           "test_name",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -173,7 +174,7 @@ export function LabTestTypeBulkImport() {
         header: "Category *",
         cell: (info) => {
           const rowIndex = info.row.index
-          const colIndex = editableColumns.indexOf("test_category")
+          const colIndex = EDITABLE_COLUMNS.indexOf("test_category")
           const isEditing =
             editingCell?.rowId === info.row.original.id &&
             editingCell?.columnId === "test_category"
@@ -247,7 +248,7 @@ export function LabTestTypeBulkImport() {
         header: "Unit",
         cell: createEditableCell(
           "default_unit",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -265,7 +266,7 @@ export function LabTestTypeBulkImport() {
         header: "Method",
         cell: createEditableCell(
           "test_method",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -283,7 +284,7 @@ export function LabTestTypeBulkImport() {
         header: "Spec",
         cell: createEditableCell(
           "default_specification",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -301,7 +302,7 @@ export function LabTestTypeBulkImport() {
         header: "Abbrev",
         cell: createEditableCell(
           "abbreviations",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -319,7 +320,7 @@ export function LabTestTypeBulkImport() {
         header: "Description",
         cell: createEditableCell(
           "description",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -333,8 +334,6 @@ export function LabTestTypeBulkImport() {
       }),
     ],
     [
-      columnHelper,
-      editableColumns,
       editingCell,
       editValue,
       updateCellValue,
@@ -402,7 +401,7 @@ export function LabTestTypeBulkImport() {
       data={data}
       setData={setData}
       columns={columns}
-      editableColumns={editableColumns}
+      editableColumns={EDITABLE_COLUMNS}
       schema={labTestTypeGridSchema}
       validateRow={(row) => validateRowSchema(labTestTypeGridSchema, row)}
       onSubmit={handleSubmit}
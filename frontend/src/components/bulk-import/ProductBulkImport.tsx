@@ -26,6 +26,19 @@ const createEmptyRow = (): ProductGridRow => ({
   expiry_duration_months: 36,
 })
 
+const columnHelper = createColumnHelper<ProductGridRow>()
+
+// Column order for keyboard navigation; module-level so hook deps stay stable
+const EDITABLE_COLUMNS = [
+  "brand",
+  "product_name",
+  "flavor",
+  "size",
+  "version",
+  "serving_size",
+  "expiry_duration_months",
+]
+
 export function ProductBulkImport() {
   const [data, setData] = useState<ProductGridRow[]>([createEmptyRow()])
   const [editingCell, setEditingCell] = useState<EditingCell | null>(null)
@@ -33,16 +46,6 @@ export function ProductBulkImport() {
 
   const bulkImportMutation = useBulkImportProducts()
 
-  const editableColumns = [
-    "brand",
-    "product_name",
-    "flavor",
-    "size",
-    "version",
-    "serving_size",
-    "expiry_duration_months",
-  ]
-
   // Handle cell value updates - also marks row as touched for validation
   const updateCellValue = useCallback(
     (rowId: string, columnId: string, value: any) => {
@@ -61,7 +64,7 @@ export function ProductBulkImport() {
       columnId: string,
       saveAndExit?: () => void
     ) => {
-      const columnIndex = editableColumns.indexOf(columnId)
+      const columnIndex = EDITABLE_COLUMNS.indexOf(columnId)
 
       if (e.key === "Tab") {
         e.preventDefault()
@@ -71,7 +74,7 @@ export function ProductBulkImport() {
         }
 
         const totalRows = data.length
-        const totalCols = editableColumns.length
+        const totalCols = EDITABLE_COLUMNS.length
 
         let newRowIndex = rowIndex
         let newColIndex = columnIndex
@@ -111,12 +114,10 @@ export function ProductBulkImport() {
         setEditValue(String((row as any)[columnId] || ""))
       }
     },
-    [data, editableColumns]
+    [data]
   )
 
   // Column definitions
-  const columnHelper = createColumnHelper<ProductGridRow>()
-
   const columns = useMemo(
     () => [
       // Checkbox column
@@ -146,7 +147,7 @@ export function ProductBulkImport() {
         header: "Brand *",
         cell: createEditableCell(
           "brand",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -164,7 +165,7 @@ export function ProductBulkImport() {
         header: "Product Name *",
         cell: createEditableCell(
           "product_name",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -182,7 +183,7 @@ export function ProductBulkImport() {
         header: "Flavor",
         cell: createEditableCell(
           "flavor",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -200,7 +201,7 @@ export function ProductBulkImport() {
         header: "Size",
         cell: createEditableCell(
           "size",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -218,7 +219,7 @@ export function ProductBulkImport() {
         header: "Version",
         cell: createEditableCell(
           "version",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -257,7 +258,7 @@ export function ProductBulkImport() {
         header: "Serving (g)",
         cell: createEditableCell(
           "serving_size",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -275,7 +276,7 @@ export function ProductBulkImport() {
         header: "Expiry (mo)",
         cell: createEditableCell(
           "expiry_duration_months",
-          editableColumns,
+          EDITABLE_COLUMNS,
           editingCell,
           editValue,
           setEditingCell,
@@ -289,8 +290,6 @@ export function ProductBulkImport() {
       }),
     ],
     [
-      columnHelper,
-      editableColumns,
       editingCell,
       editValue,
       updateCellValue,
@@ -407,7 +406,7 @@ export function ProductBulkImport() {
       data={data}
       setData={setData}
       columns={columns}
-      editableColumns={editableColumns}
+      editableColumns={EDITABLE_COLUMNS}
       schema={productGridSchema}
       validateRow={(row) => validateRowSchema(productGridSchema, row)}
       onSubmit={handleSubmit}
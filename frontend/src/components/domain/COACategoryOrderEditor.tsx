@@ -27,6 +27,21 @@ import {
   useActiveCategories,
 } from "@/hooks/useCoaCategoryOrder"
 
+const CATEGORY_COLORS: Record<string, string> = {
+  Microbiological: "bg-emerald-100 text-emerald-700",
+  "Heavy Metals": "bg-red-100 text-red-700",
+  Pesticides: "bg-orange-100 text-orange-700",
+  Nutritional: "bg-blue-100 text-blue-700",
+  Physical: "bg-violet-100 text-violet-700",
+  Chemical: "bg-amber-100 text-amber-700",
+  Allergens: "bg-pink-100 text-pink-700",
+  Organoleptic: "bg-teal-100 text-teal-700",
+}
+
+function getCategoryColor(category: string) {
+  return CATEGORY_COLORS[category] || "bg-slate-100 text-slate-600"
+}
+
 interface SortableItemProps {
   id: string
   category: string
@@ -137,20 +152,6 @@ export function COACategoryOrderEditor() {
     }
   }
 
-  const getCategoryColor = (category: string) => {
-    const colors: Record<string, string> = {
-      Microbiological: "bg-emerald-100 text-emerald-700",
-      "Heavy Metals": "bg-red-100 text-red-700",
-      Pesticides: "bg-orange-100 text-orange-700",
-      Nutritional: "bg-blue-100 text-blue-700",
-      Physical: "bg-violet-100 text-violet-700",
-      Chemical: "bg-amber-100 text-amber-700",
-      Allergens: "bg-pink-100 text-pink-700",
-      Organoleptic: "bg-teal-100 text-teal-700",
-    }
-    return colors[category] || "bg-slate-100 text-slate-600"
-  }
-
   const isLoading = isLoadingOrder || isLoadingCategories
   const isMutating = updateMutation.isPending || resetMutation.isPending
 
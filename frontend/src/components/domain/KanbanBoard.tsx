@@ -1,4 +1,4 @@
-import { useState, useMemo } from "react"
+import { memo, useState, useMemo } from "react"
 import { motion, AnimatePresence } from "framer-motion"
 import { RefreshCw } from "lucide-react"
 import { cn } from "@/lib/utils"
@@ -96,6 +96,19 @@ interface KanbanBoardProps {
  */
 type StalenessLevel = "critical" | "warning" | "normal"
 
+// Class lookups shared by every card instead of rebuilt per render
+const STALENESS_BORDER_CLASS: Record<StalenessLevel, string> = {
+  critical: "border-red-400 border-l-4",
+  warning: "border-orange-400 border-l-4",
+  normal: "border-slate-200",
+}
+
+const STALENESS_BADGE_CLASS: Record<StalenessLevel, string> = {
+  critical: "bg-red-100 text-red-700",
+  warning: "bg-orange-100 text-orange-700",
+  normal: "bg-slate-100 text-slate-600",
+}
+
 function calculateStaleness(
   lot: Lot,
   warningDays: number,
@@ -139,28 +152,15 @@ interface KanbanCardProps {
 }
 
 function KanbanCardContent({ lot, staleness, onClick, isHighlighted }: Omit<KanbanCardProps, 'index'>) {
-  const borderClass = {
-    critical: "border-red-400 border-l-4",
-    warning: "border-orange-400 border-l-4",
-    normal: "border-slate-200",
-  }[staleness.level]
+  const borderClass = STALENESS_BORDER_CLASS[staleness.level]
 
   // Glow animation styles for highlighted cards
   const glowStyle = isHighlighted ? {
     animation: 'glow-fade 2s ease-in-out forwards',
   } : undefined
 
-  // Get days badge configuration based on staleness
-  const getDaysBadge = () => {
-    const colorMap = {
-      critical: "bg-red-100 text-red-700",
-      warning: "bg-orange-100 text-orange-700",
-      normal: "bg-slate-100 text-slate-600",
-    }
-    return { days: staleness.daysOld, color: colorMap[staleness.level] }
-  }
-
-  const daysBadge = getDaysBadge()
+  // Days badge configuration based on staleness
+  const daysBadge = { days: staleness.daysOld, color: STALENESS_BADGE_CLASS[staleness.level] }
 
   // Get first product for display
   const product = lot.products?.[0] ?? null
@@ -305,7 +305,8 @@ interface KanbanColumnProps {
   highlightRef?: string | null
 }
 
-function KanbanColumn({ config, lots, onCardClick, highlightRef }: KanbanColumnProps) {
+// Memoized so a column re-renders only when its own lots or props change
+const KanbanColumn = memo(function KanbanColumn({ config, lots, onCardClick, highlightRef }: KanbanColumnProps) {
   // Auto-expand if highlighted card would be hidden in collapsed view
   const highlightedIndex = highlightRef
     ? lots.findIndex(lot => lot.reference_number === highlightRef)
@@ -393,7 +394,7 @@ function KanbanColumn({ config, lots, onCardClick, highlightRef }: KanbanColumnP
       </motion.div>
     </div>
   )
-}
+})
 
 /**
  * KanbanBoard displays lots organized by status in columns.
@@ -406,7 +407,7 @@ function KanbanColumn({ config, lots, onCardClick, highlightRef }: KanbanColumnP
  * - Maximum 8 cards per column with "+X more" button to expand
  * - Click cards to trigger onCardClick callback
  */
-export function KanbanBoard({
+export const KanbanBoard = memo(function KanbanBoard({
   lots,
   onCardClick,
   staleWarningDays = 7,
@@ -468,4 +469,4 @@ export function KanbanBoard({
       ))}
     </div>
   )
-}
+})
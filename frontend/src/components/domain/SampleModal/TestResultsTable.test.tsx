@@ -0,0 +1,67 @@
+import { describe, it, expect, vi } from 'vitest'
+import { render, screen, fireEvent, waitFor } from '@testing-library/react'
+import { TestResultsTable } from './TestResultsTable'
+import type { TestResultRow } from '@/types'
+
+const row: TestResultRow = {
+  id: 1,
+  lot_id: 1,
+  test_type: 'Lead',
+  result_value: null,
+  unit: 'ppm',
+  test_date: null,
+  pdf_source: null,
+  confidence_score: null,
+  status: 'draft',
+  specification: '< 0.5',
+  method: 'HPLC',
+  notes: null,
+  approved_by_id: null,
+  approved_at: null,
+  created_at: '2026-01-01T00:00:00Z',
+  updated_at: null,
+  passFailStatus: null,
+  isFlagged: false,
+  isAdditionalTest: false,
+}
+
+function commitMethod(value: string) {
+  fireEvent.click(screen.getByText('HPLC'))
+  const input = screen.getByDisplayValue('HPLC')
+  fireEvent.change(input, { target: { value } })
+  fireEvent.keyDown(input, { key: 'Enter' })
+}
+
+describe('TestResultsTable', () => {
+  it('does not resend a value that was already submitted', async () => {
+    const onUpdateResult = vi.fn().mockResolvedValue(undefined)
+    render(
+      <TestResultsTable testResults={[row]} productSpecs={[]} onUpdateResult={onUpdateResult} />
+    )
+
+    commitMethod('USP')
+    await waitFor(() => expect(onUpdateResult).toHaveBeenCalledTimes(1))
+    commitMethod('USP')
+
+    expect(onUpdateResult).toHaveBeenCalledTimes(1)
+  })
+
+  it('resends the same value after a failed save', async () => {
+    const onUpdateResult = vi
+      .fn()
+      .mockRejectedValueOnce(new Error('network'))
+      .mockResolvedValue(undefined)
+    render(
+      <TestResultsTable testResults={[row]} productSpecs={[]} onUpdateResult={onUpdateResult} />
+    )
+
+    commitMethod('USP')
+    await waitFor(() => expect(onUpdateResult).toHaveBeenCalledTimes(1))
+    // Let the rejection handler run before retrying
+    await new Promise((resolve) => setTimeout(resolve, 0))
+    commitMethod('USP')
+
+    await waitFor(() => expect(onUpdateResult).toHaveBeenCalledTimes(2))
+    expect(onUpdateResult).toHaveBeenLastCalledWith(1, 'method', 'USP')
+  })
+})
@@ -1,4 +1,4 @@
-import { useState, useMemo, useCallback, useRef, useImperativeHandle, forwardRef, useEffect } from "react"
+import { useState, useMemo, useCallback, useRef, useImperativeHandle, forwardRef, useEffect, memo } from "react"
 import {
   useReactTable,
   getCoreRowModel,
@@ -25,7 +25,7 @@ interface TestResultsTableProps {
   testResults: TestResultRow[]
   /** Product specifications (for reference) - reserved for future use */
   productSpecs: TestSpecInProduct[]
-  /** Callback when a result is updated */
+  /** Callback when a result is updated; rejects when the save fails */
   onUpdateResult: (id: number, field: string, value: string) => Promise<void>
   /** Whether updates are in progress - reserved for future use */
   isUpdating?: boolean
@@ -61,8 +61,9 @@ const columnHelper = createColumnHelper<TestResultRow>()
  * Tab navigation: Result → Method → Notes → next row's Result
  * Enter: Save and move down to same column in next row
  * Save on row exit (not on every cell change)
+ * Memoized so modal-level state (uploads, dialogs, filters) doesn't re-render the grid
  */
-export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTableProps>(
+export const TestResultsTable = memo(forwardRef<TestResultsTableHandle, TestResultsTableProps>(
   function TestResultsTable(
     {
       testResults,
@@ -82,9 +83,33 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
   // Refs for input elements (set when in editing mode)
   const inputRefs = useRef<Map<string, HTMLInputElement | HTMLSelectElement>>(new Map())
 
+  // Reverse lookup from input element to its cell, so the Tab handler doesn't
+  // have to scan and parse the string keys above (which broke on negative
+  // placeholder row ids like "-5-result_value")
+  const inputCells = useRef<WeakMap<Element, { rowId: number; columnId: EditableColumn }>>(new WeakMap())
+
+  const registerInput = useCallback(
+    (rowId: number, columnId: string, el: HTMLInputElement | HTMLSelectElement | null) => {
+      if (!el) return
+      inputRefs.current.set(`${rowId}-${columnId}`, el)
+      inputCells.current.set(el, { rowId, columnId: columnId as EditableColumn })
+    },
+    []
+  )
+
   // Track pending tab navigation - when set, endEdit should navigate to this cell instead of clearing
   const pendingTabNavigation = useRef<EditingCell | null>(null)
 
+  // Last value submitted per "rowId-field". The testResults prop only catches
+  // up after the save round-trips, so the blur that follows a Tab/Enter commit
+  // must compare against what was just sent, not against the prop
+  const lastSubmitted = useRef<Map<string, string>>(new Map())
+
+  // Fresh rows from the server supersede anything submitted before them
+  useEffect(() => {
+    lastSubmitted.current.clear()
+  }, [testResults])
+
   // Expose methods to parent
   useImperativeHandle(
     ref,
@@ -128,23 +153,11 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
 
       // Check if active element is one of our tracked inputs
       const activeEl = document.activeElement
-      let currentRowId: number | null = null
-      let currentColumnId: EditableColumn | null = null
-
-      // Find which of our inputs is focused
-      for (const [key, input] of inputRefs.current.entries()) {
-        if (input === activeEl) {
-          const dashIndex = key.indexOf('-')
-          const rowIdStr = key.substring(0, dashIndex)
-          const colId = key.substring(dashIndex + 1) as EditableColumn
-          currentRowId = parseInt(rowIdStr, 10)
-          currentColumnId = colId
-          break
-        }
-      }
+      const cell = activeEl ? inputCells.current.get(activeEl) : undefined
 
       // Not our input - let Radix handle it normally
-      if (currentRowId === null || currentColumnId === null) return
+      if (!cell) return
+      const { rowId: currentRowId, columnId: currentColumnId } = cell
 
       // KILL the event before Radix focus trap sees it
       e.stopImmediatePropagation()
@@ -312,10 +325,29 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
     setEditingCell({ rowId: nextRow.id, columnId: currentColumn })
   }, [testResults])
 
-  // Handle update - save immediately
+  // Handle update - save immediately, but only when the value actually changed
+  // (Tab/Enter and the following blur both report the cell, and tabbing
+  // through untouched cells would otherwise PATCH every one of them; on
+  // placeholder rows a repeat would create the result twice)
   const handleCellChange = useCallback((rowId: number, field: string, value: string) => {
-    onUpdateResult(rowId, field, value)
-  }, [onUpdateResult])
+    const key = `${rowId}-${field}`
+    const submitted = lastSubmitted.current.get(key)
+    if (submitted !== undefined) {
+      if (submitted === value) return
+    } else {
+      const row = testResults.find((r) => r.id === rowId)
+      const current = row?.[field as keyof TestResultRow]
+      if (row && (current ?? "") === value) return
+    }
+    lastSubmitted.current.set(key, value)
+    onUpdateResult(rowId, field, value).catch(() => {
+      // The save failed (the parent already showed a toast), so the same
+      // value must go out again on retry - unless a newer one superseded it
+      if (lastSubmitted.current.get(key) === value) {
+        lastSubmitted.current.delete(key)
+      }
+    })
+  }, [onUpdateResult, testResults])
 
   // Start editing a cell
   const startEdit = useCallback((rowId: number, columnId: string) => {
@@ -403,11 +435,7 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
                 onChange={(value) => handleCellChange(row.id, "result_value", value)}
                 onTab={(isShift) => handleTabNavigation(row.id, "result_value", isShift)}
                 onEnter={() => handleEnterNavigation(row.id, "result_value")}
-                onInputRef={(el) => {
-                  if (el) {
-                    inputRefs.current.set(`${row.id}-result_value`, el)
-                  }
-                }}
+                onInputRef={(el) => registerInput(row.id, "result_value", el)}
               />
               {/* Show original value if test was retested */}
               {hasBeenRetested && (
@@ -472,9 +500,7 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
           return (
             <input
               type="text"
-              ref={(el) => {
-                if (el) inputRefs.current.set(`${row.id}-method`, el)
-              }}
+              ref={(el) => registerInput(row.id, "method", el)}
               autoFocus
               defaultValue={info.getValue() || ""}
               onBlur={(e) => {
@@ -549,9 +575,7 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
           return (
             <input
               type="text"
-              ref={(el) => {
-                if (el) inputRefs.current.set(`${row.id}-notes`, el)
-              }}
+              ref={(el) => registerInput(row.id, "notes", el)}
               autoFocus
               defaultValue={info.getValue() || ""}
               onBlur={(e) => {
@@ -595,7 +619,7 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
         },
       }),
     ],
-    [editingCell, disabled, startEdit, endEdit, handleCellChange, handleTabNavigation, handleEnterNavigation, savingRowId, testResults, navigateToCell, inputRefs]
+    [editingCell, disabled, startEdit, endEdit, handleCellChange, handleTabNavigation, handleEnterNavigation, savingRowId, testResults, navigateToCell, registerInput]
   )
 
   const table = useReactTable({
@@ -665,4 +689,4 @@ export const TestResultsTable = forwardRef<TestResultsTableHandle, TestResultsTa
       </div>
     </div>
   )
-})
+}))
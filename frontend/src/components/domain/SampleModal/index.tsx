@@ -32,6 +32,7 @@ import { SendForRetestDialog } from "@/components/domain/SendForRetestDialog"
 import type {
   Lot,
   LotStatus,
+  TestResult,
   TestResultRow,
   TestFilterStatus,
   TestSpecInProduct,
@@ -257,9 +258,11 @@ export function SampleModal({
   }, [retestData])
 
   // Mutations
-  const updateTestResultMutation = useUpdateTestResult()
-  const createTestResultMutation = useCreateTestResult()
-  const deleteTestResultMutation = useDeleteTestResult()
+  // Only the stable mutateAsync functions are used, so the save callbacks
+  // below (and the memoized results table) aren't recreated on every render
+  const { mutateAsync: updateTestResult } = useUpdateTestResult()
+  const { mutateAsync: createTestResult } = useCreateTestResult()
+  const { mutateAsync: deleteTestResult } = useDeleteTestResult()
   const uploadMutation = useUploadPdf()
   const submitForReviewMutation = useSubmitForReview()
 
@@ -306,12 +309,19 @@ export function SampleModal({
   // Transform specs + test results into rows
   // IMPORTANT: Start from specs to show ALL required tests, then merge with existing results
   const testResultRows: TestResultRow[] = useMemo(() => {
+    // Index results by test_type once so each spec lookup is O(1)
+    // (first result wins, matching the previous find() behaviour)
+    const resultsByTestType = new Map<string, TestResult>()
+    for (const result of testResultsData?.items ?? []) {
+      if (!resultsByTestType.has(result.test_type)) {
+        resultsByTestType.set(result.test_type, result)
+      }
+    }
+
     // Build rows from specs first - these are the rows we MUST show
     const rows: TestResultRow[] = mergedTestSpecs.map((spec) => {
       // Find matching test result by test_type name
-      const matchingResult = testResultsData?.items?.find(
-        (r) => r.test_type === spec.test_name
-      )
+      const matchingResult = resultsByTestType.get(spec.test_name)
 
       if (matchingResult) {
         // Existing result - calculate pass/fail
@@ -355,8 +365,9 @@ export function SampleModal({
     })
 
     // Add any additional tests (results without matching specs = ad-hoc tests)
+    const specTestNames = new Set(mergedTestSpecs.map((s) => s.test_name))
     const additionalResults = testResultsData?.items?.filter(
-      (r) => !mergedTestSpecs.some((s) => s.test_name === r.test_type)
+      (r) => !specTestNames.has(r.test_type)
     ) ?? []
 
     for (const result of additionalResults) {
@@ -497,7 +508,7 @@ export function SampleModal({
           // Placeholder row (negative ID) - need to CREATE a new TestResult
           const spec = mergedTestSpecs.find((s) => s.id === -id)
           if (spec && lot) {
-            await createTestResultMutation.mutateAsync({
+            await createTestResult({
               lot_id: lot.id,
               test_type: spec.test_name,
               [field]: value,
@@ -508,7 +519,7 @@ export function SampleModal({
           }
         } else {
           // Existing row - UPDATE
-          await updateTestResultMutation.mutateAsync({
+          await updateTestResult({
             id,
             data: { [field]: value },
           })
@@ -524,11 +535,13 @@ export function SampleModal({
         toast.error("Failed to save", {
           description: "Please try again",
         })
+        // Let the table forget the value so a retry isn't skipped as unchanged
+        throw error
       } finally {
         setSavingRowId(null)
       }
     },
-    [updateTestResultMutation, createTestResultMutation, mergedTestSpecs, lot, queryClient]
+    [updateTestResult, createTestResult, mergedTestSpecs, lot, queryClient]
   )
 
   // Handle adding a new ad-hoc test
@@ -536,7 +549,7 @@ export function SampleModal({
     async (testName: string, _labTestTypeId: number) => {
       if (!lot) return
       try {
-        await createTestResultMutation.mutateAsync({
+        await createTestResult({
           lot_id: lot.id,
           test_type: testName,
           result_value: undefined,
@@ -547,20 +560,20 @@ export function SampleModal({
         toast.error("Failed to add test")
       }
     },
-    [lot, createTestResultMutation]
+    [lot, createTestResult]
   )
 
   // Handle deleting an ad-hoc test
   const handleDeleteResult = useCallback(
     async (id: number) => {
       try {
-        await deleteTestResultMutation.mutateAsync(id)
+        await deleteTestResult(id)
         toast.success("Test removed")
       } catch (error) {
         toast.error("Failed to remove test")
       }
     },
-    [deleteTestResultMutation]
+    [deleteTestResult]
   )
 
   // Dropzone handler using react-dropzone
@@ -637,13 +650,6 @@ export function SampleModal({
 
   // Handle submit for review (moves from under_review to awaiting_release)
   const handleSubmitForReview = useCallback(async () => {
-    console.log("Submit for review clicked", {
-      lotId: lot?.id,
-      status: currentStatus,
-      labInfoLoaded: !!labInfo,
-      requirePdf: labInfo?.require_pdf_for_submission,
-      attachedPdfsCount: attachedPdfs.length,
-    })
     if (!lot) {
       console.error("No lot available")
       return
@@ -652,7 +658,6 @@ export function SampleModal({
     // Check if PDF is required and none attached
     // Use explicit check that labInfo is loaded and require_pdf is true
     if (labInfo && labInfo.require_pdf_for_submission && attachedPdfs.length === 0) {
-      console.log("Showing override modal - PDF required but none attached")
       // Show override modal
       setShowOverrideModal(true)
       setOverrideUsername("")
@@ -662,9 +667,8 @@ export function SampleModal({
     }
 
     // No PDF required or PDFs are attached - submit directly
-    console.log("Proceeding with submission")
     await performSubmission()
-  }, [lot, currentStatus, labInfo, attachedPdfs.length, performSubmission])
+  }, [lot, labInfo, attachedPdfs.length, performSubmission])
 
   // Handle override verification and submission
   const handleOverrideSubmit = useCallback(async () => {
@@ -1,4 +1,4 @@
-import React, { useMemo, useState, useCallback } from "react"
+import React, { memo, useMemo, useState, useCallback } from "react"
 import {
   useReactTable,
   getCoreRowModel,
@@ -69,7 +69,7 @@ function getAgeDays(dateString: string): number {
 
 const columnHelper = createColumnHelper<Lot>()
 
-export function SampleTable({
+export const SampleTable = memo(function SampleTable({
   lots,
   onRowClick,
   onRetestSubRowClick,
@@ -479,7 +479,7 @@ export function SampleTable({
       </div>
     </div>
   )
-}
+})
 
 /**
  * Sortable column header component
@@ -11,16 +11,21 @@ import { useProductTestSpecs } from "@/hooks/useProducts"
 
 interface TestSpecsTooltipProps {
   productId: number
+  /** Total spec count from the list response; 0 skips the fetch entirely */
+  specCount?: number
   onClick: () => void
 }
 
 const MAX_VISIBLE_TESTS = 5
 
-export function TestSpecsTooltip({ productId, onClick }: TestSpecsTooltipProps) {
+export function TestSpecsTooltip({ productId, specCount, onClick }: TestSpecsTooltipProps) {
   const [isOpen, setIsOpen] = useState(false)
+  const hasNoSpecs = specCount === 0
 
-  // Only fetch when tooltip is open
-  const { data: testSpecs, isLoading } = useProductTestSpecs(isOpen ? productId : 0)
+  // Only fetch when tooltip is open and the product is known to have specs
+  const { data: testSpecs, isLoading } = useProductTestSpecs(
+    isOpen && !hasNoSpecs ? productId : 0
+  )
 
   const visibleTests = testSpecs?.slice(0, MAX_VISIBLE_TESTS) ?? []
   const remainingCount = (testSpecs?.length ?? 0) - MAX_VISIBLE_TESTS
@@ -40,7 +45,9 @@ export function TestSpecsTooltip({ productId, onClick }: TestSpecsTooltipProps)
         </TooltipTrigger>
         <TooltipContent side="left" className="max-w-[250px] p-0">
           <div className="px-3 py-2">
-            {isLoading ? (
+            {hasNoSpecs ? (
+              <p className="text-xs text-slate-500 italic">No tests configured</p>
+            ) : isLoading ? (
               <div className="flex items-center gap-2 text-slate-500">
                 <Loader2 className="h-3 w-3 animate-spin" />
                 <span className="text-xs">Loading...</span>
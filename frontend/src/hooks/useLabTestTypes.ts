@@ -18,10 +18,11 @@ export const labTestTypeKeys = {
   categories: () => [...labTestTypeKeys.all, "categories"] as const,
 }
 
-export function useLabTestTypes(filters: LabTestTypeFilters = {}) {
+export function useLabTestTypes(filters: LabTestTypeFilters = {}, enabled: boolean = true) {
   return useQuery({
     queryKey: labTestTypeKeys.list(filters),
     queryFn: () => labTestTypesApi.list(filters),
+    enabled,
   })
 }
 
@@ -61,9 +62,11 @@ export function useUpdateLabTestType() {
   return useMutation({
     mutationFn: ({ id, data }: { id: number; data: UpdateLabTestTypeData }) =>
       labTestTypesApi.update(id, data),
-    onSuccess: (_, variables) => {
+    onSuccess: (updated, variables) => {
       queryClient.invalidateQueries({ queryKey: labTestTypeKeys.lists() })
-      queryClient.invalidateQueries({ queryKey: labTestTypeKeys.detail(variables.id) })
+      // The PATCH response is the saved row; seed the detail cache with it
+      // instead of refetching
+      queryClient.setQueryData(labTestTypeKeys.detail(variables.id), updated)
       queryClient.invalidateQueries({ queryKey: labTestTypeKeys.categories() })
     },
     onError: (error: unknown) => {
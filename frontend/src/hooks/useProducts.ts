@@ -213,6 +213,8 @@ export function useCreateTestSpec() {
     onSuccess: (_, variables) => {
       queryClient.invalidateQueries({ queryKey: productKeys.testSpecs(variables.productId) })
       queryClient.invalidateQueries({ queryKey: productKeys.detail(variables.productId) })
+      // Product list rows carry spec counts used by the specs tooltip
+      queryClient.invalidateQueries({ queryKey: productKeys.lists() })
     },
   })
 }
@@ -229,6 +231,8 @@ export function useUpdateTestSpec() {
     onSuccess: (_, variables) => {
       queryClient.invalidateQueries({ queryKey: productKeys.testSpecs(variables.productId) })
       queryClient.invalidateQueries({ queryKey: productKeys.detail(variables.productId) })
+      // Product list rows carry spec counts used by the specs tooltip
+      queryClient.invalidateQueries({ queryKey: productKeys.lists() })
     },
   })
 }
@@ -245,6 +249,8 @@ export function useDeleteTestSpec() {
     onSuccess: (_, variables) => {
       queryClient.invalidateQueries({ queryKey: productKeys.testSpecs(variables.productId) })
       queryClient.invalidateQueries({ queryKey: productKeys.detail(variables.productId) })
+      // Product list rows carry spec counts used by the specs tooltip
+      queryClient.invalidateQueries({ queryKey: productKeys.lists() })
     },
   })
 }
@@ -7,6 +7,18 @@ import { nanoid } from "nanoid"
  * @param filename - Output filename (without extension)
  */
 export function exportTemplate(headers: string[], filename: string): void {
+  // Download file
+  XLSX.writeFile(getTemplateWorkbook(headers), `${filename}.xlsx`)
+}
+
+// Template workbooks depend only on their headers, so build each one once
+const templateWorkbooks = new Map<string, XLSX.WorkBook>()
+
+function getTemplateWorkbook(headers: string[]): XLSX.WorkBook {
+  const key = headers.join("\u0000")
+  const cached = templateWorkbooks.get(key)
+  if (cached) return cached
+
   // Create worksheet with headers
   const worksheet = XLSX.utils.aoa_to_sheet([headers])
 
@@ -20,8 +32,8 @@ export function exportTemplate(headers: string[], filename: string): void {
   const workbook = XLSX.utils.book_new()
   XLSX.utils.book_append_sheet(workbook, worksheet, "Template")
 
-  // Download file
-  XLSX.writeFile(workbook, `${filename}.xlsx`)
+  templateWorkbooks.set(key, workbook)
+  return workbook
 }
 
 /**
@@ -42,7 +54,7 @@ export async function parseExcelFile<T extends Record<string, any>>(
     reader.onload = (e) => {
       try {
         const data = e.target?.result
-        const workbook = XLSX.read(data, { type: "binary" })
+        const workbook = XLSX.read(data, { type: "array" })
 
         // Get first worksheet
         const worksheetName = workbook.SheetNames[0]
@@ -51,6 +63,13 @@ export async function parseExcelFile<T extends Record<string, any>>(
         // Convert to JSON (array of objects with header keys)
         const rawRows = XLSX.utils.sheet_to_json<Record<string, any>>(worksheet)
 
+        // Resolve column mapping and numeric columns once, not per cell
+        const columns = Object.entries(columnMapping).map(([excelCol, rowKey]) => ({
+          excelCol,
+          rowKey,
+          isNumber: typeof defaultValues?.[rowKey] === "number",
+        }))
+
         // Map to typed row objects
         const mappedRows = rawRows.map((rawRow) => {
           const row: any = {
@@ -58,21 +77,20 @@ export async function parseExcelFile<T extends Record<string, any>>(
             ...defaultValues,
           }
 
-          // Map each column according to columnMapping
-          Object.entries(columnMapping).forEach(([excelCol, rowKey]) => {
+          for (const { excelCol, rowKey, isNumber } of columns) {
             const value = rawRow[excelCol]
 
             // Handle different value types
             if (value !== undefined && value !== null) {
               // Convert numbers if needed
-              if (typeof row[rowKey] === "number") {
+              if (isNumber) {
                 row[rowKey] =
                   typeof value === "number" ? value : parseFloat(value) || 0
               } else {
                 row[rowKey] = String(value).trim()
               }
             }
-          })
+          }
 
           return row as T
         })
@@ -87,7 +105,7 @@ export async function parseExcelFile<T extends Record<string, any>>(
       reject(new Error("Failed to read file"))
     }
 
-    reader.readAsBinaryString(file)
+    reader.readAsArrayBuffer(file)
   })
 }
 
@@ -105,6 +123,11 @@ export function parseClipboardData<T extends Record<string, any>>(
 ): T[] {
   const lines = clipboardText.split("\n").filter((line) => line.trim())
 
+  // Numeric columns are known from the defaults; decide once per column
+  const numericColumns = columnOrder.map(
+    (key) => typeof defaultValues?.[key] === "number"
+  )
+
   return lines.map((line) => {
     const cells = line.split("\t")
     const row: any = {
@@ -116,8 +139,8 @@ export function parseClipboardData<T extends Record<string, any>>(
       const value = cells[index]?.trim()
       if (value) {
         // Try to parse as number if field expects number
-        if (typeof defaultValues?.[key] === "number") {
-          row[key] = parseFloat(value) || defaultValues[key]
+        if (numericColumns[index]) {
+          row[key] = parseFloat(value) || defaultValues?.[key]
         } else {
           row[key] = value
         }
@@ -193,36 +193,49 @@ export const POSITIVE_NEGATIVE_OPTIONS = [
   { value: 'ND', label: 'ND (Not Detected)' },
 ] as const
 
-/**
- * Get autocomplete options for a negative/positive spec with pass/fail hints.
- * Consolidated to reduce redundant options while still accepting all valid values.
- */
-export function getAutocompleteOptions(specification: string): Array<{
+type AutocompleteOption = {
   value: string
   label: string
   passes: boolean
-}> {
+}
+
+/**
+ * Autocomplete options for specs starting with "Negative".
+ * Consolidated: show common options, but validation still accepts ND, BDL, etc.
+ */
+const NEGATIVE_SPEC_OPTIONS: AutocompleteOption[] = [
+  { value: 'Negative', label: 'Negative', passes: true },
+  { value: 'Not Detected', label: 'Not Detected', passes: true },
+  { value: 'Positive', label: 'Positive', passes: false },
+  { value: 'Detected', label: 'Detected', passes: false },
+]
+
+/**
+ * Autocomplete options for specs starting with "Positive".
+ */
+const POSITIVE_SPEC_OPTIONS: AutocompleteOption[] = [
+  { value: 'Positive', label: 'Positive', passes: true },
+  { value: 'Detected', label: 'Detected', passes: true },
+  { value: 'Negative', label: 'Negative', passes: false },
+  { value: 'Not Detected', label: 'Not Detected', passes: false },
+]
+
+const NO_OPTIONS: AutocompleteOption[] = []
+
+/**
+ * Get autocomplete options for a negative/positive spec with pass/fail hints.
+ * Returns shared module-level lists; callers must not mutate them.
+ */
+export function getAutocompleteOptions(specification: string): AutocompleteOption[] {
   if (isNegativeSpec(specification)) {
-    // Consolidated: Show common options, but validation still accepts ND, BDL, etc.
-    return [
-      { value: 'Negative', label: 'Negative', passes: true },
-      { value: 'Not Detected', label: 'Not Detected', passes: true },
-      { value: 'Positive', label: 'Positive', passes: false },
-      { value: 'Detected', label: 'Detected', passes: false },
-    ]
+    return NEGATIVE_SPEC_OPTIONS
   }
 
   if (isPositiveSpec(specification)) {
-    // Consolidated: Show common options
-    return [
-      { value: 'Positive', label: 'Positive', passes: true },
-      { value: 'Detected', label: 'Detected', passes: true },
-      { value: 'Negative', label: 'Negative', passes: false },
-      { value: 'Not Detected', label: 'Not Detected', passes: false },
-    ]
+    return POSITIVE_SPEC_OPTIONS
   }
 
-  return []
+  return NO_OPTIONS
 }
 
 /**
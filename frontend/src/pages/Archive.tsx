@@ -31,10 +31,84 @@ import {
 } from "@/components/ui/dialog"
 import { useArchive, useCustomers, useSendEmail, useDownloadWithTracking } from "@/hooks/useRelease"
 import { useProducts } from "@/hooks/useProducts"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
 import { Badge } from "@/components/ui/badge"
 import { formatDate } from "@/lib/date-utils"
 import type { ArchiveFilters, ArchiveItem } from "@/types/release"
 
+type EmailTarget = { lotId: number; productId: number }
+
+/**
+ * Re-send dialog keeps its own recipient state so typing in it re-renders
+ * only the dialog, not the archive table behind it.
+ */
+function ResendEmailDialog({
+  target,
+  onClose,
+}: {
+  target: EmailTarget | null
+  onClose: () => void
+}) {
+  const [emailRecipient, setEmailRecipient] = useState("")
+  const sendEmail = useSendEmail()
+
+  const handleOpenChange = (open: boolean) => {
+    if (!open) {
+      setEmailRecipient("")
+      onClose()
+    }
+  }
+
+  const handleSendEmail = async () => {
+    if (!target || !emailRecipient.trim()) return
+
+    try {
+      await sendEmail.mutateAsync({
+        lotId: target.lotId,
+        productId: target.productId,
+        recipientEmail: emailRecipient.trim(),
+      })
+      handleOpenChange(false)
+    } catch (error) {
+      console.error("Failed to send email:", error)
+    }
+  }
+
+  return (
+    <Dialog open={target !== null} onOpenChange={handleOpenChange}>
+      <DialogContent className="sm:max-w-[400px]">
+        <DialogHeader>
+          <DialogTitle>Re-send COA via Email</DialogTitle>
+        </DialogHeader>
+        <div className="py-4">
+          <Label htmlFor="emailRecipient">Recipient Email</Label>
+          <Input
+            id="emailRecipient"
+            type="email"
+            value={emailRecipient}
+            onChange={(e) => setEmailRecipient(e.target.value)}
+            placeholder="Enter recipient email"
+            className="mt-2"
+            autoFocus
+          />
+        </div>
+        <DialogFooter>
+          <Button variant="outline" onClick={() => handleOpenChange(false)}>
+            Cancel
+          </Button>
+          <Button
+            onClick={handleSendEmail}
+            disabled={!emailRecipient.trim() || sendEmail.isPending}
+          >
+            {sendEmail.isPending && <Loader2 className="h-4 w-4 animate-spin" />}
+            Send Email
+          </Button>
+        </DialogFooter>
+      </DialogContent>
+    </Dialog>
+  )
+}
+
 export function ArchivePage() {
   const [search, setSearch] = useState("")
   const [productId, setProductId] = useState<number | undefined>()
@@ -48,33 +122,33 @@ export function ArchivePage() {
   const [sortBy, setSortBy] = useState<ArchiveFilters['sort_by']>('released_at')
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc')
 
-  // Email dialog state
-  const [emailDialogOpen, setEmailDialogOpen] = useState(false)
-  const [emailTarget, setEmailTarget] = useState<{ lotId: number; productId: number } | null>(null)
-  const [emailRecipient, setEmailRecipient] = useState("")
+  // Email dialog target (dialog is open while set)
+  const [emailTarget, setEmailTarget] = useState<EmailTarget | null>(null)
 
+  // Text inputs query once typing pauses, not on every keystroke
+  const debouncedSearch = useDebouncedValue(search)
+  const debouncedLotNumber = useDebouncedValue(lotNumber)
 
   // Build filters object
   const filters: ArchiveFilters = useMemo(
     () => ({
-      search: search || undefined,
+      search: debouncedSearch || undefined,
       product_id: productId,
       customer_id: customerId,
       date_from: dateFrom || undefined,
       date_to: dateTo || undefined,
-      lot_number: lotNumber || undefined,
+      lot_number: debouncedLotNumber || undefined,
       page,
       page_size: pageSize,
       sort_by: sortBy,
       sort_order: sortOrder,
     }),
-    [search, productId, customerId, dateFrom, dateTo, lotNumber, page, pageSize, sortBy, sortOrder]
+    [debouncedSearch, productId, customerId, dateFrom, dateTo, debouncedLotNumber, page, pageSize, sortBy, sortOrder]
   )
 
   const { data: archiveData, isLoading } = useArchive(filters)
   const { data: productsData } = useProducts({ page_size: 500 })
   const { data: customers = [] } = useCustomers()
-  const sendEmail = useSendEmail()
   const { handleDownload, isDownloading } = useDownloadWithTracking()
 
   const hasActiveFilters = productId || customerId || dateFrom || dateTo || lotNumber
@@ -122,25 +196,6 @@ export function ArchivePage() {
 
   const handleResendEmail = (item: ArchiveItem) => {
     setEmailTarget({ lotId: item.lot_id, productId: item.product_id })
-    setEmailRecipient("")
-    setEmailDialogOpen(true)
-  }
-
-  const handleSendEmail = async () => {
-    if (!emailTarget || !emailRecipient.trim()) return
-
-    try {
-      await sendEmail.mutateAsync({
-        lotId: emailTarget.lotId,
-        productId: emailTarget.productId,
-        recipientEmail: emailRecipient.trim(),
-      })
-      setEmailDialogOpen(false)
-      setEmailTarget(null)
-      setEmailRecipient("")
-    } catch (error) {
-      console.error("Failed to send email:", error)
-    }
   }
 
   return (
@@ -425,37 +480,7 @@ export function ArchivePage() {
       </div>
 
       {/* Email Dialog */}
-      <Dialog open={emailDialogOpen} onOpenChange={setEmailDialogOpen}>
-        <DialogContent className="sm:max-w-[400px]">
-          <DialogHeader>
-            <DialogTitle>Re-send COA via Email</DialogTitle>
-          </DialogHeader>
-          <div className="py-4">
-            <Label htmlFor="emailRecipient">Recipient Email</Label>
-            <Input
-              id="emailRecipient"
-              type="email"
-              value={emailRecipient}
-              onChange={(e) => setEmailRecipient(e.target.value)}
-              placeholder="Enter recipient email"
-              className="mt-2"
-              autoFocus
-            />
-          </div>
-          <DialogFooter>
-            <Button variant="outline" onClick={() => setEmailDialogOpen(false)}>
-              Cancel
-            </Button>
-            <Button
-              onClick={handleSendEmail}
-              disabled={!emailRecipient.trim() || sendEmail.isPending}
-            >
-              {sendEmail.isPending && <Loader2 className="h-4 w-4 animate-spin" />}
-              Send Email
-            </Button>
-          </DialogFooter>
-        </DialogContent>
-      </Dialog>
+      <ResendEmailDialog target={emailTarget} onClose={() => setEmailTarget(null)} />
       </motion.div>
     </div>
   )
@@ -45,6 +45,7 @@ import { productsApi } from "@/api/products"
 import { labTestTypesApi } from "@/api/labTestTypes"
 import { customersApi } from "@/api/customers"
 import { useArchivedLots } from "@/hooks/useLots"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
 import type { Product, LabTestType, Customer, ArchivedLot } from "@/types"
 
 type ArchivedTab = "samples" | "products" | "lab-tests" | "customers"
@@ -67,32 +68,35 @@ export function ArchivedItemsPage() {
   const pendingDigitRef = useRef<string | null>(null)
   const pendingTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
 
+  // Query once typing pauses, not on every keystroke
+  const debouncedSearch = useDebouncedValue(search)
+
   // Samples (completed lots) query - only fetch when samples tab is active
   const samplesQuery = useArchivedLots(
     activeTab === "samples"
-      ? { page, page_size: pageSize, search: search || undefined }
+      ? { page, page_size: pageSize, search: debouncedSearch || undefined }
       : { page: 1, page_size: 1 }, // Minimal query when not active
     activeTab === "samples"
   )
 
   // Products query
   const productsQuery = useQuery({
-    queryKey: ["archivedProducts", page, pageSize, search],
-    queryFn: () => productsApi.listArchived({ page, page_size: pageSize, search: search || undefined }),
+    queryKey: ["archivedProducts", page, pageSize, debouncedSearch],
+    queryFn: () => productsApi.listArchived({ page, page_size: pageSize, search: debouncedSearch || undefined }),
     enabled: activeTab === "products",
   })
 
   // Lab test types query
   const labTestsQuery = useQuery({
-    queryKey: ["archivedLabTests", page, pageSize, search],
-    queryFn: () => labTestTypesApi.listArchived({ page, page_size: pageSize, search: search || undefined }),
+    queryKey: ["archivedLabTests", page, pageSize, debouncedSearch],
+    queryFn: () => labTestTypesApi.listArchived({ page, page_size: pageSize, search: debouncedSearch || undefined }),
     enabled: activeTab === "lab-tests",
   })
 
   // Customers query
   const customersQuery = useQuery({
-    queryKey: ["archivedCustomers", page, pageSize, search],
-    queryFn: () => customersApi.listArchived({ page, page_size: pageSize, search: search || undefined }),
+    queryKey: ["archivedCustomers", page, pageSize, debouncedSearch],
+    queryFn: () => customersApi.listArchived({ page, page_size: pageSize, search: debouncedSearch || undefined }),
     enabled: activeTab === "customers",
   })
 
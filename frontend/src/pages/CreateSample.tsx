@@ -159,6 +159,11 @@ export function CreateSamplePage() {
   }
 
   const { data: productsData, isLoading: isProductsLoading } = useProducts({ page_size: 500 })
+  // Id lookup for composite rows instead of scanning the product list per row
+  const productsById = useMemo(
+    () => new Map((productsData?.items ?? []).map((p) => [p.id, p])),
+    [productsData]
+  )
   const createMutation = useCreateLot()
   const createSublotsMutation = useCreateSublotsBulk()
   const {
@@ -214,7 +219,7 @@ export function CreateSamplePage() {
 
         // Find shortest expiry duration among selected products
         const minExpiry = validProducts.reduce((min, cp) => {
-          const product = productsData.items.find(p => p.id === cp.product_id)
+          const product = cp.product_id !== null ? productsById.get(cp.product_id) : undefined
           return product ? Math.min(min, product.expiry_duration_months) : min
         }, Infinity)
 
@@ -239,7 +244,7 @@ export function CreateSamplePage() {
       const expiryMonths = selectedProducts[0].product.expiry_duration_months
       setValue("exp_date", calculateExpiryDate(watchedMfgDate, expiryMonths, expiryNudgeDays))
     }
-  }, [watchedMfgDate, selectedProducts, compositeProducts, watchedLotType, productsData, setValue, calculateExpiryDate, expiryNudgeDays])
+  }, [watchedMfgDate, selectedProducts, compositeProducts, watchedLotType, productsData, productsById, setValue, calculateExpiryDate, expiryNudgeDays])
 
   const daaneTestSelectionOptions = useMemo<DaaneTestSelectionOption[]>(() => {
     if (!successLotWithSpecs?.products?.length) return []
@@ -287,7 +292,6 @@ export function CreateSamplePage() {
   ])
 
   const onSubmit = async (formData: SampleForm) => {
-    console.log('=== onSubmit called ===', formData)
     try {
       if (formData.lot_type === "parent_lot") {
         // Validate product selection
@@ -380,7 +384,7 @@ export function CreateSamplePage() {
 
         // Calculate exp_date using shortest expiry among products
         const minExpiry = validProducts.reduce((min, cp) => {
-          const product = productsData?.items.find(p => p.id === cp.product_id)
+          const product = cp.product_id !== null ? productsById.get(cp.product_id) : undefined
           return product ? Math.min(min, product.expiry_duration_months) : min
         }, Infinity)
         const calculatedExpDate = minExpiry !== Infinity
@@ -432,9 +436,7 @@ export function CreateSamplePage() {
             percentage: sp.percentage,
           })),
         }
-        console.log('=== STANDARD lot payload ===', JSON.stringify(payload, null, 2))
         const standardLot = await createMutation.mutateAsync(payload)
-        console.log('=== Mutation succeeded ===')
 
         // Show success dialog
         const stdProduct = selectedProducts[0]?.product
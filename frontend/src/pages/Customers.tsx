@@ -34,6 +34,7 @@ import {
   useDeactivateCustomer,
   useActivateCustomer,
 } from "@/hooks/useCustomers"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
 import type { Customer } from "@/types"
 
 const customerSchema = z.object({
@@ -51,10 +52,13 @@ export function CustomersPage() {
   const [isDialogOpen, setIsDialogOpen] = useState(false)
   const [editingCustomer, setEditingCustomer] = useState<Customer | null>(null)
 
+  // Query once typing pauses, not on every keystroke
+  const debouncedSearch = useDebouncedValue(search)
+
   const { data, isLoading } = useCustomers({
     page,
     page_size: 50,
-    search: search || undefined,
+    search: debouncedSearch || undefined,
     include_inactive: includeInactive,
   })
 
@@ -1,4 +1,4 @@
-import { useState, useMemo } from "react"
+import { memo, useCallback, useState, useMemo } from "react"
 import { motion } from "framer-motion"
 import { useForm } from "react-hook-form"
 import { zodResolver } from "@hookform/resolvers/zod"
@@ -39,6 +39,7 @@ import {
   useUpdateLabTestType,
   useDeleteLabTestType,
 } from "@/hooks/useLabTestTypes"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
 import type { LabTestType } from "@/types"
 import type { CreateLabTestTypeData } from "@/api/labTestTypes"
 
@@ -66,6 +67,75 @@ type LabTestTypeForm = z.infer<typeof labTestTypeSchema>
 type SortField = "test_name" | "test_category"
 type SortDirection = "asc" | "desc"
 
+const CATEGORY_COLORS: Record<string, string> = {
+  "Microbiological": "bg-emerald-100 text-emerald-700",
+  "Heavy Metals": "bg-red-100 text-red-700",
+  "Pesticides": "bg-orange-100 text-orange-700",
+  "Nutritional": "bg-blue-100 text-blue-700",
+  "Physical": "bg-violet-100 text-violet-700",
+  "Chemical": "bg-amber-100 text-amber-700",
+  "Allergens": "bg-pink-100 text-pink-700",
+  "Organoleptic": "bg-teal-100 text-teal-700",
+}
+
+function getCategoryColor(category: string) {
+  return CATEGORY_COLORS[category] || "bg-slate-100 text-slate-600"
+}
+
+const LabTestTypeRow = memo(function LabTestTypeRow({
+  testType,
+  onEdit,
+  onDelete,
+  deleteDisabled,
+}: {
+  testType: LabTestType
+  onEdit: (testType: LabTestType) => void
+  onDelete: (id: number) => void
+  deleteDisabled: boolean
+}) {
+  return (
+    <TableRow className="hover:bg-slate-50/50 transition-colors">
+      <TableCell>
+        <div>
+          <span className="font-semibold text-slate-900 text-[14px]">{testType.test_name}</span>
+        </div>
+        {testType.description && (
+          <p className="text-[12px] text-slate-500 truncate max-w-xs mt-0.5">{testType.description}</p>
+        )}
+      </TableCell>
+      <TableCell>
+        <span className={`inline-flex items-center rounded-full px-2.5 py-1 text-[11px] font-semibold tracking-wide ${getCategoryColor(testType.test_category)}`}>
+          {testType.test_category}
+        </span>
+      </TableCell>
+      <TableCell className="text-slate-500 text-[14px]">{testType.test_method || "-"}</TableCell>
+      <TableCell className="text-slate-500 text-[14px]">{testType.default_unit || "-"}</TableCell>
+      <TableCell className="text-slate-500 text-[13px]">{testType.default_specification || "-"}</TableCell>
+      <TableCell>
+        <div className="flex items-center gap-0.5">
+          <Button
+            variant="ghost"
+            size="sm"
+            onClick={() => onEdit(testType)}
+            className="h-8 w-8 p-0 text-slate-400 hover:text-slate-600 hover:bg-slate-100 rounded-lg transition-colors"
+          >
+            <Pencil className="h-4 w-4" />
+          </Button>
+          <Button
+            variant="ghost"
+            size="sm"
+            onClick={() => onDelete(testType.id)}
+            disabled={deleteDisabled}
+            className="h-8 w-8 p-0 text-slate-400 hover:text-red-600 hover:bg-red-50 rounded-lg transition-colors"
+          >
+            <Trash2 className="h-4 w-4" />
+          </Button>
+        </div>
+      </TableCell>
+    </TableRow>
+  )
+})
+
 export function LabTestTypesPage() {
   const [page, setPage] = useState(1)
   const [search, setSearch] = useState("")
@@ -78,10 +148,12 @@ export function LabTestTypesPage() {
   const [sortField, setSortField] = useState<SortField | null>(null)
   const [sortDirection, setSortDirection] = useState<SortDirection>("asc")
 
+  const debouncedSearch = useDebouncedValue(search)
+
   const { data, isLoading } = useLabTestTypes({
     page,
     page_size: 50,
-    search: search || undefined,
+    search: debouncedSearch || undefined,
     category: categoryFilter || undefined,
   })
   const { data: categories } = useLabTestTypeCategories()
@@ -146,7 +218,8 @@ export function LabTestTypesPage() {
     setIsDialogOpen(true)
   }
 
-  const openEditDialog = (testType: LabTestType) => {
+  // Stable handlers let memoized rows skip re-rendering while the dialog form changes
+  const openEditDialog = useCallback((testType: LabTestType) => {
     setEditingType(testType)
     setIsAddingCategory(false)
     reset({
@@ -158,7 +231,7 @@ export function LabTestTypesPage() {
       default_specification: testType.default_specification || "",
     })
     setIsDialogOpen(true)
-  }
+  }, [reset])
 
   const onSubmit = async (formData: LabTestTypeForm) => {
     const data: CreateLabTestTypeData = {
@@ -182,32 +255,19 @@ export function LabTestTypesPage() {
     }
   }
 
-  const handleDelete = async (id: number) => {
+  const { mutateAsync: deleteLabTestType } = deleteMutation
+  const handleDelete = useCallback(async (id: number) => {
     if (confirm("Are you sure you want to delete this lab test type?")) {
       try {
-        await deleteMutation.mutateAsync(id)
+        await deleteLabTestType(id)
       } catch {
         // Error might indicate test type is in use
       }
     }
-  }
+  }, [deleteLabTestType])
 
   const isMutating = createMutation.isPending || updateMutation.isPending
 
-  const getCategoryColor = (category: string) => {
-    const colors: Record<string, string> = {
-      "Microbiological": "bg-emerald-100 text-emerald-700",
-      "Heavy Metals": "bg-red-100 text-red-700",
-      "Pesticides": "bg-orange-100 text-orange-700",
-      "Nutritional": "bg-blue-100 text-blue-700",
-      "Physical": "bg-violet-100 text-violet-700",
-      "Chemical": "bg-amber-100 text-amber-700",
-      "Allergens": "bg-pink-100 text-pink-700",
-      "Organoleptic": "bg-teal-100 text-teal-700",
-    }
-    return colors[category] || "bg-slate-100 text-slate-600"
-  }
-
   // Sortable header component
   const SortableHeader = ({ field, children }: { field: SortField; children: React.ReactNode }) => (
     <TableHead
@@ -348,45 +408,13 @@ export function LabTestTypesPage() {
                 </TableHeader>
                 <TableBody>
                   {sortedItems?.map((testType) => (
-                    <TableRow key={testType.id} className="hover:bg-slate-50/50 transition-colors">
-                      <TableCell>
-                        <div>
-                          <span className="font-semibold text-slate-900 text-[14px]">{testType.test_name}</span>
-                        </div>
-                        {testType.description && (
-                          <p className="text-[12px] text-slate-500 truncate max-w-xs mt-0.5">{testType.description}</p>
-                        )}
-                      </TableCell>
-                      <TableCell>
-                        <span className={`inline-flex items-center rounded-full px-2.5 py-1 text-[11px] font-semibold tracking-wide ${getCategoryColor(testType.test_category)}`}>
-                          {testType.test_category}
-                        </span>
-                      </TableCell>
-                      <TableCell className="text-slate-500 text-[14px]">{testType.test_method || "-"}</TableCell>
-                      <TableCell className="text-slate-500 text-[14px]">{testType.default_unit || "-"}</TableCell>
-                      <TableCell className="text-slate-500 text-[13px]">{testType.default_specification || "-"}</TableCell>
-                      <TableCell>
-                        <div className="flex items-center gap-0.5">
-                          <Button
-                            variant="ghost"
-                            size="sm"
-                            onClick={() => openEditDialog(testType)}
-                            className="h-8 w-8 p-0 text-slate-400 hover:text-slate-600 hover:bg-slate-100 rounded-lg transition-colors"
-                          >
-                            <Pencil className="h-4 w-4" />
-                          </Button>
-                          <Button
-                            variant="ghost"
-                            size="sm"
-                            onClick={() => handleDelete(testType.id)}
-                            disabled={deleteMutation.isPending}
-                            className="h-8 w-8 p-0 text-slate-400 hover:text-red-600 hover:bg-red-50 rounded-lg transition-colors"
-                          >
-                            <Trash2 className="h-4 w-4" />
-                          </Button>
-                        </div>
-                      </TableCell>
-                    </TableRow>
+                    <LabTestTypeRow
+                      key={testType.id}
+                      testType={testType}
+                      onEdit={openEditDialog}
+                      onDelete={handleDelete}
+                      deleteDisabled={deleteMutation.isPending}
+                    />
                   ))}
                 </TableBody>
               </Table>
@@ -1,4 +1,4 @@
-import { useState, useRef, useMemo, useCallback, useEffect } from "react"
+import { useState, useRef, useMemo, useCallback, useEffect, memo } from "react"
 import { useSearchParams } from "react-router-dom"
 import { motion } from "framer-motion"
 import { Plus, Pencil, Archive, Search, Loader2, Package, Check, X, Trash2 } from "lucide-react"
@@ -56,6 +56,7 @@ import { useAuthStore } from "@/store/auth"
 import { Label } from "@/components/ui/label"
 import { Textarea } from "@/components/ui/textarea"
 import { useLabTestTypes } from "@/hooks/useLabTestTypes"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
 import type { Product, ProductSize, ProductTestSpecification, LabTestType } from "@/types"
 
 // SizeChips component for inline size management
@@ -211,6 +212,12 @@ function SizeChips({ sizes, productId, onAddSize, onEditSize, onDeleteSize }: Si
   )
 }
 
+// Spec count from the list response, undefined when the server didn't send counts
+function getSpecCount(product: Product): number | undefined {
+  if (product.required_test_count == null) return undefined
+  return product.required_test_count + (product.optional_test_count ?? 0)
+}
+
 // Type for test spec table rows (existing specs + add row)
 interface TestSpecRow {
   id: number | 'new'
@@ -234,6 +241,85 @@ interface InlineEditValues {
   version: string
 }
 
+const ProductRow = memo(function ProductRow({
+  product,
+  isAdmin,
+  archiveDisabled,
+  onEdit,
+  onArchive,
+  onOpenSpecs,
+  onAddSize,
+  onEditSize,
+  onDeleteSize,
+}: {
+  product: Product
+  isAdmin: boolean
+  archiveDisabled: boolean
+  onEdit: (product: Product) => void
+  onArchive: (product: Product) => void
+  onOpenSpecs: (product: Product) => void
+  onAddSize: SizeChipsProps["onAddSize"]
+  onEditSize: SizeChipsProps["onEditSize"]
+  onDeleteSize: SizeChipsProps["onDeleteSize"]
+}) {
+  return (
+    <TableRow className="hover:bg-slate-50/50 transition-colors">
+      <TableCell className="font-semibold text-slate-900 text-[14px]">{product.brand}</TableCell>
+      <TableCell className="text-slate-700 text-[14px]">{product.product_name}</TableCell>
+      <TableCell className="text-slate-500 text-[14px]">{product.flavor || "-"}</TableCell>
+      <TableCell>
+        <SizeChips
+          sizes={product.sizes}
+          productId={product.id}
+          onAddSize={onAddSize}
+          onEditSize={onEditSize}
+          onDeleteSize={onDeleteSize}
+        />
+      </TableCell>
+      <TableCell className="text-slate-500 text-[14px]">
+        {product.serving_size || "-"}
+      </TableCell>
+      <TableCell className="text-slate-500 text-[14px]">
+        {product.expiry_duration_months} mo
+      </TableCell>
+      <TableCell className="text-slate-500 text-[14px]">
+        {product.version || "-"}
+      </TableCell>
+      <TableCell className="text-center">
+        <TestSpecsTooltip
+          productId={product.id}
+          specCount={getSpecCount(product)}
+          onClick={() => onOpenSpecs(product)}
+        />
+      </TableCell>
+      <TableCell>
+        <div className="flex items-center gap-0.5">
+          <Button
+            variant="ghost"
+            size="sm"
+            onClick={() => onEdit(product)}
+            className="h-8 w-8 p-0 text-slate-400 hover:text-slate-600 hover:bg-slate-100 rounded-lg transition-colors"
+          >
+            <Pencil className="h-4 w-4" />
+          </Button>
+          {isAdmin && (
+            <Button
+              variant="ghost"
+              size="sm"
+              onClick={() => onArchive(product)}
+              disabled={archiveDisabled}
+              className="h-8 w-8 p-0 text-slate-400 hover:text-amber-600 hover:bg-amber-50 rounded-lg transition-colors"
+              title="Archive product"
+            >
+              <Archive className="h-4 w-4" />
+            </Button>
+          )}
+        </div>
+      </TableCell>
+    </TableRow>
+  )
+})
+
 export function ProductsPage() {
   const [searchParams, setSearchParams] = useSearchParams()
   const [page, setPage] = useState(1)
@@ -281,7 +367,9 @@ export function ProductsPage() {
   const { user } = useAuthStore()
   const isAdmin = user?.role === "admin" || user?.role === "qc_manager"
 
-  const { data, isLoading } = useProducts({ page, page_size: 50, search: search || undefined })
+  // Query once typing pauses, not on every keystroke
+  const debouncedSearch = useDebouncedValue(search)
+  const { data, isLoading } = useProducts({ page, page_size: 50, search: debouncedSearch || undefined })
   const createMutation = useCreateProduct()
   const updateMutation = useUpdateProduct()
   const archiveMutation = useArchiveProduct()
@@ -291,16 +379,19 @@ export function ProductsPage() {
   const [archiveReason, setArchiveReason] = useState("")
 
   // Size mutation hooks
-  const createSizeMutation = useCreateSize()
-  const updateSizeMutation = useUpdateSize()
-  const deleteSizeMutation = useDeleteSize()
+  // Only the stable mutateAsync functions are needed, which keeps the size
+  // handlers (and the memoized product rows) stable across renders
+  const { mutateAsync: createSize } = useCreateSize()
+  const { mutateAsync: updateSize } = useUpdateSize()
+  const { mutateAsync: deleteSize } = useDeleteSize()
 
   // Test specs hooks
   const { data: testSpecs } = useProductTestSpecs(selectedProductForSpecs?.id ?? 0)
-  const { data: labTestTypes } = useLabTestTypes({ page_size: 500 })
+  // Lab test types only feed the specs dialog; skip the fetch until it opens
+  const { data: labTestTypes } = useLabTestTypes({ page_size: 500 }, isTestSpecsDialogOpen)
   const createTestSpecMutation = useCreateTestSpec()
-  const updateTestSpecMutation = useUpdateTestSpec()
-  const deleteTestSpecMutation = useDeleteTestSpec()
+  const { mutateAsync: updateTestSpec } = useUpdateTestSpec()
+  const { mutateAsync: deleteTestSpec, isPending: isDeletingTestSpec } = useDeleteTestSpec()
 
   // Handle ?addNew=true URL param (from Create Sample page)
   useEffect(() => {
@@ -318,7 +409,7 @@ export function ProductsPage() {
   }, [searchParams, setSearchParams, isLoading])
 
   // Inline editing handlers
-  const startEditing = (product: Product) => {
+  const startEditing = useCallback((product: Product) => {
     setEditingProductId(product.id)
     setEditValues({
       brand: product.brand,
@@ -329,7 +420,7 @@ export function ProductsPage() {
       version: product.version || "",
     })
     setEditErrors({})
-  }
+  }, [])
 
   const cancelEditing = () => {
     setEditingProductId(null)
@@ -485,10 +576,10 @@ export function ProductsPage() {
     // Tab is handled natively by browser
   }
 
-  const openArchiveDialog = (product: Product) => {
+  const openArchiveDialog = useCallback((product: Product) => {
     setArchiveDialogProduct(product)
     setArchiveReason("")
-  }
+  }, [])
 
   const handleArchive = async () => {
     if (!archiveDialogProduct || !archiveReason.trim()) return
@@ -506,20 +597,20 @@ export function ProductsPage() {
   }
 
   // Size management handlers
-  const handleAddSize = async (productId: number, size: string) => {
+  const handleAddSize = useCallback(async (productId: number, size: string) => {
     try {
-      await createSizeMutation.mutateAsync({
+      await createSize({
         productId,
         data: { size },
       })
     } catch (error) {
       console.error("Failed to add size:", error)
     }
-  }
+  }, [createSize])
 
-  const handleEditSize = async (productId: number, sizeId: number, newSize: string) => {
+  const handleEditSize = useCallback(async (productId: number, sizeId: number, newSize: string) => {
     try {
-      await updateSizeMutation.mutateAsync({
+      await updateSize({
         productId,
         sizeId,
         data: { size: newSize },
@@ -527,20 +618,20 @@ export function ProductsPage() {
     } catch (error) {
       console.error("Failed to update size:", error)
     }
-  }
+  }, [updateSize])
 
-  const handleDeleteSize = async (productId: number, sizeId: number) => {
+  const handleDeleteSize = useCallback(async (productId: number, sizeId: number) => {
     try {
-      await deleteSizeMutation.mutateAsync({
+      await deleteSize({
         productId,
         sizeId,
       })
     } catch (error) {
       console.error("Failed to delete size:", error)
     }
-  }
+  }, [deleteSize])
 
-  const openTestSpecsDialog = (product: Product) => {
+  const openTestSpecsDialog = useCallback((product: Product) => {
     setSelectedProductForSpecs(product)
     // Reset add row state
     setAddRowTestType(null)
@@ -548,7 +639,7 @@ export function ProductsPage() {
     setAddRowRequired(true)
     setEditingSpecCell(null)
     setIsTestSpecsDialogOpen(true)
-  }
+  }, [])
 
   // Handle ?editSpecs=<productId> URL param (from Create Sample spec preview)
   useEffect(() => {
@@ -620,24 +711,26 @@ export function ProductsPage() {
     }
   }, [selectedProductForSpecs, addRowTestType, addRowSpecification, addRowRequired, createTestSpecMutation])
 
-  const handleDeleteTestSpec = async (specId: number) => {
+  // Stable handlers so the spec table columns below are only rebuilt when
+  // the dialog's own state changes, not on every page render
+  const handleDeleteTestSpec = useCallback(async (specId: number) => {
     if (!selectedProductForSpecs) return
     if (confirm("Are you sure you want to remove this test specification?")) {
-      await deleteTestSpecMutation.mutateAsync({
+      await deleteTestSpec({
         productId: selectedProductForSpecs.id,
         specId,
       })
     }
-  }
+  }, [selectedProductForSpecs, deleteTestSpec])
 
-  const handleToggleRequired = async (spec: ProductTestSpecification) => {
+  const handleToggleRequired = useCallback(async (spec: ProductTestSpecification) => {
     if (!selectedProductForSpecs) return
-    await updateTestSpecMutation.mutateAsync({
+    await updateTestSpec({
       productId: selectedProductForSpecs.id,
       specId: spec.id,
       data: { is_required: !spec.is_required },
     })
-  }
+  }, [selectedProductForSpecs, updateTestSpec])
 
   // Build table data: existing specs only (add row rendered separately)
   const testSpecTableData = useMemo<TestSpecRow[]>(() => {
@@ -702,7 +795,7 @@ export function ProductsPage() {
               onBlur={async (e) => {
                 const newValue = e.target.value.trim()
                 if (newValue && newValue !== row.specification && selectedProductForSpecs) {
-                  await updateTestSpecMutation.mutateAsync({
+                  await updateTestSpec({
                     productId: selectedProductForSpecs.id,
                     specId: row.id as number,
                     data: { specification: newValue },
@@ -769,7 +862,7 @@ export function ProductsPage() {
         return (
           <button
             onClick={() => handleDeleteTestSpec(row.id as number)}
-            disabled={deleteTestSpecMutation.isPending}
+            disabled={isDeletingTestSpec}
             className="p-1.5 rounded-lg text-slate-400 hover:text-red-600 hover:bg-red-50 transition-colors"
             title="Delete test"
           >
@@ -781,7 +874,7 @@ export function ProductsPage() {
   ], [
     editingSpecCell, selectedProductForSpecs,
     handleToggleRequired, handleDeleteTestSpec,
-    updateTestSpecMutation, deleteTestSpecMutation
+    updateTestSpec, isDeletingTestSpec
   ])
 
   const testSpecTable = useReactTable({
@@ -929,6 +1022,7 @@ export function ProductsPage() {
                       <TableCell className="text-center">
                         <TestSpecsTooltip
                           productId={product.id}
+                          specCount={getSpecCount(product)}
                           onClick={() => openTestSpecsDialog(product)}
                         />
                       </TableCell>
@@ -964,59 +1058,18 @@ export function ProductsPage() {
 
                 // Normal display row
                 return (
-                  <TableRow key={product.id} className="hover:bg-slate-50/50 transition-colors">
-                    <TableCell className="font-semibold text-slate-900 text-[14px]">{product.brand}</TableCell>
-                    <TableCell className="text-slate-700 text-[14px]">{product.product_name}</TableCell>
-                    <TableCell className="text-slate-500 text-[14px]">{product.flavor || "-"}</TableCell>
-                    <TableCell>
-                      <SizeChips
-                        sizes={product.sizes}
-                        productId={product.id}
-                        onAddSize={handleAddSize}
-                        onEditSize={handleEditSize}
-                        onDeleteSize={handleDeleteSize}
-                      />
-                    </TableCell>
-                    <TableCell className="text-slate-500 text-[14px]">
-                      {product.serving_size || "-"}
-                    </TableCell>
-                    <TableCell className="text-slate-500 text-[14px]">
-                      {product.expiry_duration_months} mo
-                    </TableCell>
-                    <TableCell className="text-slate-500 text-[14px]">
-                      {product.version || "-"}
-                    </TableCell>
-                    <TableCell className="text-center">
-                      <TestSpecsTooltip
-                        productId={product.id}
-                        onClick={() => openTestSpecsDialog(product)}
-                      />
-                    </TableCell>
-                    <TableCell>
-                      <div className="flex items-center gap-0.5">
-                        <Button
-                          variant="ghost"
-                          size="sm"
-                          onClick={() => startEditing(product)}
-                          className="h-8 w-8 p-0 text-slate-400 hover:text-slate-600 hover:bg-slate-100 rounded-lg transition-colors"
-                        >
-                          <Pencil className="h-4 w-4" />
-                        </Button>
-                        {isAdmin && (
-                          <Button
-                            variant="ghost"
-                            size="sm"
-                            onClick={() => openArchiveDialog(product)}
-                            disabled={archiveMutation.isPending}
-                            className="h-8 w-8 p-0 text-slate-400 hover:text-amber-600 hover:bg-amber-50 rounded-lg transition-colors"
-                            title="Archive product"
-                          >
-                            <Archive className="h-4 w-4" />
-                          </Button>
-                        )}
-                      </div>
-                    </TableCell>
-                  </TableRow>
+                  <ProductRow
+                    key={product.id}
+                    product={product}
+                    isAdmin={isAdmin}
+                    archiveDisabled={archiveMutation.isPending}
+                    onEdit={startEditing}
+                    onArchive={openArchiveDialog}
+                    onOpenSpecs={openTestSpecsDialog}
+                    onAddSize={handleAddSize}
+                    onEditSize={handleEditSize}
+                    onDeleteSize={handleDeleteSize}
+                  />
                 )
               })}
 
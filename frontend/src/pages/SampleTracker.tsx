@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react"
+import { useState, useEffect, useCallback } from "react"
 import { useSearchParams } from "react-router-dom"
 import { ClipboardList, Loader2 } from "lucide-react"
 
@@ -28,25 +28,26 @@ export function SampleTrackerPage() {
   const [scrollToRetests, setScrollToRetests] = useState(false)
 
   // Fetch lots for kanban (active workflow statuses only)
-  // Exclude approved, released, awaiting_release, rejected - they appear in Release Queue/Archive
+  // Approved, released, awaiting_release, rejected appear in Release Queue/Archive instead
   const { data: lotsData, isLoading } = useLots({
     page_size: 100,
-    exclude_statuses: ["approved", "released", "awaiting_release", "rejected"],
+    statuses: ["awaiting_results", "partial_results", "needs_attention", "under_review"],
   })
 
   // Get stale thresholds from system settings
   const { settings: systemSettings } = useSystemSettings()
 
-  const handleCardClick = (lot: Lot) => {
+  // Stable so the memoized board and table skip re-rendering when only modal state changes
+  const handleCardClick = useCallback((lot: Lot) => {
     setSelectedLot(lot)
     setIsModalOpen(true)
-  }
+  }, [])
 
-  const handleRetestSubRowClick = (lot: Lot) => {
+  const handleRetestSubRowClick = useCallback((lot: Lot) => {
     setSelectedLot(lot)
     setScrollToRetests(true)
     setIsModalOpen(true)
-  }
+  }, [])
 
   const handleCloseModal = () => {
     setIsModalOpen(false)
@@ -53,19 +53,29 @@ export function SettingsPage() {
   // Tab state
   const [activeTab, setActiveTab] = useState<SettingsTab>("display")
 
-  // Local form state for system settings
+  // Lab info from backend
+  const {
+    labInfo,
+    updateMutation: updateLabInfoMutation,
+    uploadLogoMutation,
+    deleteLogoMutation,
+  } = useLabInfo()
+
+  // Local form state for system settings. Lab info fields start from the
+  // cached query data when present, so revisiting the page renders once
+  // instead of rendering defaults and then re-rendering from the sync effect
   const [staleWarningDays, setStaleWarningDays] = useState(systemSettings.settings.staleWarningDays)
   const [staleCriticalDays, setStaleCriticalDays] = useState(systemSettings.settings.staleCriticalDays)
   const [recentlyCompletedDays, setRecentlyCompletedDays] = useState(systemSettings.settings.recentlyCompletedDays)
-  const [companyName, setCompanyName] = useState(systemSettings.settings.labInfo.companyName)
-  const [address, setAddress] = useState(systemSettings.settings.labInfo.address)
-  const [phone, setPhone] = useState(systemSettings.settings.labInfo.phone)
-  const [email, setEmail] = useState(systemSettings.settings.labInfo.email)
-  const [city, setCity] = useState("")
-  const [state, setState] = useState("")
-  const [zipCode, setZipCode] = useState("")
-  const [requirePdfForSubmission, setRequirePdfForSubmission] = useState(true)
-  const [showSpecPreviewOnSample, setShowSpecPreviewOnSample] = useState(true)
+  const [companyName, setCompanyName] = useState(labInfo?.company_name ?? systemSettings.settings.labInfo.companyName)
+  const [address, setAddress] = useState(labInfo?.address ?? systemSettings.settings.labInfo.address)
+  const [phone, setPhone] = useState(labInfo?.phone ?? systemSettings.settings.labInfo.phone)
+  const [email, setEmail] = useState(labInfo?.email ?? systemSettings.settings.labInfo.email)
+  const [city, setCity] = useState(labInfo?.city ?? "")
+  const [state, setState] = useState(labInfo?.state ?? "")
+  const [zipCode, setZipCode] = useState(labInfo?.zip_code ?? "")
+  const [requirePdfForSubmission, setRequirePdfForSubmission] = useState(labInfo?.require_pdf_for_submission ?? true)
+  const [showSpecPreviewOnSample, setShowSpecPreviewOnSample] = useState(labInfo?.show_spec_preview_on_sample ?? true)
   const [labInfoDirty, setLabInfoDirty] = useState(false)
   const [labInfoAutoSaveSuccess, setLabInfoAutoSaveSuccess] = useState(false)
 
@@ -78,13 +88,6 @@ export function SettingsPage() {
     }
   }, [labInfoDirty])
 
-  // Lab info from backend
-  const {
-    labInfo,
-    updateMutation: updateLabInfoMutation,
-    uploadLogoMutation,
-    deleteLogoMutation,
-  } = useLabInfo()
   const logoInputRef = useRef<HTMLInputElement>(null)
 
   // Image cropper state for logo
@@ -65,6 +65,8 @@ export interface Product {
   archive_reason: string | null
   created_at: string
   updated_at: string | null
+  required_test_count?: number | null  // Set by the product list endpoint only
+  optional_test_count?: number | null  // Set by the product list endpoint only
 }
 
 // Product test specification